@@ -1,11 +1,47 @@
 # Λ-Möbius Core – FastAPI service
-from fastapi import FastAPI
-from pydantic import BaseModel
-from mobius_motor.core import motor_step
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Iterator, List
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from mobius_motor.core import motor_step, motor_step_batch
 from mobius_motor.optimize import lambda_optimize
 from mobius_motor.arbiter import phi_arbiter   # import corect, fără duplicat
+from mobius_motor.instrumentation import ARBITER_STATES, REGISTRY, observe_optimize
+from aios.offload import Offloader, Saturated, canonical_key
+from aios.cache import CachedResponse, ResponseCache
+from aios.serialization import BINARY_TYPES, FastJSONResponse, dumps, read_float64_columns
+from aios.instrumentation import MetricsMiddleware
+
+# optimizările rulează într-un pool de procese (nu blochează /step),
+# cu admission control și coalescing pentru cererile identice în curs
+OFFLOADER = Offloader()
+
+
+# răspunsurile /step și /optimize sunt funcții pure de input → cache LRU + ETag
+STEP_CACHE = ResponseCache(maxsize=4096)
+OPTIMIZE_CACHE = ResponseCache(maxsize=1024)
+
 
-app = FastAPI(title="Λ-Möbius Core API", version="0.1.0")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    OFFLOADER.shutdown(wait=False)
+
+
+app = FastAPI(
+    title="Λ-Möbius Core API", version="0.1.0", lifespan=_lifespan,
+    default_response_class=FastJSONResponse,
+)
+app.add_middleware(MetricsMiddleware)
+
+STATE_DESC = {1: "Λ-Wrap", 0: "Λ-Steady", -1: "Λ-Unwrap"}
+NDJSON = "application/x-ndjson"
 
 
 class StepInput(BaseModel):
@@ -25,33 +61,260 @@ class OptimizeInput(BaseModel):
     desired_state: int | None = None
 
 
-@app.post("/step")
-def api_step(inp: StepInput):
+class StepBatchInput(BaseModel):
+    # câte un element per evaluare; un singur element e extins (broadcast) la toate
+    k: List[float]
+    P: List[float]
+    U: List[float]
+    theta: List[float]
+    chunk_size: int = Field(4096, ge=1)
+
+
+class OptimizeBatchInput(BaseModel):
+    items: List[OptimizeInput]
+
+
+def _json_body(content) -> bytes:
+    # același encoder ca răspunsurile implicite ale aplicației → conținut identic
+    return FastJSONResponse(content).body
+
+
+def _cached_response(cached: CachedResponse) -> Response:
+    # doar ETag: /step și /optimize sunt POST, iar 304 e definit doar pentru
+    # GET / HEAD (RFC 9110 §15.4.5) → If-None-Match nu schimbă răspunsul
+    return Response(cached.body, media_type="application/json", headers={"ETag": cached.etag})
+
+
+def _step(inp: StepInput):
     val, st = motor_step(k=inp.k, P=inp.P, U=inp.U, theta=inp.theta)
-    state_desc = {1: "Λ-Wrap", 0: "Λ-Steady", -1: "Λ-Unwrap"}[st]
+    state_desc = STATE_DESC[st]
     return {
-        "params": inp.dict(),
+        "params": inp.model_dump(),
         "value": val,
         "state": st,
         "state_desc": state_desc,
     }
 
 
-@app.post("/optimize")
-def api_optimize(inp: OptimizeInput):
+@app.post("/step")
+def api_step(inp: StepInput):
+    key = canonical_key(inp)
+    cached = STEP_CACHE.get(key) or STEP_CACHE.put(key, _json_body(_step(inp)))
+    # după cache: și răspunsurile din cache sunt numărate (starea depinde doar de theta)
+    ARBITER_STATES.inc(state=phi_arbiter(inp.theta, 0.3, 0.7))   # pragurile implicite din motor_step
+    return _cached_response(cached)
+
+
+def _optimize_kwargs(inp: OptimizeInput) -> dict:
     if inp.mode == "value":
-        res = lambda_optimize(
+        return dict(
             initial_guess=(inp.k, inp.P, inp.U),
             theta=inp.theta,
             mode="value",
             target=inp.target,
             desired_state=inp.desired_state,
         )
-    else:
-        res = lambda_optimize(
-            initial_guess=(inp.k, inp.P, inp.U),
-            theta=inp.theta,
-            mode="state",
-            desired_state=inp.desired_state,
-        )
+    return dict(
+        initial_guess=(inp.k, inp.P, inp.U),
+        theta=inp.theta,
+        mode="state",
+        desired_state=inp.desired_state,
+    )
+
+
+def _optimize(inp: OptimizeInput):
+    return lambda_optimize(**_optimize_kwargs(inp))
+
+
+def _submit_optimize(inp: OptimizeInput) -> Awaitable[dict]:
+    # admiterea e decisă imediat (Saturated), rezultatul vine din pool
+    return OFFLOADER.submit(canonical_key(inp), lambda_optimize, **_optimize_kwargs(inp))
+
+
+def _observed(res: dict) -> dict:
+    if OFFLOADER.executor == "process":
+        observe_optimize(res)   # contoarele din procesul worker nu sunt vizibile aici
     return res
+
+
+def _too_many_requests(exc: Saturated) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "1"})
+
+
+@app.post("/optimize")
+async def api_optimize(inp: OptimizeInput):
+    key = canonical_key(inp)
+    cached = OPTIMIZE_CACHE.get(key)
+    if cached is None:
+        try:
+            pending = _submit_optimize(inp)
+        except Saturated as exc:
+            raise _too_many_requests(exc)
+        cached = OPTIMIZE_CACHE.put(key, _json_body(_observed(await pending)))
+    return _cached_response(cached)
+
+
+@app.get("/cache/stats")
+def api_cache_stats():
+    return {"step": STEP_CACHE.stats(), "optimize": OPTIMIZE_CACHE.stats(), "offload": OFFLOADER.stats()}
+
+
+def _cache_gauges(field: str):
+    return lambda: {(name,): cache.stats()[field] for name, cache in (("step", STEP_CACHE), ("optimize", OPTIMIZE_CACHE))}
+
+
+for _field in ("hits", "misses", "evictions", "size"):
+    REGISTRY.gauge_callback(f"aios_response_cache_{_field}", f"Response cache {_field}", ("cache",), _cache_gauges(_field))
+REGISTRY.gauge_callback(
+    "aios_offload", "Optimizer offload counters", ("stat",),
+    lambda: {(name,): v for name, v in OFFLOADER.stats().items()},
+)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def api_metrics():
+    """Metricile procesului în formatul text Prometheus (v0.0.4)."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# ==========
+# Batch + NDJSON (o linie JSON per element, trimisă pe măsură ce e gata)
+# ==========
+def _json_float(x: float) -> str:
+    # NDJSON strict: valorile ne-finite (Wrap invalid) devin null
+    return repr(x) if math.isfinite(x) else "null"
+
+
+def _step_lines(k, P, U, theta, chunk_size: int) -> Iterator[str]:
+    n = k.shape[0]
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        vals, sts = motor_step_batch(k[start:stop], P[start:stop], U[start:stop], theta[start:stop])
+        for st, count in zip((-1, 0, 1), np.bincount(sts + 1, minlength=3).tolist()):
+            if count:
+                ARBITER_STATES.inc(count, state=st)
+        params = zip(k[start:stop].tolist(), P[start:stop].tolist(), U[start:stop].tolist(), theta[start:stop].tolist())
+        yield "".join(
+            f'{{"index":{i},"params":{{"k":{_json_float(kk)},"P":{_json_float(pp)},"U":{_json_float(uu)},"theta":{_json_float(tt)}}},'
+            f'"value":{_json_float(v)},"state":{st},"state_desc":"{STATE_DESC[st]}"}}\n'
+            for i, (kk, pp, uu, tt), v, st in zip(range(start, stop), params, vals.tolist(), sts.tolist())
+        )
+
+
+_STEP_BATCH_BODY = {
+    "requestBody": {
+        "content": {
+            "application/json": {"schema": StepBatchInput.model_json_schema()},
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}},
+            "application/x-npy": {"schema": {"type": "string", "format": "binary"}},
+        },
+        "required": True,
+    }
+}
+
+
+@app.post("/step/batch", openapi_extra=_STEP_BATCH_BODY)
+async def api_step_batch(request: Request, chunk_size: int = 4096):
+    """
+    /step pentru multe elemente: evaluare vectorizată (motor_step_batch), câte
+    `chunk_size` elemente odată; răspunsul e NDJSON, în ordinea intrării,
+    cu aceleași câmpuri ca /step plus "index".
+
+    Corpul poate fi JSON (StepBatchInput) sau binar, citit fără copiere:
+    application/octet-stream (float64 little-endian, rânduri k, P, U, theta)
+    sau application/x-npy (array (n, 4)); pentru binar, chunk_size vine din query.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+    if content_type in BINARY_TYPES:
+        try:
+            k, P, U, theta = read_float64_columns(body, content_type)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+    else:
+        try:
+            inp = StepBatchInput.model_validate_json(body)
+        except ValidationError as exc:
+            raise HTTPException(status_code=422, detail=exc.errors(include_url=False, include_context=False))
+        chunk_size = inp.chunk_size
+        try:
+            k, P, U, theta = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (inp.k, inp.P, inp.U, inp.theta)))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="k, P, U and theta must have the same length (or length 1)")
+    if chunk_size < 1:
+        raise HTTPException(status_code=422, detail="chunk_size must be >= 1")
+    return StreamingResponse(_step_lines(k, P, U, theta, chunk_size), media_type=NDJSON)
+
+
+SATURATED_RETRY = 0.05  # secunde între reîncercări când pool-ul e plin și batch-ul nu are nimic în curs
+
+
+def _optimize_input_error(inp: OptimizeInput) -> str | None:
+    # aceleași verificări ca la începutul lambda_optimize, înainte de pornirea stream-ului
+    if inp.mode not in ("value", "state"):
+        return "mode must be 'value' or 'state'"
+    if inp.mode == "value" and inp.target is None:
+        return "target is required for mode='value'"
+    if inp.mode == "state" and inp.desired_state is None:
+        return "desired_state is required for mode='state'"
+    return None
+
+
+async def _optimize_line(i: int, pending: Awaitable[dict]) -> bytes:
+    try:
+        res = await pending
+    except ValueError as exc:
+        # statusul 200 e deja trimis: eroarea devine o linie a stream-ului
+        return dumps({"index": i, "error": str(exc)}) + b"\n"
+    return dumps({"index": i, **_observed(res)}) + b"\n"
+
+
+async def _optimize_lines(items: List[OptimizeInput], first: Awaitable[dict]) -> AsyncIterator[bytes]:
+    # cel mult max_workers elemente ale batch-ului în curs, în ordinea intrării;
+    # restul locurilor din OFFLOADER rămân pentru celelalte cereri
+    window = deque([(0, first)])
+    limit = max(1, OFFLOADER.max_workers)
+    for i, item in enumerate(items[1:], 1):
+        if len(window) >= limit:
+            yield await _optimize_line(*window.popleft())
+        while True:
+            try:
+                pending = _submit_optimize(item)
+                break
+            except Saturated:
+                # pool-ul e plin (și cu alte cereri): întâi rezultatele proprii, apoi reîncercăm
+                if window:
+                    yield await _optimize_line(*window.popleft())
+                else:
+                    await asyncio.sleep(SATURATED_RETRY)
+        window.append((i, pending))
+    while window:
+        yield await _optimize_line(*window.popleft())
+
+
+@app.post("/optimize/batch")
+async def api_optimize_batch(inp: OptimizeBatchInput):
+    """
+    /optimize pentru o listă de cereri; fiecare rezultat e trimis (NDJSON)
+    imediat ce e gata, în ordinea intrării. Elementele rulează prin OFFLOADER,
+    ca /optimize (în afara event loop-ului, cu coalescing): dacă primul nu e
+    admis, răspunsul e 429; după pornirea stream-ului, un pool plin doar
+    încetinește batch-ul (așteaptă locuri libere).
+
+    Elementele invalide (mode / target / desired_state) sunt respinse cu 422
+    înainte de stream; o eroare apărută totuși la calcul devine linia
+    {"index": i, "error": "..."}.
+    """
+    errors = [
+        {"loc": ["body", "items", i], "msg": msg}
+        for i, msg in ((i, _optimize_input_error(item)) for i, item in enumerate(inp.items)) if msg
+    ]
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    if not inp.items:
+        return StreamingResponse(iter(()), media_type=NDJSON)
+    try:
+        first = _submit_optimize(inp.items[0])
+    except Saturated as exc:
+        raise _too_many_requests(exc)
+    return StreamingResponse(_optimize_lines(inp.items, first), media_type=NDJSON)
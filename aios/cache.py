@@ -0,0 +1,98 @@
+# Λ-Möbius Core – cache de răspunsuri pentru API
+"""
+Cache LRU mărginit, cu TTL opțional, pentru răspunsurile endpoint-urilor
+pure (/step, /optimize): rezultatul depinde doar de input-ul validat, deci
+cheia e canonical_key(input) (vezi aios.offload). Se păstrează corpul JSON
+deja serializat și un ETag derivat din conținut. Se emite doar ETag-ul:
+endpoint-urile sunt POST, iar 304 / If-None-Match e definit doar pentru
+GET / HEAD, deci răspunsul e mereu complet (clientul poate compara ETag-ul
+ca să știe dacă rezultatul s-a schimbat).
+"""
+
+from __future__ import annotations
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Tuple
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """ETag puternic (cu ghilimele), derivat din corpul răspunsului."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class ResponseCache:
+    """
+      - maxsize: numărul maxim de răspunsuri; cel mai vechi folosit e evacuat.
+      - ttl:     opțional, durata de viață (s) a unei intrări; None → fără expirare.
+      - hits / misses / evictions / expirations: contoare (vezi stats()).
+    Accesul e protejat de un lock (handler-ele sync rulează pe threadpool).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if ttl is not None and not ttl > 0:
+            raise ValueError("ttl must be > 0")
+        self.maxsize = int(maxsize)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._data: OrderedDict[str, Tuple[CachedResponse, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                resp, expires = entry
+                if expires >= self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return resp
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: str, body: bytes) -> CachedResponse:
+        resp = CachedResponse(body, make_etag(body))
+        expires = float("inf") if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._data[key] = (resp, expires)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return resp
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
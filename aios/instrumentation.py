@@ -0,0 +1,44 @@
+# Λ-Möbius Core – instrumentare HTTP pentru API (vezi mobius_motor.instrumentation)
+from __future__ import annotations
+import time
+
+from mobius_motor.instrumentation import LATENCY_BUCKETS, REGISTRY
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "aios_http_request_duration_seconds", "HTTP request latency, until the last body chunk is sent",
+    ("method", "path", "status"), LATENCY_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI minimal (fără BaseHTTPMiddleware): măsoară fiecare cerere
+    HTTP până la ultimul fragment din corp, deci și răspunsurile în flux
+    (NDJSON) sunt măsurate complet. "path" e șablonul rutei (ex. /step/batch),
+    ca numărul de serii să rămână mic.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        t0 = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                route = scope.get("route")
+                REQUEST_SECONDS.observe(
+                    time.perf_counter() - t0,
+                    method=scope["method"],
+                    path=getattr(route, "path", "<unmatched>"),
+                    status=status[0],
+                )
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,109 @@
+# Λ-Möbius Core – offload pentru cererile CPU-bound ale API-ului
+"""
+Rulează funcții grele (ex. lambda_optimize) într-un pool de procese, în
+afara event loop-ului și a GIL-ului procesului API:
+
+  - admission control: cel mult `max_pending` calcule distincte în curs
+    (în coadă sau rulând); peste limită → Saturated (API-ul răspunde 429);
+  - single-flight: cererile identice (aceeași cheie canonică) aflate în
+    curs împart un singur calcul și primesc același rezultat.
+"""
+
+from __future__ import annotations
+import asyncio
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict
+
+from pydantic import BaseModel
+
+
+class Saturated(RuntimeError):
+    """Prea multe calcule în curs; cererea trebuie reîncercată mai târziu."""
+
+
+def canonical_key(inp: BaseModel) -> str:
+    """
+    Cheie stabilă pentru un input validat: JSON cu chei sortate (ordinea
+    câmpurilor și forma numerelor din cererea brută nu contează), apoi sha256.
+    """
+    body = json.dumps(inp.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return f"{type(inp).__name__}:{hashlib.sha256(body.encode()).hexdigest()}"
+
+
+class Offloader:
+    """
+    executor: "process" (implicit) sau "thread" – pool-ul e creat la prima
+    utilizare; max_workers implicit = os.cpu_count();
+    max_pending implicit = 4 * max_workers.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None, executor: str = "process"):
+        if executor not in ("process", "thread"):
+            raise ValueError("executor must be 'process' or 'thread'")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = 4 * self.max_workers if max_pending is None else max_pending
+        self.executor = executor
+        self._pool: Executor | None = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.submitted = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            cls = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+            self._pool = cls(max_workers=self.max_workers)
+        return self._pool
+
+    def _done(self, key: str, fut: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not fut.cancelled():
+            fut.exception()   # marcăm excepția ca preluată, chiar dacă nimeni nu mai așteaptă
+
+    def submit(self, key: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        """
+        Ca run(), dar admiterea e decisă imediat: ridică Saturated sincron
+        și întoarce un awaitable cu rezultatul (util când apelantul trebuie
+        să știe dacă cererea a fost admisă înainte de a aștepta rezultatul).
+        Se apelează din event loop.
+        """
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            return asyncio.shield(fut)
+        if len(self._inflight) >= self.max_pending:
+            self.rejected += 1
+            raise Saturated(f"{len(self._inflight)} computations in flight (max_pending={self.max_pending})")
+
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(self._get_pool(), functools.partial(fn, *args, **kwargs))
+        self._inflight[key] = fut
+        fut.add_done_callback(functools.partial(self._done, key))
+        self.submitted += 1
+        return asyncio.shield(fut)
+
+    async def run(self, key: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """
+        Rulează fn(*args, **kwargs) în pool, sau se atașează la calculul
+        identic (aceeași cheie) deja în curs. Anularea unui apelant nu anulează
+        calculul partajat.
+        """
+        return await self.submit(key, fn, *args, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
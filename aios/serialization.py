@@ -0,0 +1,68 @@
+# Λ-Möbius Core – serializare rapidă și input binar pentru API
+"""
+  - FastJSONResponse: răspuns randat cu dumps (mobius_motor.jsonio, comun
+    cu CLI-ul): orjson dacă e instalat, altfel json standard; valorile
+    ne-finite devin null, deci ieșirea e JSON valid pe ambele căi.
+  - read_float64_columns: corpul binar al unui batch (float64 brut sau .npy)
+    citit fără copiere, cu np.frombuffer, ca array (n, 4) de coloane
+    k, P, U, theta.
+"""
+
+from __future__ import annotations
+import io
+from typing import Any, Tuple
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+from mobius_motor.jsonio import dumps
+
+OCTET_STREAM = "application/octet-stream"
+NPY = "application/x-npy"
+BINARY_TYPES = (OCTET_STREAM, NPY)
+COLUMNS = ("k", "P", "U", "theta")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse randat cu dumps (orjson când e instalat), cu inf / nan → null."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _npy_array(body: bytes) -> np.ndarray:
+    buf = io.BytesIO(body)
+    version = np.lib.format.read_magic(buf)
+    if version == (1, 0):
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(buf)
+    else:
+        shape, fortran, dtype = np.lib.format.read_array_header_2_0(buf)
+    if dtype.hasobject:
+        raise ValueError(".npy arrays with object dtype are not accepted")
+    count = int(np.prod(shape))
+    arr = np.frombuffer(body, dtype=dtype, count=count, offset=buf.tell())
+    return arr.reshape(shape, order="F" if fortran else "C")
+
+
+def read_float64_columns(body: bytes, content_type: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Corp binar → (k, P, U, theta), views într-un array (n, 4):
+      - application/octet-stream: float64 little-endian, rânduri (k, P, U, theta);
+      - application/x-npy: fișier .npy cu shape (n, 4) (dtype float; float64
+        little-endian e citit fără copiere, celelalte sunt convertite).
+    Ridică ValueError pentru un corp invalid.
+    """
+    if content_type == OCTET_STREAM:
+        if len(body) % (8 * len(COLUMNS)):
+            raise ValueError("octet-stream body must hold n rows of 4 float64 values (k, P, U, theta)")
+        arr = np.frombuffer(body, dtype="<f8").reshape(-1, len(COLUMNS))
+    elif content_type == NPY:
+        arr = _npy_array(body)
+        if arr.ndim != 2 or arr.shape[1] != len(COLUMNS):
+            raise ValueError(f".npy array must have shape (n, 4), got {arr.shape}")
+        if arr.dtype.kind != "f":
+            raise ValueError(f".npy array must have a float dtype, got {arr.dtype}")
+        if arr.dtype != np.dtype("<f8"):
+            arr = arr.astype("<f8")
+    else:
+        raise ValueError(f"unsupported content type {content_type!r}")
+    return arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
@@ -0,0 +1 @@
+# Λ-Möbius Core – benchmark-uri de performanță (python -m benchmarks.run)
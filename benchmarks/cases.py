@@ -0,0 +1,122 @@
+# benchmarks/cases.py
+"""
+Cazurile de benchmark: nume → funcție fără argumente (setup-ul e făcut o
+singură dată, în afara măsurătorii). Fiecare caz are și o mărime de intrare
+("size") pentru căile vectorizate / batch.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+
+
+class Case(NamedTuple):
+    name: str
+    size: int
+    fn: Callable[[], object]
+
+
+def _arrays(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.1, 3.0, n), rng.uniform(0.1, 2.0, n),
+            rng.uniform(1.0, 100.0, n), rng.uniform(0.0, 1.0, n))
+
+
+def core_cases(sizes: List[int]) -> List[Case]:
+    from mobius_motor.core import motor_step, motor_step_batch
+    from mobius_motor.lut import LambdaLUT
+    from mobius_motor.time_formulas import time_steady, time_unwrap, time_wrap
+
+    lut = LambdaLUT.build()
+
+    cases = [
+        Case("motor_step", 1, lambda: motor_step(2.0, 0.8, 10.0, 0.9)),
+        Case("lut.step", 1, lambda: lut.step(2.0, 0.8, 10.0, 0.9)),
+        Case("time_wrap", 1, lambda: time_wrap(1.0, 2.0, 0.8, 10.0)),
+        Case("time_steady", 1, lambda: time_steady(1.0, 10.0)),
+        Case("time_unwrap", 1, lambda: time_unwrap(1.0, 0.5, 0.8, 10.0)),
+        Case("time_unwrap_divergent", 1, lambda: time_unwrap(1.0, 1.5, 0.8, 10.0)),
+    ]
+    for n in sizes:
+        k, P, U, theta = _arrays(n)
+        cases += [
+            Case("motor_step_batch", n, lambda k=k, P=P, U=U, t=theta: motor_step_batch(k, P, U, t)),
+            Case("lut.step_batch", n, lambda k=k, P=P, U=U, t=theta: lut.step_batch(k, P, U, t)),
+            Case("time_wrap", n, lambda k=k, P=P, U=U: time_wrap(1.0, k, P, U)),
+            Case("time_steady", n, lambda U=U: time_steady(1.0, U)),
+            Case("time_unwrap", n, lambda k=k, P=P, U=U: time_unwrap(1.0, k, P, U)),
+        ]
+    return cases
+
+
+def engine_cases(sizes: List[int]) -> List[Case]:
+    from mobius_motor.balance import balance_batch, balance_step
+    from mobius_motor.engine import run_engine, run_engine_batch
+    from mobius_motor.entropy import entropy_step
+    from mobius_motor.optimize import lambda_optimize
+    from mobius_motor.regen import Metrics, regen_cycle
+
+    m = Metrics(error_rate=0.2, latency_p95_ms=2000.0, utilization=0.95, drift=0.4, theta=0.25)
+    cases = [
+        Case("lambda_optimize[value,search]", 1,
+             lambda: lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0, analytic=False)),
+        Case("lambda_optimize[value,analytic]", 1,
+             lambda: lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0)),
+        Case("lambda_optimize[value,gradient]", 1,
+             lambda: lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0, method="gradient", analytic=False)),
+        Case("lambda_optimize[state,search]", 1,
+             lambda: lambda_optimize((0.8, 0.6, 10.0), 0.85, mode="state", desired_state=1, analytic=False)),
+        Case("lambda_optimize[state,analytic]", 1,
+             lambda: lambda_optimize((0.8, 0.6, 10.0), 0.85, mode="state", desired_state=1)),
+        Case("balance_step", 200, lambda: balance_step(1.0, 1.0, 5.0, 0.5, target_value=2.0)),
+        Case("entropy_step", 20, lambda: entropy_step(1.0, 1.0, 5.0, 0.5, trials=20, seed=0)),
+        Case("entropy_step", 100_000, lambda: entropy_step(1.0, 1.0, 5.0, 0.5, trials=100_000, seed=0)),
+        Case("regen_cycle", 1, lambda: regen_cycle(1.0, 1.0, 5.0, m)),
+        Case("run_engine", 1, lambda: run_engine(1.0, 1.0, 5.0, 0.25, metrics=m)),
+    ]
+    for n in sizes:
+        k, P, U, theta = _arrays(n)
+        cases.append(Case("balance_batch", n, lambda k=k, P=P, U=U, t=theta: balance_batch(k, P, U, t, 2.0)))
+    fleet = [{"k": a, "P": b, "U": c, "theta": t} for a, b, c, t in zip(*map(np.ndarray.tolist, _arrays(50)))]
+    cases.append(Case("run_engine_batch", len(fleet), lambda: run_engine_batch(fleet, iters=20)))
+    return cases
+
+
+def api_cases(sizes: List[int]) -> List[Case]:
+    from fastapi.testclient import TestClient
+
+    from aios import api
+
+    client = TestClient(api.app)
+    step = {"k": 2.0, "P": 0.8, "U": 10.0, "theta": 0.9}
+    opt = {"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.45, "mode": "value", "target": 3.0}
+
+    def uncached(path, payload, cache):
+        def call():
+            cache.clear()
+            return client.post(path, json=payload)
+        return call
+
+    cases = [
+        Case("api /step", 1, uncached("/step", step, api.STEP_CACHE)),
+        Case("api /step (cached)", 1, lambda: client.post("/step", json=step)),
+        Case("api /optimize", 1, uncached("/optimize", opt, api.OPTIMIZE_CACHE)),
+    ]
+    for n in sizes:
+        k, P, U, theta = _arrays(n)
+        body = {"k": k.tolist(), "P": P.tolist(), "U": U.tolist(), "theta": theta.tolist()}
+        raw = np.column_stack((k, P, U, theta)).astype("<f8").tobytes()
+        cases += [
+            Case("api /step/batch json", n, lambda body=body: client.post("/step/batch", json=body).content),
+            Case("api /step/batch binary", n, lambda raw=raw: client.post(
+                "/step/batch", content=raw, headers={"Content-Type": "application/octet-stream"}).content),
+        ]
+    return cases
+
+
+GROUPS: Dict[str, Callable[[List[int]], List[Case]]] = {
+    "core": core_cases,
+    "engine": engine_cases,
+    "api": api_cases,
+}
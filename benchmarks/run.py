@@ -0,0 +1,189 @@
+# benchmarks/run.py
+"""
+Λ-Möbius Core – suita de benchmark-uri (offline, doar CPU).
+
+    python -m benchmarks.run                    # rulează și compară cu baseline.json
+    python -m benchmarks.run --quick            # mai puține dimensiuni / repetiții
+    python -m benchmarks.run --update-baseline  # rescrie baseline.json
+    python -m benchmarks.run --output out.json --threshold 0.5 --group core
+    python -m benchmarks.run --sizes 1000 100000    # alte dimensiuni pentru cazurile batch
+
+Fiecare caz e cronometrat cu timeit (autorange, apoi `repeat` măsurători),
+în secunde per apel. Suita e rulată de `--rounds` ori, cu cazurile
+intercalate, și se păstrează minimul per caz: pe o mașină partajată, o
+perioadă lentă afectează o singură rundă, nu un caz anume. Timpii sunt
+normalizați la o buclă de calibrare în Python pur ("score" = timp /
+calibrare), ca baseline-ul să fie comparabil între mașini de viteze diferite.
+
+"spread" = mediana / minimul tuturor măsurătorilor unui caz: cât de
+zgomotos e cazul pe mașina curentă. Un caz e o regresie (→ cod de ieșire 1)
+doar dacă e mai lent decât baseline-ul cu peste `threshold` (relativ) și
+raportul depășește și spread-ul lui (altfel nu se distinge de jitter).
+
+Pragul implicit e +25%; zgomotul unui CPU partajat (până la x1.8 între
+rulări identice cu --quick) e filtrat de spread-ul înregistrat în baseline
+și în rularea curentă, nu de un prag larg. Suita se rulează ca modul, din
+rădăcina repo-ului (python -m benchmarks.run).
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from typing import Dict, List
+
+from benchmarks.cases import GROUPS, Case
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+SIZES = (1_000, 10_000)
+QUICK_SIZES = (1_000,)
+DEFAULT_THRESHOLD = 0.25
+
+
+def _calibration_loop() -> int:
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    return total
+
+
+def time_case(fn, repeat: int = 5, min_time: float = 0.05) -> List[float]:
+    """Secunde per apel, pentru fiecare din cele `repeat` runde de câte ≥ min_time secunde."""
+    fn()  # încălzire (import-uri leneșe, cache-uri de modul)
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    return [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+
+def case_key(case: Case) -> str:
+    return f"{case.name}[n={case.size}]"
+
+
+def spread(times: List[float]) -> float:
+    """Mediana / minimul măsurătorilor (1.0 = fără zgomot)."""
+    return statistics.median(times) / min(times) if min(times) > 0 else 1.0
+
+
+def run(groups: List[str], sizes: List[int], repeat: int, min_time: float, rounds: int = 1) -> Dict[str, object]:
+    cases = [(group, case) for group in groups for case in GROUPS[group](list(sizes))]
+    calibration = float("inf")
+    samples: Dict[str, List[float]] = {}
+    for r in range(rounds):
+        calibration = min(calibration, *time_case(_calibration_loop, repeat=repeat, min_time=min_time))
+        for _, case in cases:
+            key = case_key(case)
+            samples.setdefault(key, []).extend(time_case(case.fn, repeat=repeat, min_time=min_time))
+            if r == rounds - 1:
+                print(f"  {key:<45} {min(samples[key]) * 1e6:12.2f} µs  spread x{spread(samples[key]):.2f}", flush=True)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for group, case in cases:
+        times = samples[case_key(case)]
+        results[case_key(case)] = {
+            "group": group,
+            "size": case.size,
+            "seconds": min(times),
+            "score": min(times) / calibration,
+            "spread": spread(times),
+        }
+    return {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()},
+        "calibration_seconds": calibration,
+        "rounds": rounds,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[Dict[str, object]]:
+    """
+    Compară score-urile cazurilor comune. Returnează o intrare per caz:
+    {"case", "baseline", "current", "ratio", "spread", "regression"};
+    "spread" e cel mai mare dintre spread-urile celor două rulări (1.0 dacă
+    lipsesc). Cazurile noi sau dispărute din baseline sunt ignorate.
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    for key, cur in current["results"].items():
+        base = base_results.get(key)
+        if base is None:
+            continue
+        ratio = cur["score"] / base["score"] if base["score"] > 0 else float("inf")
+        noise = max(cur.get("spread", 1.0), base.get("spread", 1.0))
+        rows.append({
+            "case": key,
+            "baseline": base["score"],
+            "current": cur["score"],
+            "ratio": ratio,
+            "spread": noise,
+            "regression": ratio > 1.0 + threshold and ratio > noise,
+        })
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Λ-Möbius Core benchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON (implicit benchmarks/baseline.json)")
+    parser.add_argument("--output", default=None, help="scrie rezultatele în acest fișier JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="încetinire relativă tolerată (implicit 0.25 = +25%%; zgomotul e filtrat de spread)")
+    parser.add_argument("--group", action="append", choices=sorted(GROUPS), help="rulează doar aceste grupuri")
+    parser.add_argument("--quick", action="store_true", help="o singură dimensiune și mai puține repetiții")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None, help="dimensiunile pentru cazurile batch")
+    parser.add_argument("--rounds", type=int, default=None, help="runde complete; se păstrează minimul per caz (implicit 3, 1 cu --quick)")
+    parser.add_argument("--update-baseline", action="store_true", help="rescrie baseline-ul cu rezultatele curente")
+    args = parser.parse_args(argv)
+
+    groups = args.group or list(GROUPS)
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    repeat, min_time = (3, 0.02) if args.quick else (5, 0.05)
+    rounds = args.rounds or (1 if args.quick else 3)
+
+    print(f"Λ-Möbius benchmarks: groups={groups} sizes={list(sizes)} rounds={rounds}")
+    current = run(groups, sizes, repeat, min_time, rounds)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    rows = compare(current, baseline, args.threshold)
+    regressions = [r for r in rows if r["regression"]]
+    print(f"\ncompared {len(rows)} cases against {args.baseline} (threshold +{args.threshold:.0%})")
+    print(f"  {'case':<45} {'ratio':>7} {'spread':>7}")
+    for r in sorted(rows, key=lambda r: -r["ratio"]):
+        if r["regression"]:
+            flag = "REGRESSION"
+        elif r["ratio"] > 1.0 + args.threshold:
+            flag = "within noise"
+        else:
+            flag = ""
+        print(f"  {r['case']:<45} x{r['ratio']:6.2f} x{r['spread']:6.2f} {flag}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above +{args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1 @@
-from .regen import Metrics, detect_anomalies, regen_cycle
+from .regen import Metrics, MetricsBatch, detect_anomalies, detect_anomalies_batch, regen_cycle
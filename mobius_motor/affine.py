@@ -0,0 +1,161 @@
+# mobius_motor/affine.py
+# Recurențe afine v_{n+1} = a·v_n + b – formă închisă + istoric opțional
+"""
+Utilitare comune pentru wrap_step / steady_step / unwrap_step.
+
+Toate cele trei moduri iterează o recurență afină:
+    v_{n+1} = a·v_n + b
+care are formă închisă:
+    v_n = a^n·v_0 + b·(a^n - 1)/(a - 1)      (a ≠ 1)
+    v_n = v_0 + n·b                          (a = 1)
+
+Pentru Λ-Wrap valoarea este tăiată la 0 (clamp); traiectoria e monotonă
+pentru a > 0, deci e suficient indexul primei treceri sub 0.
+Pentru a <= 0 sau valori ne-finite revenim la bucla clasică.
+"""
+
+from __future__ import annotations
+import math
+from array import array
+from typing import Iterator
+
+import numpy as np
+
+HISTORY_KINDS = ("list", "lazy", "array", "numpy")
+
+
+def _use_closed_form(v0: float, a: float, b: float) -> bool:
+    return a > 0 and math.isfinite(v0) and math.isfinite(a) and math.isfinite(b)
+
+
+def _loop_value(v0: float, a: float, b: float, n: int, clamp_zero: bool) -> float:
+    value = v0
+    for _ in range(n):
+        value = value * a + b
+        if clamp_zero and value < 0:
+            value = 0.0
+        if not math.isfinite(value):
+            break  # inf / nan rămân așa până la final
+    return value
+
+
+def _geom(a: float, n: int) -> tuple[float, float]:
+    """(a^n, (a^n - 1)/(a - 1)) stabil numeric pentru a aproape de 1."""
+    if a == 1.0:
+        return 1.0, float(n)
+    log_a = math.log1p(a - 1.0)
+    try:
+        an_minus_1 = math.expm1(n * log_a)
+    except OverflowError:
+        return math.inf, math.inf
+    return an_minus_1 + 1.0, an_minus_1 / (a - 1.0)
+
+
+def _affine(v0: float, a: float, b: float, n: int) -> float:
+    an, g = _geom(a, n)
+    if math.isinf(an):
+        # depășire: semnul e dat de termenul dominant
+        lead = v0 + b / (a - 1.0)
+        return -b / (a - 1.0) if lead == 0 else math.copysign(math.inf, lead)
+    return an * v0 + b * g
+
+
+def _first_negative(v0: float, a: float, b: float, n: int) -> int | None:
+    """Primul m din 1..n cu v_m < 0 (traiectorie ne-tăiată, monotonă pentru a > 0)."""
+    if n <= 0:
+        return None
+    if _affine(v0, a, b, 1) < 0:
+        return 1
+    if not _affine(v0, a, b, n) < 0:
+        return None
+    # traiectorie descrescătoare: căutare binară a trecerii
+    lo, hi = 1, n
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _affine(v0, a, b, mid) < 0:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def affine_value(v0: float, a: float, b: float, n: int, clamp_zero: bool = False) -> float:
+    """
+    Valoarea după n pași a recurenței v ← a·v + b (opțional cu clamp la 0),
+    fără a itera pas cu pas.
+    """
+    v0, a, b = float(v0), float(a), float(b)
+    if n <= 0:
+        return v0
+    if not _use_closed_form(v0, a, b):
+        return _loop_value(v0, a, b, n, clamp_zero)
+    if not clamp_zero:
+        return _affine(v0, a, b, n)
+
+    m = _first_negative(v0, a, b, n)
+    if m is None:
+        return _affine(v0, a, b, n)
+    # la pasul m valoarea devine 0; din 0 traiectoria nu mai coboară sub 0
+    # dacă b >= 0, altfel rămâne blocată la 0
+    if b < 0:
+        return 0.0
+    return _affine(0.0, a, b, n - m)
+
+
+def _iter_history(v0: float, a: float, b: float, n: int, clamp_zero: bool) -> Iterator[float]:
+    value = v0
+    for _ in range(n):
+        value = value * a + b
+        if clamp_zero and value < 0:
+            value = 0.0
+        yield value
+
+
+def _numpy_trajectory(v0: float, a: float, b: float, steps: int) -> np.ndarray:
+    j = np.arange(1, steps + 1, dtype=float)
+    with np.errstate(over="ignore", invalid="ignore"):
+        if a == 1.0:
+            return v0 + j * b
+        an_minus_1 = np.expm1(j * math.log1p(a - 1.0))
+        return (an_minus_1 + 1.0) * v0 + b * (an_minus_1 / (a - 1.0))
+
+
+def _numpy_history(v0: float, a: float, b: float, n: int, clamp_zero: bool) -> np.ndarray:
+    if not _use_closed_form(v0, a, b):
+        return np.fromiter(_iter_history(v0, a, b, n, clamp_zero), dtype=float, count=n)
+    if not clamp_zero:
+        return _numpy_trajectory(v0, a, b, n)
+
+    out = np.zeros(n, dtype=float)
+    m = _first_negative(v0, a, b, n)
+    if m is None:
+        out[:] = _numpy_trajectory(v0, a, b, n)
+        return out
+    out[: m - 1] = _numpy_trajectory(v0, a, b, m - 1)
+    if b >= 0:
+        out[m:] = _numpy_trajectory(0.0, a, b, n - m)
+    return out
+
+
+def affine_history(v0: float, a: float, b: float, n: int, kind: str, clamp_zero: bool = False):
+    """
+    Istoricul v_1..v_n în forma cerută:
+      - "list":  listă Python (comportamentul clasic)
+      - "lazy":  generator, calculat pas cu pas doar la consum
+      - "array": array('d') prealocat
+      - "numpy": np.ndarray calculat vectorizat (formă închisă)
+    """
+    v0, a, b = float(v0), float(a), float(b)
+    n = max(int(n), 0)
+    if kind == "lazy":
+        return _iter_history(v0, a, b, n, clamp_zero)
+    if kind == "list":
+        return list(_iter_history(v0, a, b, n, clamp_zero))
+    if kind == "array":
+        buf = array("d", bytes(8 * n))
+        for i, value in enumerate(_iter_history(v0, a, b, n, clamp_zero)):
+            buf[i] = value
+        return buf
+    if kind == "numpy":
+        return _numpy_history(v0, a, b, n, clamp_zero)
+    raise ValueError(f"history must be one of {HISTORY_KINDS} or None")
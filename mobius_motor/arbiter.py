@@ -1,4 +1,7 @@
 # Λ-Arbiter – unica definiție
+import numpy as np
+
+
 def phi_arbiter(theta: float, low_threshold: float, high_threshold: float) -> int:
     """
     Arbiterul decide starea sistemului:
@@ -14,3 +17,18 @@ def phi_arbiter(theta: float, low_threshold: float, high_threshold: float) -> in
     if low_threshold <= theta < high_threshold:
         return 0
     return -1
+
+
+def phi_arbiter_array(theta, low_threshold: float, high_threshold: float):
+    """
+    Varianta vectorizată a arbiterului (theta = array NumPy).
+    Aceleași reguli ca phi_arbiter; returnează un array int8 cu +1 / 0 / -1.
+    """
+    if not low_threshold < high_threshold:
+        raise ValueError("low_threshold must be < high_threshold")
+
+    theta = np.asarray(theta, dtype=float)
+    states = np.full(theta.shape, -1, dtype=np.int8)
+    states[theta >= low_threshold] = 0
+    states[theta >= high_threshold] = 1
+    return states
@@ -3,8 +3,13 @@
 
 from __future__ import annotations
 from typing import Dict, List, Tuple
-from mobius_motor.core import motor_step
 
+import numpy as np
+
+from mobius_motor.core import motor_step, motor_step_batch
+from mobius_motor.tracing import traced
+
+@traced("balance")
 def balance_step(
     k: float,
     P: float,
@@ -13,26 +18,33 @@ def balance_step(
     target_value: float,
     iters: int = 200,
     lr: float = 0.05,
+    tol: float | None = None,
 ) -> Dict[str, object]:
     """
     Ajustează parametrii (k, P, U) astfel încât Λ_time să se apropie de target_value.
     Metodă: gradient descent simplificat (determinist).
+    tol: dacă e setat, se oprește imediat ce |Λ - target_value| <= tol.
     """
     history: List[Tuple[float, float, float, float]] = []
     best_params = (k, P, U)
-    best_val, _ = motor_step(k, P, U, theta)
-    best_loss = abs(best_val - target_value)
+    if iters <= 0:
+        best_val, st = motor_step(k, P, U, theta)
+        best_loss = abs(best_val - target_value)
 
-    for _ in range(iters):
+    for i in range(iters):
         val, st = motor_step(k, P, U, theta)
         loss = abs(val - target_value)
         history.append((k, P, U, val))
 
-        if loss < best_loss:
+        # primul pas inițializează "best" (evaluarea de start)
+        if i == 0 or loss < best_loss:
             best_loss = loss
             best_val = val
             best_params = (k, P, U)
 
+        if tol is not None and loss <= tol:
+            break
+
         # update simplu: mișcare proporțională cu eroarea
         if val < target_value:
             U *= (1 + lr)
@@ -50,3 +62,97 @@ def balance_step(
         "loss": best_loss,
         "history": history,
     }
+
+
+def balance_batch(
+    k,
+    P,
+    U,
+    theta,
+    target_value,
+    iters: int = 200,
+    lr: float = 0.05,
+    tol: float | None = None,
+    history: bool | np.ndarray = False,
+) -> Dict[str, object]:
+    """
+    balance_step pentru n servicii deodată: toate (k, P, U) avansează în
+    pas cu motor_step_batch. Un serviciu care ajunge în toleranță (tol) e
+    scos din mască și nu mai e evaluat. Rezultatele per serviciu corespund
+    lui balance_step cu aceiași parametri.
+
+    history:
+      - False: fără istoric;
+      - True: array (iters, n, 4) cu (k, P, U, Λ), NaN după oprire;
+      - np.ndarray (iters, n, 4) prealocat de apelant (e suprascris).
+
+    Returnează aceleași chei ca balance_step, cu array-uri de lungime n;
+    "iters" = numărul de pași efectuați de fiecare serviciu.
+    """
+    k, P, U, theta, target = (
+        np.array(a, dtype=float)
+        for a in np.broadcast_arrays(*np.atleast_1d(k, P, U, theta, target_value))
+    )
+    if k.ndim != 1:
+        raise ValueError("balance_batch expects 1-d arrays")
+    n = k.shape[0]
+
+    if history is True:
+        hist = np.full((iters, n, 4), np.nan)
+    elif history is False or history is None:
+        hist = None
+    else:
+        hist = history
+        if hist.shape != (iters, n, 4):
+            raise ValueError(f"history buffer must have shape {(iters, n, 4)}")
+        hist[...] = np.nan
+
+    best_k, best_P, best_U = k.copy(), P.copy(), U.copy()
+    best_val = np.empty(n)
+    best_loss = np.full(n, np.inf)
+    final_state = np.zeros(n, dtype=np.int8)
+    steps = np.zeros(n, dtype=np.int64)
+
+    if iters <= 0:
+        best_val, final_state = motor_step_batch(k, P, U, theta)
+        best_loss = np.abs(best_val - target)
+
+    active = np.ones(n, dtype=bool)
+    for i in range(iters):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        kk, PP, UU, tt = k[idx], P[idx], U[idx], target[idx]
+
+        val, st = motor_step_batch(kk, PP, UU, theta[idx])
+        loss = np.abs(val - tt)
+        if hist is not None:
+            hist[i, idx] = np.column_stack((kk, PP, UU, val))
+
+        better = (loss < best_loss[idx]) | (i == 0)
+        sel = idx[better]
+        best_loss[sel] = loss[better]
+        best_val[sel] = val[better]
+        best_k[sel], best_P[sel], best_U[sel] = kk[better], PP[better], UU[better]
+        final_state[idx] = st
+        steps[idx] = i + 1
+
+        if tol is not None:
+            active[idx[loss <= tol]] = False
+
+        # același update ca în balance_step
+        below = val < tt
+        U[idx] = np.where(below, UU * (1 + lr), UU * (1 - lr))
+        P[idx] = np.where(below, PP * (1 + lr / 2), PP * (1 - lr / 2))
+        with np.errstate(invalid="ignore", over="ignore"):
+            k_new = kk * (1 + 0.01 * (tt - val))
+        k[idx] = np.where(k_new > 0.1, k_new, 0.1)   # = max(0.1, k_new), inclusiv pentru NaN
+
+    return {
+        "params_final": {"k": best_k, "P": best_P, "U": best_U},
+        "final_value": best_val,
+        "final_state": final_state,
+        "loss": best_loss,
+        "iters": steps,
+        "history": hist,
+    }
@@ -0,0 +1,102 @@
+# mobius_motor/cache.py
+# Λ-Cache – memoizare LRU pentru evaluările motor_step
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from mobius_motor.core import motor_step
+
+Key = Tuple[float, float, float, float, float, float, float]
+
+
+class EvalCache:
+    """
+    Cache LRU mărginit pentru motor_step(k, P, U, theta, ...) → (Λ, stare).
+
+      - maxsize:  numărul maxim de intrări; cea mai veche folosită e evacuată.
+      - quantize: opțional, pasul de rotunjire pentru (k, P, U).
+                  Punctele din aceeași celulă împart o evaluare, făcută în
+                  punctul rotunjit (rezultat determinist, dar aproximativ).
+                  theta rămâne exact în cheie: rotunjit, ar putea trece
+                  peste un prag al Arbiterului și ar schimba starea.
+      - hits / misses / evictions: contoare.
+
+    Poate fi folosit per rulare (lambda_optimize(..., cache=True)) sau
+    partajat în tot procesul (SHARED_CACHE). Accesul e protejat de un lock.
+    O evaluare motor_step costă ~1 µs, deci cache-ul merită doar când
+    aceleași puncte revin des (rulări repetate, cache partajat).
+    """
+
+    def __init__(self, maxsize: int = 4096, quantize: float | None = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if quantize is not None and not quantize > 0:
+            raise ValueError("quantize must be > 0")
+        self.maxsize = int(maxsize)
+        self.quantize = quantize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Key, Tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _snap(self, x: float) -> float:
+        q = self.quantize
+        return x if q is None else round(x / q) * q
+
+    def step(
+        self,
+        k: float,
+        P: float,
+        U: float,
+        theta: float,
+        low_threshold: float = 0.3,
+        high_threshold: float = 0.7,
+        T1: float = 1.0,
+    ) -> Tuple[float, int]:
+        """motor_step memoizat (aceeași semnătură și același rezultat)."""
+        if self.quantize is not None:
+            k, P, U = self._snap(k), self._snap(P), self._snap(U)
+        key = (k, P, U, theta, low_threshold, high_threshold, T1)
+
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return hit
+            self.misses += 1
+
+        res = motor_step(k, P, U, theta, low_threshold, high_threshold, T1)
+
+        with self._lock:
+            self._data[key] = res
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return res
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Cache partajat la nivel de proces (opt-in: lambda_optimize(..., cache=SHARED_CACHE))
+SHARED_CACHE = EvalCache(maxsize=65536)
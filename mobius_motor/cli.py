@@ -2,36 +2,253 @@
 # Λ-Möbius CLI – interfață de linie de comandă
 import argparse
 import json
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-from mobius_motor.core import motor_step
+import numpy as np
+
+from mobius_motor.core import motor_step, motor_step_batch
 from mobius_motor.optimize import lambda_optimize
+from mobius_motor.records import (
+    FORMATS, LINE, RecordError, RecordWriter, chunked, field, guess_format, open_input, open_output, read_records,
+)
+from mobius_motor.sweep import SweepSpec, parse_axis, run_sweep
+
+STATE_DESC = {1: "Λ-Wrap", 0: "Λ-Steady", -1: "Λ-Unwrap"}
+STEP_FIELDS = ("index", "k", "P", "U", "theta", "value", "state", "state_desc")
+OPTIMIZE_FIELDS = (
+    "index", "theta", "mode", "target", "desired_state", "k", "P", "U",
+    "final_value", "final_state", "loss", "iters", "termination",
+)
+STEP_CHUNK = 4096
+OPTIMIZE_CHUNK = 16
+
+
+def _single_output(args, doc):
+    with open_output(args.output) as out:
+        out.write(json.dumps(doc, indent=2) + "\n")
+
+
+def _writer(args, out, fields):
+    fmt = guess_format(args.output, args.output_format, default=guess_format(args.input, args.input_format))
+    return RecordWriter(out, fmt, fields)
+
+
+def _input_records(args):
+    fmt = guess_format(args.input, args.input_format)
+    with open_input(args.input) as stream:
+        yield from read_records(stream, fmt)
+
+
+def _until_error(items, errors):
+    """
+    Elementele din `items` până la primul RecordError, care e pus în `errors`
+    în loc să fie ridicat: elementele deja citite sunt procesate și scrise
+    înainte de eroare, deci ieșirea e un prefix valid al intrării.
+    """
+    try:
+        yield from items
+    except RecordError as exc:
+        errors.append(exc)
+
 
+# ==========
+# step
+# ==========
 def cmd_step(args):
+    if args.input is not None:
+        return _step_stream(args)
     val, st = motor_step(k=args.k, P=args.P, U=args.U, theta=args.theta)
-    state_desc = {1: "Λ-Wrap", 0: "Λ-Steady", -1: "Λ-Unwrap"}[st]
-    print(json.dumps({
+    _single_output(args, {
         "k": args.k, "P": args.P, "U": args.U, "theta": args.theta,
-        "value": val, "state": st, "state_desc": state_desc
-    }, indent=2))
+        "value": val, "state": st, "state_desc": STATE_DESC[st]
+    })
+
+
+def _step_columns(chunk, defaults):
+    """(coloanele k, P, U, theta ale prefixului valid din chunk, RecordError-ul primei înregistrări invalide sau None)."""
+    names = ("k", "P", "U", "theta")
+    try:
+        return np.array([[float(rec.get(n, defaults[n])) for n in names] for rec in chunk], dtype=float), None
+    except (TypeError, ValueError):
+        pass
+    # calea lentă doar pentru mesajul de eroare (linia + câmpul)
+    rows = []
+    for rec in chunk:
+        try:
+            rows.append([field(rec, n, default=defaults[n], required=True) for n in names])
+        except RecordError as exc:
+            return np.array(rows, dtype=float).reshape(-1, len(names)), exc
+    return np.array(rows, dtype=float), None
+
+
+def _step_stream(args):
+    """
+    --input: înregistrările sunt citite și evaluate câte `chunk_size` odată
+    (motor_step_batch), iar rezultatele sunt scrise imediat; memoria e
+    mărginită de mărimea unui chunk. Câmpurile lipsă iau valorile din
+    --k / --P / --U / --theta. La o înregistrare invalidă, rezultatele
+    dinaintea ei sunt scrise, apoi se ridică RecordError.
+    """
+    defaults = {"k": args.k, "P": args.P, "U": args.U, "theta": args.theta}
+    errors = []
+    index = 0
+    with open_output(args.output) as out:
+        writer = _writer(args, out, STEP_FIELDS)
+        for chunk in chunked(_until_error(_input_records(args), errors), args.chunk_size or STEP_CHUNK):
+            cols, error = _step_columns(chunk, defaults)
+            if len(cols):
+                vals, sts = motor_step_batch(cols[:, 0], cols[:, 1], cols[:, 2], cols[:, 3])
+                writer.write_many(
+                    {"index": i, "k": k, "P": P, "U": U, "theta": theta, "value": v, "state": st, "state_desc": STATE_DESC[st]}
+                    for i, (k, P, U, theta), v, st in zip(range(index, index + len(cols)), cols.tolist(), vals.tolist(), sts.tolist())
+                )
+                index += len(cols)
+            if error is not None:
+                raise error
+    if errors:
+        raise errors[0]
+
+
+# ==========
+# optimize
+# ==========
+def _optimize_kwargs(k, P, U, theta, mode, target, desired_state):
+    kwargs = dict(initial_guess=(k, P, U), theta=theta, mode=mode, desired_state=desired_state)
+    if mode == "value":
+        kwargs["target"] = target
+    return kwargs
+
 
 def cmd_optimize(args):
-    if args.mode == "value":
-        res = lambda_optimize(
-            initial_guess=(args.k, args.P, args.U),
-            theta=args.theta,
-            mode="value",
-            target=args.target,
-            desired_state=args.desired_state,
-        )
+    if args.input is not None:
+        return _optimize_stream(args)
+    res = lambda_optimize(**_optimize_kwargs(args.k, args.P, args.U, args.theta, args.mode, args.target, args.desired_state))
+    _single_output(args, res)
+
+
+def _optimize_job(rec, args):
+    mode = field(rec, "mode", cast=str, default=args.mode, required=True)
+    if mode not in ("value", "state"):
+        raise RecordError(f"line {rec[LINE]}: mode must be 'value' or 'state', got {mode!r}")
+    kwargs = _optimize_kwargs(
+        field(rec, "k", default=args.k),
+        field(rec, "P", default=args.P),
+        field(rec, "U", default=args.U),
+        field(rec, "theta", default=args.theta, required=True),
+        mode,
+        field(rec, "target", default=args.target),
+        field(rec, "desired_state", cast=lambda x: int(float(x)), default=args.desired_state),
+    )
+    return rec[LINE], kwargs
+
+
+def _optimize_chunk(jobs):
+    """
+    (rezultatele până la primul job eșuat, mesajul de eroare sau None).
+    Funcție la nivel de modul → poate fi trimisă în ProcessPoolExecutor.
+    """
+    out = []
+    for line, kwargs in jobs:
+        try:
+            out.append(lambda_optimize(**kwargs))
+        except ValueError as exc:
+            return out, f"line {line}: {exc}"
+    return out, None
+
+
+def _chunk_results(outcome):
+    results, error = outcome
+    yield from results
+    if error is not None:
+        raise RecordError(error)
+
+
+def optimize_results(jobs, workers=1, chunk_size=OPTIMIZE_CHUNK):
+    """
+    Rezultatele lambda_optimize pentru `jobs` ((linie, kwargs)), în ordinea
+    intrării. workers > 1 → chunk-uri de `chunk_size` pe un ProcessPoolExecutor,
+    cu cel mult 2·workers chunk-uri în zbor (memorie mărginită, spre deosebire
+    de Executor.map, care consumă tot iterabilul de la început).
+
+    La prima înregistrare invalidă (în `jobs` sau în lambda_optimize), toate
+    rezultatele dinaintea ei sunt produse, apoi se ridică RecordError: ieșirea
+    e un prefix valid, de la care rularea poate fi reluată.
+    """
+    errors = []
+    jobs = _until_error(jobs, errors)
+    if workers <= 1:
+        for chunk in chunked(jobs, chunk_size):
+            yield from _chunk_results(_optimize_chunk(chunk))
     else:
-        res = lambda_optimize(
-            initial_guess=(args.k, args.P, args.U),
-            theta=args.theta,
-            mode="state",
-            desired_state=args.desired_state,
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            pending = deque()
+            try:
+                for chunk in chunked(jobs, chunk_size):
+                    pending.append(ex.submit(_optimize_chunk, chunk))
+                    if len(pending) >= 2 * workers:
+                        yield from _chunk_results(pending.popleft().result())
+                while pending:
+                    yield from _chunk_results(pending.popleft().result())
+            finally:
+                for fut in pending:   # eroare sau ieșire închisă: chunk-urile rămase nu mai contează
+                    fut.cancel()
+    if errors:
+        raise errors[0]
+
+
+def _optimize_row(i, res, fmt):
+    if fmt == "ndjson":
+        return {"index": i, **res}
+    return {"index": i, **res, **res["params_opt"]}
+
+
+def _optimize_stream(args):
+    jobs = (_optimize_job(rec, args) for rec in _input_records(args))
+    with open_output(args.output) as out:
+        writer = _writer(args, out, OPTIMIZE_FIELDS)
+        results = optimize_results(jobs, args.workers, args.chunk_size or OPTIMIZE_CHUNK)
+        for i, res in enumerate(results):
+            writer.write(_optimize_row(i, res, writer.fmt))
+
+
+# ==========
+# sweep
+# ==========
+def cmd_sweep(args):
+    try:
+        spec = SweepSpec(
+            *(parse_axis(getattr(args, name)) for name in ("k", "P", "U", "theta")),
+            chunk_size=args.chunk_size,
+            low_threshold=args.low_threshold, high_threshold=args.high_threshold, T1=args.T1,
         )
-    print(json.dumps(res, indent=2))
+    except ValueError as exc:
+        args.parser.error(str(exc))
+
+    def progress(done, total):
+        print(f"\rchunks {done}/{total}", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+    try:
+        summary = run_sweep(args.out, spec, workers=args.workers, overwrite=args.overwrite,
+                            progress=progress if args.progress else None)
+    except ValueError as exc:
+        print(f"mobius-cli: error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(summary, indent=2))
+
+
+def _add_stream_args(p, workers=False):
+    g = p.add_argument_group("batch", "evaluate many records (CSV or NDJSON) in one process")
+    g.add_argument("--input", default=None, help="records file, or - for stdin")
+    g.add_argument("--output", default=None, help="output file (default: stdout)")
+    g.add_argument("--input-format", choices=FORMATS, default=None, help="default: from the file extension, else ndjson")
+    g.add_argument("--output-format", choices=FORMATS, default=None, help="default: from the extension, else the input format")
+    g.add_argument("--chunk-size", type=int, default=None, help="records per chunk")
+    if workers:
+        g.add_argument("--workers", type=int, default=1, help="worker processes (default 1: in-process)")
+
 
 def main(argv=None):
     parser = argparse.ArgumentParser(
@@ -41,29 +258,77 @@ def main(argv=None):
     subparsers = parser.add_subparsers(dest="command")
 
     # subcmd: step
-    p_step = subparsers.add_parser("step", help="Run single motor step")
-    p_step.add_argument("--k", type=float, required=True)
-    p_step.add_argument("--P", type=float, required=True)
-    p_step.add_argument("--U", type=float, required=True)
-    p_step.add_argument("--theta", type=float, required=True)
+    p_step = subparsers.add_parser("step", help="Run motor steps (one, or a stream of records with --input)")
+    p_step.add_argument("--k", type=float, default=None)
+    p_step.add_argument("--P", type=float, default=None)
+    p_step.add_argument("--U", type=float, default=None)
+    p_step.add_argument("--theta", type=float, default=None)
+    _add_stream_args(p_step)
     p_step.set_defaults(func=cmd_step)
 
     # subcmd: optimize
-    p_opt = subparsers.add_parser("optimize", help="Run optimization")
+    p_opt = subparsers.add_parser("optimize", help="Run optimization (one, or a stream of records with --input)")
     p_opt.add_argument("--k", type=float, default=1.0)
     p_opt.add_argument("--P", type=float, default=1.0)
     p_opt.add_argument("--U", type=float, default=5.0)
-    p_opt.add_argument("--theta", type=float, required=True)
-    p_opt.add_argument("--mode", choices=["value", "state"], required=True)
+    p_opt.add_argument("--theta", type=float, default=None)
+    p_opt.add_argument("--mode", choices=["value", "state"], default=None)
     p_opt.add_argument("--target", type=float, default=None)
     p_opt.add_argument("--desired_state", type=int, choices=[-1,0,1], default=None)
+    _add_stream_args(p_opt, workers=True)
     p_opt.set_defaults(func=cmd_optimize)
 
+    # subcmd: sweep
+    p_sweep = subparsers.add_parser(
+        "sweep", help="Evaluate Λ and the Arbiter state over a (k, P, U, theta) grid into .npy files",
+        description="Each axis is 'start:stop:num' (num points, ends included) or a single value. "
+                    "Results go to OUT/values.npy and OUT/states.npy (memory-mapped); "
+                    "re-running with the same arguments resumes an interrupted sweep.",
+    )
+    for name in ("k", "P", "U", "theta"):
+        p_sweep.add_argument(f"--{name}", required=True, metavar="START:STOP:NUM")
+    p_sweep.add_argument("--out", required=True, help="output directory")
+    p_sweep.add_argument("--chunk-size", type=int, default=1 << 20, help="grid points per chunk (default 1048576)")
+    p_sweep.add_argument("--workers", type=int, default=1, help="worker processes (default 1: in-process)")
+    p_sweep.add_argument("--low-threshold", type=float, default=0.3)
+    p_sweep.add_argument("--high-threshold", type=float, default=0.7)
+    p_sweep.add_argument("--T1", type=float, default=1.0)
+    p_sweep.add_argument("--overwrite", action="store_true", help="start over even if OUT holds another sweep")
+    p_sweep.add_argument("--progress", action="store_true", help="report finished chunks on stderr")
+    p_sweep.set_defaults(func=cmd_sweep, parser=p_sweep)
+
     args = parser.parse_args(argv)
     if not args.command:
         parser.print_help()
         return
-    args.func(args)
+    if args.command == "sweep":
+        if args.chunk_size < 1:
+            p_sweep.error("--chunk-size must be >= 1")
+        if args.workers < 1:
+            p_sweep.error("--workers must be >= 1")
+        return args.func(args)
+
+    # fără --input, parametrii sunt obligatorii; cu --input sunt valori implicite per înregistrare
+    sub = {"step": p_step, "optimize": p_opt}[args.command]
+    required = ("k", "P", "U", "theta") if args.command == "step" else ("theta", "mode")
+    missing = [f"--{name}" for name in required if getattr(args, name) is None]
+    if args.input is None and missing:
+        sub.error(f"the following arguments are required: {', '.join(missing)}")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        sub.error("--chunk-size must be >= 1")
+    if getattr(args, "workers", 1) < 1:
+        sub.error("--workers must be >= 1")
+
+    try:
+        args.func(args)
+    except RecordError as exc:
+        print(f"mobius-cli: error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    except BrokenPipeError:
+        # ieșirea a fost închisă (ex. `| head`); nu e o eroare
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(0)
 
 if __name__ == "__main__":
     main()
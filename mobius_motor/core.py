@@ -1,5 +1,10 @@
-from .time_formulas import time_wrap, time_steady, time_unwrap
-from .arbiter import phi_arbiter
+import numpy as np
+
+from .time_formulas import (
+    time_wrap_scalar, time_steady_scalar, time_unwrap_scalar,
+    time_wrap_array, time_steady_array, time_unwrap_array,
+)
+from .arbiter import phi_arbiter, phi_arbiter_array
 
 def motor_step(k: float, P: float, U: float, theta: float, low_threshold: float = 0.3, high_threshold: float = 0.7, T1: float = 1.0):
     """
@@ -29,10 +34,58 @@ def motor_step(k: float, P: float, U: float, theta: float, low_threshold: float
     # 2. Based on the state, calculate the corresponding Λ-Time.
     #    Pe baza stării, se calculează Λ-Time corespunzător.
     if state == 1:  # Λ-Wrap
-        lambda_time = time_wrap(T1, k, P, U)
+        lambda_time = time_wrap_scalar(T1, k, P, U)
     elif state == 0:  # Λ-Steady
-        lambda_time = time_steady(T1, U)
+        lambda_time = time_steady_scalar(T1, U)
     else:  # state == -1, Λ-Unwrap
-        lambda_time = time_unwrap(T1, k, P, U)
+        lambda_time = time_unwrap_scalar(T1, k, P, U)
         
     return lambda_time, state
+
+
+def motor_step_batch(k, P, U, theta, low_threshold: float = 0.3, high_threshold: float = 0.7, T1: float = 1.0):
+    """
+    Vectorized motor_step over equal-length arrays of (k, P, U, theta).
+
+    The Arbiter is evaluated for all elements at once and each temporal
+    formula is applied only to the elements of its state (boolean masks).
+    Results are bit-identical to calling motor_step element by element,
+    including np.inf for an invalid Wrap (k*P <= 1) and the capped partial
+    sum for a divergent Unwrap (|k*P| >= 1): the scalar and array kernels
+    use the same NumPy ufuncs (see time_formulas).
+
+    Args:
+        k, P, U, theta (array_like): Parameters, one element per evaluation.
+            Scalars are broadcast against the arrays.
+        low_threshold, high_threshold, T1 (float): Same as in motor_step.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - The Λ-Time values (float64).
+            - The Arbiter states (+1, 0, or -1) (int8).
+    """
+    k, P, U, theta = np.broadcast_arrays(
+        *np.atleast_1d(
+            np.asarray(k, dtype=float),
+            np.asarray(P, dtype=float),
+            np.asarray(U, dtype=float),
+            np.asarray(theta, dtype=float),
+        )
+    )
+
+    # 1. Arbiter pentru toate elementele.
+    states = phi_arbiter_array(theta, low_threshold, high_threshold)
+    values = np.empty(states.shape, dtype=float)
+
+    # 2. Fiecare formulă doar pe masca stării ei.
+    wrap = states == 1
+    steady = states == 0
+    unwrap = states == -1
+    if wrap.any():
+        values[wrap] = time_wrap_array(T1, k[wrap], P[wrap], U[wrap])
+    if steady.any():
+        values[steady] = time_steady_array(T1, U[steady])
+    if unwrap.any():
+        values[unwrap] = time_unwrap_array(T1, k[unwrap], P[unwrap], U[unwrap])
+
+    return values, states
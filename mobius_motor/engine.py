@@ -1,21 +1,116 @@
 # mobius_motor/engine.py
 # Λ-Möbius Engine Orchestrator – flux unificat
 
-from typing import Dict, Any
-from mobius_motor.arbiter import phi_arbiter
+import asyncio
+import contextvars
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+
+from mobius_motor.arbiter import phi_arbiter, phi_arbiter_array
 from mobius_motor.core import motor_step
 from mobius_motor.wrap import wrap_step
 from mobius_motor.steady import steady_step
 from mobius_motor.unwrap import unwrap_step
+from mobius_motor.cache import EvalCache
 from mobius_motor.regen import regen_cycle, Metrics
-from mobius_motor.balance import balance_step
+from mobius_motor.balance import balance_step, balance_batch
 from mobius_motor.optimize import lambda_optimize
-from mobius_motor.entropy import entropy_step
+from mobius_motor.entropy import entropy_step, entropy_batch
+from mobius_motor.instrumentation import ENGINE_STAGE_SECONDS
+from mobius_motor import tracing
 
 # praguri globale – se pot muta într-un config separat
 THETA_LOW = 0.3
 THETA_HIGH = 0.7
 
+STAGES = ("regen", "balance", "optimize", "entropy")
+
+
+def _timed(fn, *args, **kwargs):
+    # la nivel de modul → poate rula și într-un ProcessPoolExecutor
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def _base_stage(state: int, k: float, P: float, U: float, theta: float, iters: int) -> Dict[str, Any]:
+    with tracing.span("base"):
+        return _base_module(state, k, P, U, theta, iters)
+
+
+def _base_module(state: int, k: float, P: float, U: float, theta: float, iters: int) -> Dict[str, Any]:
+    if state == 1:
+        return wrap_step(k, P, U, theta, iters=iters)
+    if state == 0:
+        return steady_step(k, P, U, theta, iters=iters)
+    return unwrap_step(k, P, U, theta, iters=iters)
+
+
+def _stage_calls(
+    k: float, P: float, U: float, theta: float, state: int,
+    base_value: float, metrics: Metrics | None, cache: EvalCache | bool,
+) -> Dict[str, Tuple[Callable[..., Any], tuple, dict]]:
+    """Etapele de după modul de bază; depind doar de intrări (read-only)."""
+    calls: Dict[str, Tuple[Callable[..., Any], tuple, dict]] = {}
+    if metrics:
+        calls["regen"] = (regen_cycle, (k, P, U, metrics), {"cache": cache})
+    calls["balance"] = (balance_step, (k, P, U, theta), {"target_value": base_value})
+    calls["optimize"] = (
+        lambda_optimize, (),
+        {"initial_guess": (k, P, U), "theta": theta, "mode": "state", "desired_state": state, "cache": cache},
+    )
+    calls["entropy"] = (entropy_step, (k, P, U, theta), {"trials": 20, "perturb": 0.15})
+    return calls
+
+
+def _traced_call(fn: Callable[..., Any]) -> Callable[..., Any]:
+    # thread-urile executorului nu moștenesc contextul: îl copiem, ca span-urile
+    # etapelor să ajungă la hook-urile active (doar când tracing e activ)
+    return functools.partial(contextvars.copy_context().run, fn) if tracing.enabled() else fn
+
+
+def _make_executor(executor, max_workers: int | None, cache: EvalCache | bool) -> Tuple[Executor | None, bool]:
+    """(executor, owned) – `owned` = creat aici, deci trebuie închis aici."""
+    if executor is None or isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == "thread":
+        pool, owned = ThreadPoolExecutor(max_workers=max_workers or len(STAGES)), True
+    elif executor == "process":
+        pool, owned = ProcessPoolExecutor(max_workers=max_workers or len(STAGES)), True
+    else:
+        raise ValueError("executor must be None, 'thread', 'process' or an Executor")
+    if isinstance(pool, ProcessPoolExecutor) and isinstance(cache, EvalCache):
+        raise ValueError("an EvalCache instance cannot be shared with a process pool; use cache=True")
+    if isinstance(pool, ProcessPoolExecutor) and tracing.enabled():
+        if owned:
+            pool.shutdown()
+        raise ValueError("tracing is not supported with a process pool; use executor=None or 'thread'")
+    return pool, owned
+
+
+def _assemble(state: int, base: Dict[str, Any], outs: Dict[str, Any], times: Dict[str, float]) -> Dict[str, Any]:
+    for stage, seconds in times.items():
+        ENGINE_STAGE_SECONDS.observe(seconds, stage=stage)
+    return {
+        "arbiter_state": state,
+        "base": base,
+        "regen": outs.get("regen"),
+        "balance": outs["balance"],
+        "optimize": outs["optimize"],
+        "entropy": outs["entropy"],
+        "stage_times": times,
+    }
+
+
+def _trace_result(out: Dict[str, Any], collector: tracing.TimingCollector) -> Dict[str, Any]:
+    out["timings"] = collector.summary()
+    return out
+
+
 def run_engine(
     k: float,
     P: float,
@@ -23,50 +118,225 @@ def run_engine(
     theta: float,
     metrics: Metrics | None = None,
     iters: int = 100,
+    cache: EvalCache | bool = False,
+    executor: str | Executor | None = None,
+    max_workers: int | None = None,
+    trace: bool = False,
+    profile: str | None = None,
 ) -> Dict[str, Any]:
     """
     Orchestrator complet pentru Λ-Möbius Engine.
     Rulează Arbiter → modul de bază → regen/balance/optimize → entropy.
+    cache: cache-ul de evaluări pentru optimizări (vezi lambda_optimize).
+
+    executor: None → etapele rulează secvențial (implicit);
+    "thread" / "process" → regen, balance, optimize și entropy rulează
+    concurent pe un pool nou (doar balance depinde de modulul de bază, care
+    rulează primul); un Executor existent → refolosit (recomandat pentru
+    "process", ca să nu plătim pornirea proceselor la fiecare apel).
+    "stage_times" conține timpul de execuție (s) al fiecărei etape și "total".
+
+    trace: dacă e True, "timings" conține, per span (ex. "run_engine/regen/optimize"),
+    apelurile, timpul wall și CPU și iterațiile optimizerului (vezi
+    mobius_motor.tracing); nu e suportat cu un pool de procese.
+    profile: "cprofile" sau "tracemalloc" → raportul profiler-ului în "profile".
     """
-    # 1. Arbiter decide starea
-    state = phi_arbiter(theta, THETA_LOW, THETA_HIGH)
+    if profile is not None:
+        with tracing.profiled(profile) as report:
+            out = run_engine(k, P, U, theta, metrics, iters, cache, executor, max_workers, trace)
+        out["profile"] = report
+        return out
+    if trace:
+        with tracing.collect() as collector:
+            out = run_engine(k, P, U, theta, metrics, iters, cache, executor, max_workers)
+        return _trace_result(out, collector)
 
-    # 2. Rulăm modulul corespunzător
-    if state == 1:
-        base = wrap_step(k, P, U, theta, iters=iters)
-    elif state == 0:
-        base = steady_step(k, P, U, theta, iters=iters)
-    else:
-        base = unwrap_step(k, P, U, theta, iters=iters)
+    with tracing.span("run_engine"):
+        t0 = time.perf_counter()
 
-    # 3. Dacă avem metrice, rulăm regen
-    regen_out = None
-    if metrics:
-        regen_out = regen_cycle(k, P, U, metrics)
+        # 1. Arbiter decide starea
+        state = phi_arbiter(theta, THETA_LOW, THETA_HIGH)
 
-    # 4. Balance simplu spre valoarea de bază
-    balance_out = balance_step(k, P, U, theta, target_value=base["final_value"])
+        # 2. Rulăm modulul corespunzător
+        base, base_time = _timed(_base_stage, state, k, P, U, theta, iters)
 
-    # 5. Optimize pentru a verifica convergența
-    opt_out = lambda_optimize(
-        initial_guess=(k, P, U),
-        theta=theta,
-        mode="state",
-        desired_state=state,
-    )
+        # 3-6. regen (dacă avem metrice), balance spre valoarea de bază,
+        #      optimize pentru convergență, entropy pentru stres
+        calls = _stage_calls(k, P, U, theta, state, base["final_value"], metrics, cache)
+        pool, owned = _make_executor(executor, max_workers, cache)
+        try:
+            if pool is None:
+                done = {name: _timed(fn, *args, **kw) for name, (fn, args, kw) in calls.items()}
+            else:
+                futures = {
+                    name: pool.submit(_traced_call(_timed), fn, *args, **kw) for name, (fn, args, kw) in calls.items()
+                }
+                done = {name: fut.result() for name, fut in futures.items()}
+        finally:
+            if owned:
+                pool.shutdown()
 
-    # 6. Entropy test pentru stres
-    entropy_out = entropy_step(k, P, U, theta, trials=20, perturb=0.15)
+        # 7. Returnăm rezultatul complet
+        times = {"base": base_time, **{name: t for name, (_, t) in done.items()}}
+        times["total"] = time.perf_counter() - t0
+        return _assemble(state, base, {name: out for name, (out, _) in done.items()}, times)
+
+
+async def run_engine_async(
+    k: float,
+    P: float,
+    U: float,
+    theta: float,
+    metrics: Metrics | None = None,
+    iters: int = 100,
+    cache: EvalCache | bool = False,
+    executor: str | Executor | None = None,
+    max_workers: int | None = None,
+    trace: bool = False,
+) -> Dict[str, Any]:
+    """
+    Varianta async a lui run_engine, pentru un event loop: etapele rulează
+    în executor (None → executorul implicit al buclei) și sunt așteptate cu
+    asyncio.gather, fără a bloca bucla. Același rezultat ca run_engine
+    (inclusiv "timings" cu trace=True).
+    """
+    if trace:
+        with tracing.collect() as collector:
+            out = await run_engine_async(k, P, U, theta, metrics, iters, cache, executor, max_workers)
+        return _trace_result(out, collector)
+
+    with tracing.span("run_engine"):
+        t0 = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        state = phi_arbiter(theta, THETA_LOW, THETA_HIGH)
+        base, base_time = _timed(_base_stage, state, k, P, U, theta, iters)
+
+        calls = _stage_calls(k, P, U, theta, state, base["final_value"], metrics, cache)
+        pool, owned = _make_executor(executor, max_workers, cache)
+        try:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, functools.partial(_traced_call(_timed), fn, *args, **kw))
+                for fn, args, kw in calls.values()
+            ))
+        finally:
+            if owned:
+                pool.shutdown(wait=False)
+
+        done = dict(zip(calls, results))
+        times = {"base": base_time, **{name: t for name, (_, t) in done.items()}}
+        times["total"] = time.perf_counter() - t0
+        return _assemble(state, base, {name: out for name, (out, _) in done.items()}, times)
+
+
+def _canonical(x: float, decimals: int | None) -> float:
+    x = float(x)
+    return x if decimals is None else round(x, decimals)
+
+
+def run_engine_batch(
+    inputs: Iterable[Mapping[str, Any]],
+    iters: int = 100,
+    decimals: int | None = None,
+    cache: EvalCache | bool = False,
+    history: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    run_engine pentru o flotă de servicii, cu deduplicarea muncii comune.
+
+    inputs: dict-uri cu "k", "P", "U", "theta" și opțional "metrics"
+    (Metrics sau dict) și "iters". Cu `decimals`, (k, P, U, theta) sunt
+    rotunjite înainte de grupare, deci intrările aproape identice împart
+    aceeași cheie canonică (și sunt calculate în punctul rotunjit).
+
+    Fiecare sub-problemă unică e calculată o singură dată:
+      - optimize: după (k, P, U, stare) – depinde de theta doar prin banda
+        arbiterului; "theta" e rescris per intrare;
+      - regen: după (k, P, U, metrics);
+      - base / entropy: după (k, P, U, theta, iters);
+      - balance: după (k, P, U, theta, țintă), cu balance_batch vectorizat;
+      - entropy: toate cheile unice într-un singur apel entropy_batch.
+    Rezultatele se întorc în ordinea intrărilor, cu aceleași chei ca
+    run_engine, fără "stage_times". Intrările duplicate primesc dict-uri
+    de nivel superior separate, dar împart sub-rezultatele (read-only).
+
+    history: istoricul balance (listele de (k, P, U, Λ) din run_engine) doar
+    la cerere; implicit "history" e None și se păstrează doar starea finală
+    per serviciu, deci memoria nu crește cu iters · n.
+    """
+    rows = []
+    for item in inputs:
+        metrics = item.get("metrics")
+        if metrics is not None and not isinstance(metrics, Metrics):
+            metrics = Metrics(**metrics)
+        rows.append((
+            _canonical(item["k"], decimals),
+            _canonical(item["P"], decimals),
+            _canonical(item["U"], decimals),
+            _canonical(item["theta"], decimals),
+            metrics,
+            int(item.get("iters", iters)),
+        ))
+    if not rows:
+        return []
+
+    states = phi_arbiter_array([r[3] for r in rows], THETA_LOW, THETA_HIGH).tolist()
+
+    # base + entropy: cheie (k, P, U, theta, iters)
+    point_keys = list(dict.fromkeys((k, P, U, theta, it) for k, P, U, theta, _, it in rows))
+    point_state = {}
+    for (k, P, U, theta, _, it), st in zip(rows, states):
+        point_state[(k, P, U, theta, it)] = st
+    base = {key: _base_stage(point_state[key], *key) for key in point_keys}
+
+    kk, PP, UU, tt = (np.array(col, dtype=float) for col in zip(*(key[:4] for key in point_keys)))
+    entropy = dict(zip(point_keys, entropy_batch(kk, PP, UU, tt, trials=20, perturb=0.15)))
+
+    # balance: cheie (k, P, U, theta, țintă = valoarea de bază)
+    bal_keys = list(dict.fromkeys(key[:4] + (base[key]["final_value"],) for key in point_keys))
+    bk, bP, bU, bt, btarget = (np.array(col, dtype=float) for col in zip(*bal_keys))
+    bal = balance_batch(bk, bP, bU, bt, btarget, history=history)
+    balance = {}
+    for j, key in enumerate(bal_keys):
+        balance[key] = {
+            "params_final": {name: float(bal["params_final"][name][j]) for name in ("k", "P", "U")},
+            "final_value": float(bal["final_value"][j]),
+            "final_state": int(bal["final_state"][j]),
+            "loss": float(bal["loss"][j]),
+            "history": None,
+        }
+        if history:
+            steps = int(bal["iters"][j])
+            balance[key]["history"] = [tuple(row) for row in bal["history"][:steps, j].tolist()]
+
+    # optimize: cheie (k, P, U, stare)
+    optimize: Dict[tuple, Dict[str, Any]] = {}
+    regen: Dict[tuple, Dict[str, Any]] = {}
+    out: List[Dict[str, Any]] = []
+    for (k, P, U, theta, metrics, it), st in zip(rows, states):
+        opt_key = (k, P, U, st)
+        if opt_key not in optimize:
+            optimize[opt_key] = lambda_optimize(
+                initial_guess=(k, P, U), theta=theta, mode="state", desired_state=st, cache=cache,
+            )
+        regen_out = None
+        if metrics is not None:
+            regen_key = (k, P, U, metrics)
+            if regen_key not in regen:
+                regen[regen_key] = regen_cycle(k, P, U, metrics, cache=cache)
+            regen_out = regen[regen_key]
+
+        point = (k, P, U, theta, it)
+        out.append({
+            "arbiter_state": st,
+            "base": base[point],
+            "regen": regen_out,
+            "balance": balance[point[:4] + (base[point]["final_value"],)],
+            "optimize": dict(optimize[opt_key], theta=theta),
+            "entropy": entropy[point],
+        })
+    return out
 
-    # 7. Returnăm rezultatul complet
-    return {
-        "arbiter_state": state,
-        "base": base,
-        "regen": regen_out,
-        "balance": balance_out,
-        "optimize": opt_out,
-        "entropy": entropy_out,
-    }
 
 if __name__ == "__main__":
     # demo rapid
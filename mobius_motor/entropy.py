@@ -1,11 +1,81 @@
 # mobius_motor/entropy.py
 # Λ-Entropy – stres controlat (chaos testing, adversarial feedback)
 from __future__ import annotations
-import random
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
-from mobius_motor.core import motor_step
+import numpy as np
 
+from mobius_motor.core import motor_step_batch
+from mobius_motor.instrumentation import ENTROPY_RUNS, ENTROPY_TRIALS
+from mobius_motor.tracing import traced
+
+
+class StreamingStats:
+    """
+    Statistici calculate în flux, pe bucăți (chunks), fără a păstra toate valorile:
+      - medie și varianță (Welford / Chan, combinare pe bucăți);
+      - min, max, numărători per stare;
+      - cuantile dintr-un eșantion uniform de mărime fixă (bottom-k pe chei
+        aleatoare) – exacte cât timp numărul de valori <= sample_size.
+    """
+
+    def __init__(self, sample_size: int = 4096, rng: np.random.Generator | None = None):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.state_counts: Dict[int, int] = {}
+        self.sample_size = int(sample_size)
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._sample = np.empty(0)
+        self._keys = np.empty(0)
+
+    def update(self, values: np.ndarray, states: np.ndarray) -> None:
+        m = values.size
+        if m == 0:
+            return
+        with np.errstate(invalid="ignore", over="ignore"):
+            mean_b = float(np.mean(values))
+            m2_b = float(np.sum((values - mean_b) ** 2))
+            n = self.n + m
+            delta = mean_b - self.mean
+            if np.isfinite(delta):
+                self.mean += delta * m / n
+                self.m2 += m2_b + delta * delta * self.n * m / n
+            else:
+                # valori infinite (ex. Wrap invalid): media urmează suma, varianța e nedefinită
+                self.mean = (self.mean * self.n + mean_b * m) / n
+                self.m2 = np.nan
+        self.n = n
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+        found, counts = np.unique(states, return_counts=True)
+        for st, c in zip(found.tolist(), counts.tolist()):
+            self.state_counts[st] = self.state_counts.get(st, 0) + c
+
+        # eșantion uniform: păstrăm valorile cu cele mai mici chei aleatoare
+        keys = np.concatenate((self._keys, self._rng.random(m)))
+        sample = np.concatenate((self._sample, values))
+        if keys.size > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[: self.sample_size]
+            keys, sample = keys[keep], sample[keep]
+        self._keys, self._sample = keys, sample
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def quantiles(self, qs: Sequence[float]) -> Dict[str, float]:
+        if self._sample.size == 0:
+            return {str(q): float("nan") for q in qs}
+        with np.errstate(invalid="ignore"):
+            vals = np.quantile(self._sample, qs)
+        return {str(q): float(v) for q, v in zip(qs, vals)}
+
+
+@traced("entropy")
 def entropy_step(
     k: float,
     P: float,
@@ -13,30 +83,174 @@ def entropy_step(
     theta: float,
     trials: int = 50,
     perturb: float = 0.1,
+    seed: int | None = None,
+    chunk_size: int = 65536,
+    quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+    sample_size: int = 4096,
 ) -> Dict[str, object]:
     """
     Rulează mai multe încercări cu perturbații random pentru a testa reziliența.
-    Returnează istoric valori + statistici simple.
+    Returnează statistici simple.
+
+    Perturbațiile vin dintr-un numpy.random.Generator (seed explicit →
+    rezultat reproductibil, independent de chunk_size) și sunt evaluate
+    vectorizat, câte `chunk_size` încercări odată. Statisticile se calculează
+    în flux (vezi StreamingStats), deci memoria nu crește cu `trials`.
+    Când toate încercările încap într-un singur chunk și în eșantionul de
+    cuantile, statisticile se calculează direct (același rezultat, fără
+    costul fix al căii în flux).
+    """
+    if trials < 1:
+        raise ValueError("trials must be >= 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    if trials <= chunk_size and trials <= sample_size:
+        # un singur lot, eșantionul de cuantile ar fi oricum complet:
+        # statistici directe, fără StreamingStats (ex. cele 20 de încercări din run_engine).
+        # Primul copil al SeedSequence(seed) = noise_seq de mai jos, fără spawn.
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(0,)))
+        return _entropy_single_batch(k, P, U, theta, trials, perturb, seed, quantiles, rng)
+
+    # fluxuri separate pentru perturbații și eșantionul de cuantile
+    noise_seq, sample_seq = np.random.SeedSequence(seed).spawn(2)
+    rng = np.random.default_rng(noise_seq)
+    stats = StreamingStats(sample_size, np.random.default_rng(sample_seq))
+
+    done = 0
+    while done < trials:
+        m = min(chunk_size, trials - done)
+        # (m, 3): k, P, U pentru fiecare încercare, în ordinea fluxului
+        noise = 1.0 + rng.uniform(-perturb, perturb, size=(m, 3))
+        values, states = motor_step_batch(k * noise[:, 0], P * noise[:, 1], U * noise[:, 2], theta)
+        stats.update(values, states)
+        done += m
+    ENTROPY_RUNS.inc()
+    ENTROPY_TRIALS.inc(trials)
+
+    return {
+        "avg_value": float(stats.mean),
+        "min_value": stats.min,
+        "max_value": stats.max,
+        "std_value": float(np.sqrt(stats.variance)),
+        "quantiles": stats.quantiles(quantiles),
+        "state_counts": {st: stats.state_counts[st] for st in sorted(stats.state_counts)},
+        "distinct_states": sorted(stats.state_counts),
+        "trials": trials,
+        "perturb": perturb,
+        "seed": seed,
+    }
+
+
+def _sorted_quantiles(ordered: np.ndarray, qs: Sequence[float]) -> np.ndarray:
+    """
+    np.quantile (metoda "linear") pe un eșantion deja sortat, fără partiționare;
+    interpolarea e aceeași ca în numpy, deci rezultatele sunt identice.
     """
-    values: List[float] = []
-    states: List[int] = []
+    q = np.asarray(qs, dtype=float)
+    if np.isnan(ordered[-1]):
+        return np.full(q.shape, np.nan)
+    virtual = q * (ordered.size - 1)
+    lo = np.floor(virtual).astype(np.intp)
+    hi = np.minimum(lo + 1, ordered.size - 1)
+    t = virtual - lo
+    a, b = ordered[lo], ordered[hi]
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
 
-    for _ in range(trials):
-        k_pert = k * (1.0 + random.uniform(-perturb, perturb))
-        P_pert = P * (1.0 + random.uniform(-perturb, perturb))
-        U_pert = U * (1.0 + random.uniform(-perturb, perturb))
-        val, st = motor_step(k=k_pert, P=P_pert, U=U_pert, theta=theta)
-        values.append(val)
-        states.append(st)
 
-    avg_val = sum(values) / len(values)
-    distinct_states = sorted(set(states))
+def _entropy_single_batch(
+    k: float,
+    P: float,
+    U: float,
+    theta: float,
+    trials: int,
+    perturb: float,
+    seed: int | None,
+    quantiles: Sequence[float],
+    rng: np.random.Generator,
+) -> Dict[str, object]:
+    """
+    Ramura rapidă a entropy_step: aceleași perturbații ca primul chunk al
+    căii în flux, statistici calculate direct pe tot eșantionul.
+    """
+    noise = 1.0 + rng.uniform(-perturb, perturb, size=(trials, 3))
+    values, states = motor_step_batch(k * noise[:, 0], P * noise[:, 1], U * noise[:, 2], theta)
+    # o singură sortare dă min, max și cuantilele (NaN ajunge la final)
+    ordered = np.sort(values)
+    with np.errstate(invalid="ignore", over="ignore"):
+        avg = float(np.mean(values))
+        dev = values - avg
+        std = float(np.sqrt(np.dot(dev, dev) / (trials - 1))) if trials > 1 else 0.0
+        qs = _sorted_quantiles(ordered, quantiles)
+    # stările sunt -1, 0, +1 → indici 0..2
+    counts = np.bincount(states.astype(np.intp) + 1, minlength=3).tolist()
+    state_counts = {st: c for st, c in zip((-1, 0, 1), counts) if c}
+    ENTROPY_RUNS.inc()
+    ENTROPY_TRIALS.inc(trials)
 
     return {
-        "avg_value": avg_val,
-        "min_value": min(values),
-        "max_value": max(values),
-        "distinct_states": distinct_states,
+        "avg_value": avg,
+        "min_value": float(ordered[-1] if np.isnan(ordered[-1]) else ordered[0]),
+        "max_value": float(ordered[-1]),
+        "std_value": std,
+        "quantiles": {str(q): float(v) for q, v in zip(quantiles, qs)},
+        "state_counts": state_counts,
+        "distinct_states": list(state_counts),
         "trials": trials,
         "perturb": perturb,
+        "seed": seed,
     }
+
+
+def entropy_batch(
+    k,
+    P,
+    U,
+    theta,
+    trials: int = 50,
+    perturb: float = 0.1,
+    seed: int | None = None,
+    quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+) -> List[Dict[str, object]]:
+    """
+    entropy_step pentru n seturi de parametri deodată: toate cele n·trials
+    încercări sunt evaluate într-un singur apel motor_step_batch.
+    Pentru loturi mici de încercări (ex. 20 în run_engine); statisticile sunt
+    calculate pe tot eșantionul, deci cuantilele sunt exacte.
+    Returnează câte un dict cu aceleași chei ca entropy_step.
+    """
+    if trials < 1:
+        raise ValueError("trials must be >= 1")
+    k, P, U, theta = (np.asarray(a, dtype=float) for a in np.broadcast_arrays(*np.atleast_1d(k, P, U, theta)))
+    n = k.shape[0]
+
+    rng = np.random.default_rng(seed)
+    noise = 1.0 + rng.uniform(-perturb, perturb, size=(n, trials, 3))
+    values, states = motor_step_batch(
+        k[:, None] * noise[..., 0], P[:, None] * noise[..., 1], U[:, None] * noise[..., 2], theta[:, None]
+    )
+    with np.errstate(invalid="ignore", over="ignore"):
+        avg = values.mean(axis=1)
+        std = values.std(axis=1, ddof=1) if trials > 1 else np.zeros(n)
+        qs = np.quantile(values, quantiles, axis=1)
+    mins, maxs = values.min(axis=1), values.max(axis=1)
+    ENTROPY_RUNS.inc(n)
+    ENTROPY_TRIALS.inc(n * trials)
+
+    out = []
+    for i in range(n):
+        found, counts = np.unique(states[i], return_counts=True)
+        out.append({
+            "avg_value": float(avg[i]),
+            "min_value": float(mins[i]),
+            "max_value": float(maxs[i]),
+            "std_value": float(std[i]),
+            "quantiles": {str(q): float(v) for q, v in zip(quantiles, qs[:, i])},
+            "state_counts": dict(zip(found.tolist(), counts.tolist())),
+            "distinct_states": found.tolist(),
+            "trials": trials,
+            "perturb": perturb,
+            "seed": seed,
+        })
+    return out
@@ -0,0 +1,101 @@
+# mobius_motor/feasibility.py
+# Λ-Feasibility – pre-analiză pentru lambda_optimize(mode="state")
+"""
+Starea arbiterului depinde doar de theta, pe care optimizerul nu îl
+modifică. Deci pentru mode="state" cererea e fie:
+
+  - "infeasible": phi_arbiter(theta) != desired_state, oricare ar fi (k, P, U);
+                  tie-break-ul min |Λ| se aplică totuși stării alese de Arbiter;
+  - "satisfied":  starea e deja cea dorită și rămâne doar tie-break-ul
+                  min |Λ| pe `bounds`, care e monoton pe fiecare stare:
+                    Steady: Λ crește cu U            → U = U_min
+                    Wrap:   Λ scade cu k·P (kP > 1)  → k = k_max, P = P_max, U = U_min
+                    Unwrap: Λ crește cu k·P pe fiecare ramură (convergentă /
+                            divergentă) → comparăm k·P minim cu k·P = 1
+  - "searchable": monotonia nu e garantată (bounds ne-pozitive pentru k, P
+                  sau T1 <= 0) → rămâne căutarea numerică.
+"""
+
+from __future__ import annotations
+from typing import Dict, Tuple
+
+from mobius_motor.arbiter import phi_arbiter
+from mobius_motor.core import motor_step
+
+Bounds = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]
+Params = Tuple[float, float, float]
+
+_STATE_NAMES = {1: "Λ-Wrap", 0: "Λ-Steady", -1: "Λ-Unwrap"}
+
+
+def _theta_range(state: int, low: float, high: float) -> str:
+    if state == 1:
+        return f"theta >= {high}"
+    if state == 0:
+        return f"{low} <= theta < {high}"
+    return f"theta < {low}"
+
+
+def _min_abs_lambda(
+    state: int, start: Params, theta: float, bounds: Bounds, low: float, high: float, T1: float
+) -> Params | None:
+    (k_lo, k_hi), (p_lo, p_hi), (u_lo, u_hi) = bounds
+    if T1 <= 0 or k_lo <= 0 or p_lo <= 0:
+        return None
+
+    if state == 0:
+        return start[0], start[1], u_lo
+    if state == 1:
+        # k·P maxim (dacă nici acesta nu e > 1, Λ = inf peste tot)
+        return (k_hi, p_hi, u_lo) if k_hi * p_hi > 1 else start
+
+    # Unwrap: ramura convergentă (k·P minim) vs. ramura divergentă (k·P = 1)
+    candidates = [(k_lo, p_lo, u_lo)]
+    if k_lo * p_lo < 1 <= k_hi * p_hi:
+        P_one = 1 / k_lo
+        candidates.append((k_lo, P_one, u_lo) if P_one <= p_hi else (1 / p_hi, p_hi, u_lo))
+    return min(candidates, key=lambda c: abs(motor_step(*c, theta, low, high, T1)[0]))
+
+
+def analyze_state_request(
+    start: Params,
+    theta: float,
+    desired_state: int,
+    bounds: Bounds = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0)),
+    low_threshold: float = 0.3,
+    high_threshold: float = 0.7,
+    T1: float = 1.0,
+) -> Dict[str, object]:
+    """
+    Clasifică o cerere mode="state" fără a rula căutarea.
+    Returnează {"status", "reason", "state", "params"}; "params" e
+    minimul analitic al lui |Λ| pe `bounds` pentru starea aleasă de Arbiter
+    ("satisfied" și "infeasible"; None dacă monotonia nu e garantată).
+    """
+    state = phi_arbiter(theta, low_threshold, high_threshold)
+    params = _min_abs_lambda(state, start, theta, bounds, low_threshold, high_threshold, T1)
+    if state != desired_state:
+        return {
+            "status": "infeasible",
+            "reason": (
+                f"theta={theta} selects {_STATE_NAMES[state]} ({state}); "
+                f"desired_state={desired_state} requires {_theta_range(desired_state, low_threshold, high_threshold)}"
+                " and the optimizer does not change theta"
+            ),
+            "state": state,
+            "params": params,
+        }
+
+    if params is None:
+        return {
+            "status": "searchable",
+            "reason": "non-positive k/P bounds or T1: |Λ| is not monotone, numeric search required",
+            "state": state,
+            "params": None,
+        }
+    return {
+        "status": "satisfied",
+        "reason": f"theta already selects {_STATE_NAMES[state]}; |Λ| minimised analytically over bounds",
+        "state": state,
+        "params": params,
+    }
@@ -0,0 +1,178 @@
+# mobius_motor/gradient.py
+"""
+Λ-Gradient – derivatele analitice ale formulelor Λ (time_formulas.py).
+
+Cu L = log(safe_U) și x = k·P (∂x/∂k = P, ∂x/∂P = k):
+
+  Steady:                Λ = T1·L                  ∂Λ/∂U = T1/U
+  Wrap   (x > 1):        Λ = T1·L·x/(x - 1)        ∂Λ/∂x = -T1·L/(x - 1)²
+                                                   ∂Λ/∂U = T1/(U·(1 - 1/x))
+  Unwrap (|x| < 1):      Λ = T1·L/(1 - x)          ∂Λ/∂x = T1·L/(1 - x)²
+                                                   ∂Λ/∂U = T1/(U·(1 - x))
+  Unwrap (|x| >= 1):     Λ = T1·L·S(x),  S = (xⁿ - 1)/(x - 1)
+                         S'(x) = (n·xⁿ⁻¹·(x - 1) - (xⁿ - 1))/(x - 1)²,  S'(1) = n(n-1)/2
+
+Pentru U < 1, safe_U e constant, deci ∂Λ/∂U = 0; în U = 1 (limita de jos
+uzuală din bounds) folosim derivata la dreapta, 1/U, ca optimizerul să nu
+rămână blocat în colț. Un Wrap invalid
+(x <= 1, Λ = inf) nu are gradient: componentele sunt NaN.
+Gradientul e calculat pe fiecare stare în parte (arbiterul e constant
+în theta, care nu e variabilă de optimizare).
+
+Ca în time_formulas: un kernel scalar cu `math` (lambda_gradient_scalar,
+folosit de optimizer pentru un singur punct) și kernelurile NumPy
+vectorizate (lambda_gradient).
+"""
+
+from __future__ import annotations
+import math
+from typing import Tuple
+
+import numpy as np
+
+from mobius_motor.arbiter import phi_arbiter_array
+from mobius_motor.core import motor_step
+from mobius_motor.time_formulas import (
+    LOG_U_STABILITY_FACTOR,
+    _partial_geometric_sum,
+    _partial_geometric_sum_array,
+    _safe_log_U_array,
+    time_steady_array,
+    time_unwrap_array,
+    time_wrap_array,
+)
+
+Grad = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+# ==========
+# Kernel scalar (math)
+# ==========
+def _partial_geometric_sum_derivative_scalar(x: float, n: int) -> float:
+    if x == 1:
+        return n * (n - 1) / 2.0
+    try:
+        xn1 = x ** (n - 1)
+        return (n * xn1 * (x - 1) - (xn1 * x - 1)) / (x - 1) ** 2
+    except OverflowError:
+        return math.inf if x > 0 or n % 2 == 0 else -math.inf
+
+
+def lambda_gradient_scalar(
+    k: float, P: float, U: float, theta: float,
+    low_threshold: float = 0.3,
+    high_threshold: float = 0.7,
+    T1: float = 1.0,
+) -> Tuple[float, Tuple[float, float, float], int]:
+    """Varianta scalară (doar `math`) a lui lambda_gradient: (Λ, (∂k, ∂P, ∂U), stare)."""
+    value, state = motor_step(k, P, U, theta, low_threshold, high_threshold, T1)
+    x = k * P
+    L = math.log(U if U > 1 else 1 + LOG_U_STABILITY_FACTOR)
+    dL = 1.0 / U if U >= 1 else 0.0
+
+    if state == 0:
+        return value, (0.0, 0.0, T1 * dL), state
+    if state == 1:
+        if x <= 1:
+            return value, (math.nan, math.nan, math.nan), state
+        dx = -T1 * L / (x - 1) ** 2
+        dU = T1 * dL / (1 - 1 / x)
+    elif abs(x) < 1:
+        dx = T1 * L / (1 - x) ** 2
+        dU = T1 * dL / (1 - x)
+    else:
+        dx = T1 * L * _partial_geometric_sum_derivative_scalar(x, 100)
+        dU = T1 * dL * _partial_geometric_sum(x, 100)
+    return value, (dx * P, dx * k, dU), state
+
+
+# ==========
+# Kernel vectorizat (NumPy arrays)
+# ==========
+def _dlog_U(U: np.ndarray) -> np.ndarray:
+    return np.where(U >= 1, 1.0 / np.where(U >= 1, U, 1.0), 0.0)
+
+
+def _chain(dx: np.ndarray, k: np.ndarray, P: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return dx * P, dx * k
+
+
+def time_wrap_grad(T1, k, P, U) -> Grad:
+    """(∂Λ/∂k, ∂Λ/∂P, ∂Λ/∂U) pentru Λ-Wrap; NaN unde k·P <= 1."""
+    x = k * P
+    L = _safe_log_U_array(U)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dx = -T1 * L / (x - 1) ** 2
+        dU = T1 * _dlog_U(U) / (1 - 1 / x)
+    invalid = x <= 1
+    dx = np.where(invalid, np.nan, dx)
+    dU = np.where(invalid, np.nan, dU)
+    return (*_chain(dx, k, P), dU)
+
+
+def time_steady_grad(T1, k, P, U) -> Grad:
+    """(∂Λ/∂k, ∂Λ/∂P, ∂Λ/∂U) pentru Λ-Steady (k, P nu intervin)."""
+    zero = np.zeros(np.shape(U))
+    return zero, zero.copy(), T1 * _dlog_U(U)
+
+
+def _partial_geometric_sum_derivative(x: np.ndarray, n: int) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        xn1 = np.power(x, float(n - 1))
+        out = (n * xn1 * (x - 1) - (xn1 * x - 1)) / (x - 1) ** 2
+    return np.where(x == 1, n * (n - 1) / 2.0, out)
+
+
+def time_unwrap_grad(T1, k, P, U, max_iter=100) -> Grad:
+    """(∂Λ/∂k, ∂Λ/∂P, ∂Λ/∂U) pentru Λ-Unwrap (ramura convergentă sau suma parțială)."""
+    x = k * P
+    L = _safe_log_U_array(U)
+    dL = _dlog_U(U)
+    divergent = np.abs(x) >= 1
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        conv = np.where(divergent, 0.0, 1 - x)
+        dx = np.where(divergent, 0.0, T1 * L / conv ** 2)
+        dU = np.where(divergent, 0.0, T1 * dL / conv)
+        if divergent.any():
+            xd = x[divergent]
+            dx[divergent] = T1 * L[divergent] * _partial_geometric_sum_derivative(xd, max_iter)
+            dU[divergent] = T1 * dL[divergent] * _partial_geometric_sum_array(xd, max_iter)
+    return (*_chain(dx, k, P), dU)
+
+
+def lambda_gradient(
+    k, P, U, theta,
+    low_threshold: float = 0.3,
+    high_threshold: float = 0.7,
+    T1: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Valoarea și gradientul lui Λ față de (k, P, U), vectorizat (ca motor_step_batch).
+
+    Returns:
+        (values, grad, states): values float64 (n,), grad float64 (n, 3) cu
+        coloanele (∂Λ/∂k, ∂Λ/∂P, ∂Λ/∂U), states int8 (n,).
+    """
+    k, P, U, theta = np.broadcast_arrays(
+        *np.atleast_1d(
+            np.asarray(k, dtype=float),
+            np.asarray(P, dtype=float),
+            np.asarray(U, dtype=float),
+            np.asarray(theta, dtype=float),
+        )
+    )
+    states = phi_arbiter_array(theta, low_threshold, high_threshold)
+    values = np.empty(states.shape, dtype=float)
+    grad = np.empty(states.shape + (3,), dtype=float)
+
+    for state, value_fn, grad_fn in (
+        (1, lambda m: time_wrap_array(T1, k[m], P[m], U[m]), time_wrap_grad),
+        (0, lambda m: time_steady_array(T1, U[m]), time_steady_grad),
+        (-1, lambda m: time_unwrap_array(T1, k[m], P[m], U[m]), time_unwrap_grad),
+    ):
+        mask = states == state
+        if mask.any():
+            values[mask] = value_fn(mask)
+            grad[mask] = np.stack(grad_fn(T1, k[mask], P[mask], U[mask]), axis=-1)
+
+    return values, grad, states
@@ -0,0 +1,195 @@
+# mobius_motor/instrumentation.py
+"""
+Λ-Instrumentation – contoare și histograme în proces, exportate în
+formatul text Prometheus (fără dependențe și fără serviciu extern).
+
+Costul unei înregistrări e o căutare în dict și un lock (~1 µs), deci
+instrumentarea poate rămâne activă sub încărcare; ENABLED = False o
+dezactivează complet (inc / observe devin no-op).
+
+    REGISTRY.counter("x_total", "help", ("label",)).inc(label="a")
+    REGISTRY.histogram("y_seconds", "help", buckets=LATENCY_BUCKETS).observe(0.01)
+    REGISTRY.render()   # → text pentru /metrics
+"""
+
+from __future__ import annotations
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+ENABLED = True
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ITERATION_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2000, 5000)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(x: float) -> str:
+    if math.isinf(x):
+        return "+Inf" if x > 0 else "-Inf"
+    return repr(float(x)) if not float(x).is_integer() else str(int(x))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> Labels:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if not ENABLED:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label: [numărători per bucket (ne-cumulative, + ultimul = +Inf), sumă]
+        self._values: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        if not ENABLED:
+            return
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][i] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: object) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s[0])) for k, (c, s) in self._values.items())
+        lines = self.header()
+        for key, (counts, total) in items:
+            cumulative = 0
+            for le, c in zip(self.buckets + (math.inf,), counts):
+                cumulative += c
+                le_label = 'le="' + _format_value(le) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Colecția de metrici a procesului; counter/histogram sunt get-or-create."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._gauges: List[Tuple[str, str, Sequence[str], Callable[[], Dict[Labels, float]]]] = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name!r} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labelnames, buckets)
+
+    def gauge_callback(
+        self, name: str, help: str, labelnames: Sequence[str], fn: Callable[[], Dict[Labels, float]]
+    ) -> None:
+        """Gauge citit la fiecare export: fn() → {valori etichete: valoare}."""
+        with self._lock:
+            self._gauges = [g for g in self._gauges if g[0] != name] + [(name, help, tuple(labelnames), fn)]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+            gauges = list(self._gauges)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for name, help, labelnames, fn in gauges:
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+            lines += [f"{name}{_format_labels(labelnames, key)} {_format_value(v)}" for key, v in sorted(fn().items())]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# metricile nucleului (motor); API-ul își înregistrează propriile metrici
+OPTIMIZE_ITERATIONS = REGISTRY.histogram(
+    "mobius_optimize_iterations", "lambda_optimize iterations per run", ("method", "mode"), ITERATION_BUCKETS
+)
+OPTIMIZE_RUNS = REGISTRY.counter(
+    "mobius_optimize_runs_total", "lambda_optimize runs by termination reason", ("method", "mode", "termination")
+)
+ENGINE_STAGE_SECONDS = REGISTRY.histogram(
+    "mobius_engine_stage_seconds", "run_engine stage durations", ("stage",)
+)
+ENTROPY_TRIALS = REGISTRY.counter("mobius_entropy_trials_total", "Perturbed entropy trials evaluated")
+ENTROPY_RUNS = REGISTRY.counter("mobius_entropy_runs_total", "entropy_step / entropy_batch parameter sets")
+REGEN_SEVERITY = REGISTRY.counter("mobius_regen_cycles_total", "regen_cycle runs by detected severity", ("severity",))
+ARBITER_STATES = REGISTRY.counter("mobius_arbiter_states_total", "Arbiter decisions served by state", ("state",))
+
+
+def observe_optimize(res: Dict[str, object]) -> None:
+    """Înregistrează un rezultat lambda_optimize (iterații + motivul opririi)."""
+    OPTIMIZE_ITERATIONS.observe(res["iters"], method=res["method"], mode=res["mode"])
+    OPTIMIZE_RUNS.inc(method=res["method"], mode=res["mode"], termination=res["termination"])
@@ -0,0 +1,117 @@
+# mobius_motor/inverse.py
+# Λ-Inverse – soluții analitice pentru lambda_optimize(mode="value")
+"""
+Pentru o stare fixată de arbiter (ea depinde doar de theta), Λ are formă
+închisă și se poate inversa direct:
+
+  Steady:            Λ = T1·log U                 → U  = exp(Λ / T1)
+  Wrap   (kP > 1):   Λ = T1·log U / (1 - 1/kP)    → U  = exp(Λ·(1 - 1/kP) / T1)
+                                                    kP = r / (r - 1),  r = Λ / (T1·log U)
+  Unwrap (|kP| < 1): Λ = T1·log U / (1 - kP)      → U  = exp(Λ·(1 - kP) / T1)
+                                                    kP = 1 - T1·log U / Λ
+
+Se încearcă întâi U (cu k, P din punctul de start), apoi k·P (cu U fixat,
+modificând P, apoi k). Fiecare candidat e verificat cu motor_step: trebuie
+să fie în `bounds`, în starea cerută și să atingă ținta. Dacă niciunul nu
+merge, solve_value întoarce None și lambda_optimize revine la căutare.
+"""
+
+from __future__ import annotations
+import math
+from typing import Iterator, Tuple
+
+from mobius_motor.arbiter import phi_arbiter
+from mobius_motor.core import motor_step
+from mobius_motor.time_formulas import LOG_U_STABILITY_FACTOR
+
+Bounds = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]
+Params = Tuple[float, float, float]
+
+# toleranța relativă la care o soluție analitică e considerată exactă
+REL_TOL = 1e-9
+
+
+def _exp(x: float) -> float | None:
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return None
+
+
+def _candidates(state: int, target: float, T1: float, k0: float, P0: float, U0: float) -> Iterator[Params]:
+    log_U0 = math.log(U0 if U0 > 1 else 1 + LOG_U_STABILITY_FACTOR)
+    kp0 = k0 * P0
+
+    if state == 0:
+        U = _exp(target / T1)
+        if U is not None:
+            yield k0, P0, U
+        return
+
+    # 1) rezolvăm U, cu k·P din punctul de start
+    if state == 1 and kp0 > 1:
+        U = _exp(target * (1 - 1 / kp0) / T1)
+    elif state == -1 and abs(kp0) < 1:
+        U = _exp(target * (1 - kp0) / T1)
+    else:
+        U = None
+    if U is not None:
+        yield k0, P0, U
+
+    # 2) rezolvăm k·P, cu U din punctul de start
+    if target == 0:
+        return
+    if state == 1:
+        r = target / (T1 * log_U0)
+        if r <= 1:
+            return
+        kp = r / (r - 1)
+    else:
+        kp = 1 - T1 * log_U0 / target
+        if not abs(kp) < 1:
+            return
+    if k0 != 0:
+        yield k0, kp / k0, U0
+    if P0 != 0:
+        yield kp / P0, P0, U0
+
+
+def _in_bounds(params: Params, bounds: Bounds) -> bool:
+    return all(lo <= x <= hi for x, (lo, hi) in zip(params, bounds))
+
+
+def solve_value(
+    initial_guess: Params,
+    theta: float,
+    target: float,
+    desired_state: int | None = None,
+    bounds: Bounds = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0)),
+    low_threshold: float = 0.3,
+    high_threshold: float = 0.7,
+    T1: float = 1.0,
+) -> Params | None:
+    """
+    Caută analitic (k, P, U) în `bounds` cu motor_step(...) == target
+    (în limita REL_TOL) și starea == desired_state (dacă e setată).
+    Returnează None dacă ținta nu e atinsă analitic.
+    """
+    state = phi_arbiter(theta, low_threshold, high_threshold)
+    if desired_state is not None and desired_state != state:
+        return None
+    if T1 == 0 or not math.isfinite(target):
+        return None
+
+    (k_lo, k_hi), (p_lo, p_hi), (u_lo, u_hi) = bounds
+    k0, P0, U0 = initial_guess
+    k0 = min(max(k0, k_lo), k_hi)
+    P0 = min(max(P0, p_lo), p_hi)
+    U0 = min(max(U0, u_lo), u_hi)
+
+    tol = REL_TOL * max(1.0, abs(target))
+    for params in _candidates(state, target, T1, k0, P0, U0):
+        if not _in_bounds(params, bounds):
+            continue
+        val, st = motor_step(*params, theta, low_threshold, high_threshold, T1)
+        if st == state and abs(val - target) <= tol:
+            return params
+    return None
@@ -0,0 +1,44 @@
+# mobius_motor/jsonio.py
+"""
+Λ-JSON – serializarea comună pentru API (aios.serialization) și CLI (records).
+
+  - dumps(content): JSON compact (bytes); orjson dacă e instalat (extra
+    "fast"), altfel encoder-ul json standard, cu același format. Pe ambele
+    căi valorile ne-finite (ex. Λ = inf pentru un Wrap invalid) devin null,
+    iar cheile ne-string (ex. state_counts din entropy, {-1: 3}) devin
+    string-uri, deci ieșirea nu depinde de prezența lui orjson.
+  - json_safe(value): copia lui `value` cu inf / nan înlocuite cu None.
+"""
+
+from __future__ import annotations
+import json
+import math
+from typing import Any
+
+try:  # dependență opțională (extra "fast"); serializează inf / nan ca null
+    import orjson
+except ImportError:  # pragma: no cover - depinde de mediu
+    orjson = None
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def json_safe(value: Any) -> Any:
+    """`value` cu float-urile ne-finite (inf / nan) înlocuite cu None, recursiv."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(v) for v in value]
+    return value
+
+
+def dumps(content: Any) -> bytes:
+    """JSON compact (bytes), inf / nan → null, chei int → string; orjson dacă e disponibil."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    try:
+        return _ENCODER.encode(content).encode("utf-8")
+    except ValueError:  # valori ne-finite (rar: doar Wrap invalid)
+        return _ENCODER.encode(json_safe(content)).encode("utf-8")
@@ -0,0 +1,146 @@
+# mobius_motor/records.py
+"""
+Λ-Records – intrare / ieșire în flux pentru CLI (CSV sau NDJSON).
+
+  - read_records(stream, fmt): generator de dict-uri, câte unul per
+    rând / linie, cu numărul liniei ("__line__") pentru mesajele de eroare;
+  - RecordWriter(stream, fmt, fields): scrie rânduri pe măsură ce sunt gata
+    (NDJSON: jsonio.dumps, ca în API – valorile ne-finite devin null);
+  - chunked(it, n): liste de câte n elemente, deci memoria rămâne mărginită
+    indiferent de mărimea fișierului.
+
+"-" înseamnă stdin / stdout.
+"""
+
+from __future__ import annotations
+import csv
+import io
+import json
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Sequence
+
+from mobius_motor.jsonio import dumps
+
+FORMATS = ("csv", "ndjson")
+LINE = "__line__"
+
+
+class RecordError(ValueError):
+    """Înregistrare invalidă în fișierul de intrare (mesajul include linia)."""
+
+
+def guess_format(path: str | None, fmt: str | None = None, default: str = "ndjson") -> str:
+    """Formatul explicit, altfel după extensie (.csv / .ndjson / .jsonl), altfel `default`."""
+    if fmt is not None:
+        if fmt not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}")
+        return fmt
+    if path and path != "-":
+        lower = path.lower()
+        if lower.endswith(".csv"):
+            return "csv"
+        if lower.endswith((".ndjson", ".jsonl")):
+            return "ndjson"
+    return default
+
+
+@contextmanager
+def open_input(path: str) -> Iterator[IO[str]]:
+    if path == "-":
+        yield sys.stdin
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        yield f
+
+
+@contextmanager
+def open_output(path: str | None) -> Iterator[IO[str]]:
+    if path is None or path == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        yield f
+
+
+def read_records(stream: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    """Înregistrările din `stream`; liniile goale sunt sărite. Câmpurile CSV goale lipsesc."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            rec = {k.strip(): v for k, v in row.items() if k is not None and v not in (None, "")}
+            if rec:
+                rec[LINE] = reader.line_num
+                yield rec
+        return
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise RecordError(f"line {line_no}: invalid JSON ({exc.msg})") from None
+        if not isinstance(rec, dict):
+            raise RecordError(f"line {line_no}: expected a JSON object")
+        rec[LINE] = line_no
+        yield rec
+
+
+def field(rec: Dict[str, Any], name: str, cast=float, default: Any = None, required: bool = False) -> Any:
+    """rec[name] convertit cu `cast`; lipsă / null → default (sau RecordError dacă e required)."""
+    value = rec.get(name)
+    if value is None:
+        if required and default is None:
+            raise RecordError(f"line {rec.get(LINE, '?')}: missing field {name!r}")
+        return default
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise RecordError(f"line {rec.get(LINE, '?')}: invalid value for {name!r}: {value!r}") from None
+
+
+def chunked(iterable: Iterable[Any], n: int) -> Iterator[List[Any]]:
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+class RecordWriter:
+    """
+    Scrie rânduri în `stream`: CSV cu antetul `fields` (câmpurile în plus sunt
+    ignorate, cele lipsă rămân goale) sau NDJSON (rândul întreg).
+    """
+
+    def __init__(self, stream: IO[str], fmt: str, fields: Sequence[str]):
+        if fmt not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}")
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = tuple(fields)
+        self.count = 0
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=self.fields, extrasaction="ignore", lineterminator="\n")
+            self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.write_many((row,))
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        if self._csv is not None:
+            for row in rows:
+                self._csv.writerow(row)
+                self.count += 1
+            return
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(dumps(row).decode("utf-8"))
+            buf.write("\n")
+            self.count += 1
+        self.stream.write(buf.getvalue())
+
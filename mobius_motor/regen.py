@@ -5,18 +5,24 @@ Implementare minimă, deterministă, fără dependențe externe.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from mobius_motor.core import motor_step
+from mobius_motor.cache import EvalCache
 from mobius_motor.optimize import lambda_optimize
 from mobius_motor.arbiter import phi_arbiter
+from mobius_motor.instrumentation import REGEN_SEVERITY
+from mobius_motor import tracing
 
 
 # ==========
 # 1) INPUT METRICS + PRAGURI
 # ==========
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metrics:
     error_rate: float          # 0..1
     latency_p95_ms: float      # ms
@@ -32,54 +38,151 @@ DRIFT_HIGH = 0.30     # >30% drift
 THETA_LOW = 0.30
 THETA_HIGH = 0.70
 
+_FIELDS = tuple(f.name for f in fields(Metrics))
+# severitate pentru fiecare bitmask de 5 motive: 0, 1 sau 2 (>= 2 motive)
+_BITCOUNT_SEVERITY = np.array([min(bin(m).count("1"), 2) for m in range(32)], dtype=np.int8)
+
 
 # ==========
 # 2) DETECT
 # ==========
+# biți pentru motivele de anomalie (reason bitmask în varianta batch)
+REASON_ERROR = 1
+REASON_LATENCY = 2
+REASON_UTIL = 4
+REASON_DRIFT = 8
+REASON_THETA = 16
+
+REASON_LABELS: Tuple[Tuple[int, str], ...] = (
+    (REASON_ERROR, f"error_rate>{ER_HIGH}"),
+    (REASON_LATENCY, f"latency_p95_ms>{LAT_HIGH}"),
+    (REASON_UTIL, f"utilization>{UTIL_HIGH}"),
+    (REASON_DRIFT, f"drift>{DRIFT_HIGH}"),
+    (REASON_THETA, f"theta<{THETA_LOW}"),
+)
+
+
+def _severity(bad: int) -> int:
+    # severitate = 0 (ok), 1 (mediu) sau 2 (ridicat)
+    return 0 if bad == 0 else 1 if bad == 1 else 2
+
+
 def detect_anomalies(m: Metrics) -> Dict[str, object]:
-    reasons: List[str] = []
-    if m.error_rate > ER_HIGH:        reasons.append(f"error_rate>{ER_HIGH}")
-    if m.latency_p95_ms > LAT_HIGH:   reasons.append(f"latency_p95_ms>{LAT_HIGH}")
-    if m.utilization > UTIL_HIGH:     reasons.append(f"utilization>{UTIL_HIGH}")
-    if m.drift > DRIFT_HIGH:          reasons.append(f"drift>{DRIFT_HIGH}")
-    if m.theta < THETA_LOW:           reasons.append(f"theta<{THETA_LOW}")
-
-    severity = 0
-    if reasons:
-        # severitate = 1 (mediu) sau 2 (ridicat)
-        bad = sum([
-            m.error_rate > ER_HIGH,
-            m.latency_p95_ms > LAT_HIGH,
-            m.utilization > UTIL_HIGH,
-            m.drift > DRIFT_HIGH,
-            m.theta < THETA_LOW,
-        ])
-        severity = 1 if bad == 1 else 2
-
-    return {"anomalies": bool(reasons), "reasons": reasons, "severity": severity}
+    flags = (
+        m.error_rate > ER_HIGH,
+        m.latency_p95_ms > LAT_HIGH,
+        m.utilization > UTIL_HIGH,
+        m.drift > DRIFT_HIGH,
+        m.theta < THETA_LOW,
+    )
+    reasons = [label for flag, (_, label) in zip(flags, REASON_LABELS) if flag]
+    return {"anomalies": bool(reasons), "reasons": reasons, "severity": _severity(len(reasons))}
+
+
+@lru_cache(maxsize=None)
+def decode_reasons(mask: int) -> Tuple[str, ...]:
+    """Bitmask de motive → etichetele din detect_anomalies (aceeași ordine)."""
+    return tuple(label for bit, label in REASON_LABELS if int(mask) & bit)
 
 
 # ==========
 # 3) QUARANTINE (plan de izolare de urgență)
 # ==========
+ACTION_ROUTE_AWAY = 1
+ACTION_FREEZE_DEPLOYS = 2
+ACTION_DISABLE_FEATURE = 4
+ACTION_SCALE_SAFE_POOL = 8
+
+ACTION_LABELS: Tuple[Tuple[int, str], ...] = (
+    (ACTION_ROUTE_AWAY, "route_away_20_percent"),       # scade încărcarea
+    (ACTION_FREEZE_DEPLOYS, "freeze_new_deploys"),      # blochează rollout
+    (ACTION_DISABLE_FEATURE, "disable_suspect_feature"),  # izolează zona suspectă
+    (ACTION_SCALE_SAFE_POOL, "scale_safe_pool_up"),     # scalare pe noduri sănătoase
+)
+
+# acțiuni per severitate (plan conservativ, fără efecte secundare reale – doar recomandări)
+_SEVERITY_ACTIONS = (
+    0,
+    ACTION_ROUTE_AWAY | ACTION_FREEZE_DEPLOYS,
+    ACTION_ROUTE_AWAY | ACTION_FREEZE_DEPLOYS | ACTION_DISABLE_FEATURE | ACTION_SCALE_SAFE_POOL,
+)
+
+
+@lru_cache(maxsize=None)
+def decode_actions(mask: int) -> Tuple[str, ...]:
+    """Bitmask de acțiuni → etichetele din quarantine_plan (aceeași ordine)."""
+    return tuple(label for bit, label in ACTION_LABELS if int(mask) & bit)
+
+
 def quarantine_plan(severity: int) -> Dict[str, object]:
     if severity == 0:
         return {"active": False, "actions": []}
-    actions: List[str] = []
-    # plan conservativ, fără efecte secundare reale (doar recomandări)
-    if severity >= 1:
-        actions.append("route_away_20_percent")      # scade încărcarea
-        actions.append("freeze_new_deploys")         # blochează rollout
-    if severity >= 2:
-        actions.append("disable_suspect_feature")    # izolează zona suspectă
-        actions.append("scale_safe_pool_up")         # scalare pe noduri sănătoase
-    return {"active": True, "actions": actions}
+    return {"active": True, "actions": list(decode_actions(_SEVERITY_ACTIONS[min(severity, 2)]))}
+
+
+# ==========
+# 2b/3b) VARIANTA COLOANARĂ (flote mari de servicii)
+# ==========
+@dataclass(frozen=True, slots=True)
+class MetricsBatch:
+    """
+    Metrics pentru n servicii, ca structură de array-uri (câte un float64
+    contiguu pe câmp) în loc de n obiecte Metrics.
+    """
+    error_rate: np.ndarray
+    latency_p95_ms: np.ndarray
+    utilization: np.ndarray
+    drift: np.ndarray
+    theta: np.ndarray
+
+    def __post_init__(self):
+        cols = np.broadcast_arrays(*(np.atleast_1d(np.asarray(getattr(self, f), dtype=float)) for f in _FIELDS))
+        for f, col in zip(_FIELDS, cols):
+            object.__setattr__(self, f, col)
+
+    @classmethod
+    def from_metrics(cls, items: Iterable[Metrics]) -> "MetricsBatch":
+        rows = np.array([(m.error_rate, m.latency_p95_ms, m.utilization, m.drift, m.theta) for m in items],
+                        dtype=float).reshape(-1, len(_FIELDS))
+        return cls(*rows.T.copy())
+
+    def __len__(self) -> int:
+        return self.theta.shape[0]
+
+    def __getitem__(self, i: int) -> Metrics:
+        return Metrics(*(float(getattr(self, f)[i]) for f in _FIELDS))
+
+
+def detect_anomalies_batch(batch: MetricsBatch) -> Dict[str, np.ndarray]:
+    """
+    detect_anomalies pentru tot lotul, fără liste de string-uri:
+      - "reasons":   bitmask uint8 (REASON_*), decodabil cu decode_reasons;
+      - "severity":  int8 (0/1/2);
+      - "anomalies": bool.
+    """
+    mask = (
+        (batch.error_rate > ER_HIGH).astype(np.uint8) * REASON_ERROR
+        | (batch.latency_p95_ms > LAT_HIGH).astype(np.uint8) * REASON_LATENCY
+        | (batch.utilization > UTIL_HIGH).astype(np.uint8) * REASON_UTIL
+        | (batch.drift > DRIFT_HIGH).astype(np.uint8) * REASON_DRIFT
+        | (batch.theta < THETA_LOW).astype(np.uint8) * REASON_THETA
+    )
+    severity = _BITCOUNT_SEVERITY[mask]
+    return {"anomalies": mask != 0, "reasons": mask, "severity": severity}
+
+
+def quarantine_plan_batch(severity: np.ndarray) -> Dict[str, np.ndarray]:
+    """quarantine_plan vectorizat: "active" (bool) și "actions" (bitmask uint8, vezi decode_actions)."""
+    severity = np.minimum(np.asarray(severity), 2)
+    return {"active": severity > 0, "actions": np.asarray(_SEVERITY_ACTIONS, dtype=np.uint8)[severity]}
 
 
 # ==========
 # 4) IMPROVE (reparație: aduce sistemul în Steady)
 # ==========
-def improve_params(k: float, P: float, U: float, theta: float) -> Dict[str, object]:
+def improve_params(
+    k: float, P: float, U: float, theta: float, cache: EvalCache | bool = False
+) -> Dict[str, object]:
     """
     Țintim starea 0 (Λ-Steady): stabilizare. Folosim optimizerul intern.
     """
@@ -88,6 +191,7 @@ def improve_params(k: float, P: float, U: float, theta: float) -> Dict[str, obje
         theta=theta,
         mode="state",
         desired_state=0,     # vrem homeostază
+        cache=cache,
     )
     return res  # conține params_opt, final_value, final_state etc.
 
@@ -107,17 +211,29 @@ def reinvest_policy() -> Dict[str, float]:
 # ==========
 # 6) CICLUL COMPLET
 # ==========
+@tracing.traced("regen")
 def regen_cycle(
-    k: float, P: float, U: float, metrics: Metrics, T1: float = 1.0
+    k: float, P: float, U: float, metrics: Metrics, T1: float = 1.0,
+    cache: EvalCache | bool = False,
+    trace: bool = False,
 ) -> Dict[str, object]:
     """
     Rulează D→Q→I→R pentru un pas.
+    cache: transmis către lambda_optimize (ex. SHARED_CACHE între apeluri).
+    trace: dacă e True, adaugă "timings" (vezi mobius_motor.tracing).
     Returnează:
       - detect, quarantine, improve, reinvest
       - final (parametri + Λ + stare)
     """
+    if trace:
+        with tracing.collect() as collector:
+            out = regen_cycle(k, P, U, metrics, T1=T1, cache=cache)
+        out["timings"] = collector.summary()
+        return out
+
     # Detect
     det = detect_anomalies(metrics)
+    REGEN_SEVERITY.inc(severity=det["severity"])
 
     # Quarantine
     q = quarantine_plan(det["severity"])
@@ -125,7 +241,7 @@ def regen_cycle(
     # Improve (doar dacă avem probleme sau arbiterul nu e Steady)
     state_now = phi_arbiter(metrics.theta, THETA_LOW, THETA_HIGH)
     if det["severity"] > 0 or state_now != 0:
-        imp = improve_params(k, P, U, metrics.theta)
+        imp = improve_params(k, P, U, metrics.theta, cache=cache)
         k2, P2, U2 = (
             imp["params_opt"]["k"],
             imp["params_opt"]["P"],
@@ -0,0 +1,157 @@
+# mobius_motor/regen_stream.py
+"""
+Λ-Regen pe flux: D→Q→I→R peste un stream continuu de Metrics per serviciu.
+
+Pentru fiecare serviciu păstrăm o fereastră glisantă (ultimele `window`
+eșantioane) cu sume curente → media ferestrei se actualizează în O(1);
+la fiecare `window` eșantioane sumele sunt recalculate exact (math.fsum)
+din fereastră, ca erorile de rotunjire ale scăderilor să nu se acumuleze.
+Detectarea rulează pe media ferestrei, iar starea (severitate, arbiter)
+trece prin histerezis: o stare nouă e acceptată doar după `enter`
+eșantioane consecutive dacă e mai gravă, respectiv `exit` eșantioane dacă
+e mai ușoară. regen_cycle (deci improve_params) rulează doar la tranziții;
+un serviciu sănătos costă doar actualizarea ferestrei.
+"""
+
+from __future__ import annotations
+import math
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Hashable, Iterable, Iterator, Tuple
+
+from mobius_motor.arbiter import phi_arbiter
+from mobius_motor.cache import EvalCache
+from mobius_motor.regen import Metrics, THETA_HIGH, THETA_LOW, detect_anomalies, regen_cycle
+
+Params = Tuple[float, float, float]
+# (severitate 0/1/2, stare arbiter) – starea urmărită per serviciu
+RegenState = Tuple[int, int]
+
+HEALTHY: RegenState = (0, 0)
+
+
+class _ServiceWindow:
+    __slots__ = ("samples", "sums", "state", "candidate", "streak", "params", "seen")
+
+    def __init__(self, window: int, params: Params):
+        self.samples: deque = deque(maxlen=window)
+        self.sums = [0.0] * 5
+        self.state = HEALTHY
+        self.candidate: RegenState | None = None
+        self.streak = 0
+        self.params = params
+        self.seen = 0
+
+    def push(self, m: Metrics) -> Metrics:
+        # tuplu direct din câmpuri: astuple face deepcopy pe fiecare valoare
+        values = (m.error_rate, m.latency_p95_ms, m.utilization, m.drift, m.theta)
+        samples = self.samples
+        old = samples[0] if len(samples) == samples.maxlen else None
+        samples.append(values)
+        self.seen += 1
+        if self.seen % samples.maxlen == 0:
+            # resincronizare periodică (amortizat O(1)): sumele exacte ale ferestrei
+            self.sums = [math.fsum(col) for col in zip(*samples)]
+        elif old is None:
+            self.sums = [s + v for s, v in zip(self.sums, values)]
+        else:
+            self.sums = [s + v - o for s, v, o in zip(self.sums, values, old)]
+        n = len(samples)
+        return Metrics(*(s / n for s in self.sums))
+
+
+class RegenStream:
+    """
+    Etapă de pipeline: consumă (serviciu, Metrics) și emite decizii de regen
+    doar când starea unui serviciu se schimbă.
+
+    window:  numărul de eșantioane din fereastra glisantă
+    enter:   eșantioane consecutive pentru a trece într-o stare mai gravă
+    exit:    eșantioane consecutive pentru a reveni într-o stare mai ușoară
+    params:  (k, P, U) inițiali per serviciu; lipsă → default_params.
+             După fiecare tranziție, parametrii serviciului devin cei
+             propuși de regen ("final").
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        enter: int = 3,
+        exit: int = 5,
+        params: Dict[Hashable, Params] | None = None,
+        default_params: Params = (1.0, 1.0, 5.0),
+        T1: float = 1.0,
+        cache: EvalCache | bool = False,
+    ):
+        if window < 1 or enter < 1 or exit < 1:
+            raise ValueError("window, enter and exit must be >= 1")
+        self.window = window
+        self.enter = enter
+        self.exit = exit
+        self.default_params = default_params
+        self.T1 = T1
+        self.cache = cache
+        self._params = dict(params or {})
+        self._services: Dict[Hashable, _ServiceWindow] = {}
+
+    def state(self, service: Hashable) -> RegenState:
+        """Starea curentă (după histerezis) a serviciului."""
+        svc = self._services.get(service)
+        return svc.state if svc is not None else HEALTHY
+
+    def update(self, service: Hashable, metrics: Metrics) -> Dict[str, Any] | None:
+        """Adaugă un eșantion; returnează decizia dacă starea s-a schimbat, altfel None."""
+        svc = self._services.get(service)
+        if svc is None:
+            svc = _ServiceWindow(self.window, self._params.get(service, self.default_params))
+            self._services[service] = svc
+
+        windowed = svc.push(metrics)
+        candidate = (
+            detect_anomalies(windowed)["severity"],
+            phi_arbiter(windowed.theta, THETA_LOW, THETA_HIGH),
+        )
+        if candidate == svc.state:
+            svc.candidate, svc.streak = None, 0
+            return None
+        if candidate != svc.candidate:
+            svc.candidate, svc.streak = candidate, 0
+        svc.streak += 1
+
+        needed = self.enter if candidate[0] > svc.state[0] else self.exit
+        if svc.streak < needed:
+            return None
+
+        previous, svc.state = svc.state, candidate
+        svc.candidate, svc.streak = None, 0
+        out = regen_cycle(*svc.params, windowed, T1=self.T1, cache=self.cache)
+        final = out["final"]
+        svc.params = (final["k"], final["P"], final["U"])
+        return {
+            "service": service,
+            "sample": svc.seen,
+            "previous": previous,
+            "state": candidate,
+            "window": windowed,
+            **out,
+        }
+
+    def process(self, stream: Iterable[Tuple[Hashable, Metrics]]) -> Iterator[Dict[str, Any]]:
+        """Generator: consumă (serviciu, Metrics) și produce doar deciziile."""
+        for service, metrics in stream:
+            decision = self.update(service, metrics)
+            if decision is not None:
+                yield decision
+
+    async def aprocess(self, stream: AsyncIterable[Tuple[Hashable, Metrics]]) -> AsyncIterator[Dict[str, Any]]:
+        """Varianta async a lui process, pentru surse asincrone (cozi, socket-uri)."""
+        async for service, metrics in stream:
+            decision = self.update(service, metrics)
+            if decision is not None:
+                yield decision
+
+
+def regen_stream(
+    stream: Iterable[Tuple[Hashable, Metrics]], **kwargs: Any
+) -> Iterator[Dict[str, Any]]:
+    """Scurtătură: RegenStream(**kwargs).process(stream)."""
+    return RegenStream(**kwargs).process(stream)
@@ -2,16 +2,18 @@
 from __future__ import annotations
 from typing import Dict
 
+from mobius_motor.affine import affine_value
+
 def steady_step(k: float, P: float, U: float, theta: float, iters: int = 100) -> Dict[str, float]:
     """
     Menține sistemul în echilibru:
       - Ajustează parametrii gradual pentru a stabiliza valoarea Λ.
       - Fără expansiune/compresie, doar reglaj fin.
+
+    Corecția value += 0.01·(P - k) - 0.001·(value - U) este o recurență
+    afină (a = 0.999), evaluată direct în formă închisă.
     """
-    value = theta
-    for _ in range(iters):
-        # mică corecție de echilibru
-        value += 0.01 * (P - k) - 0.001 * (value - U)
+    value = affine_value(theta, 1 - 0.001, 0.01 * (P - k) + 0.001 * U, iters)
 
     return {
         "final_value": float(value),
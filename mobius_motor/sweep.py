@@ -0,0 +1,240 @@
+# mobius_motor/sweep.py
+"""
+Λ-Sweep – Λ și starea Arbiter pe o grilă densă (k, P, U, theta).
+
+Grila (produs cartezian al celor 4 axe, ordine C: theta variază cel mai
+repede) e parcursă în chunk-uri de `chunk_size` puncte consecutive; fiecare
+chunk e evaluat vectorizat (motor_step_batch) și scris direct în fișiere
+.npy mapate în memorie, în directorul de ieșire:
+
+    values.npy   float64, shape (nk, nP, nU, ntheta)   (inf = Wrap invalid)
+    states.npy   int8,    aceeași formă                 (+1 / 0 / -1)
+    done.npy     uint8,   un octet per chunk            (1 = scris și flush-uit)
+    sweep.json   manifestul: axele, chunk_size, pragurile Arbiter, T1
+
+Memoria e mărginită de un chunk, indiferent de mărimea grilei. Un chunk e
+marcat în done.npy doar după ce valorile lui au fost scrise pe disc, deci o
+rulare întreruptă se reia cu aceleași argumente de unde a rămas.
+"""
+
+from __future__ import annotations
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from mobius_motor.core import motor_step_batch
+
+AXES = ("k", "P", "U", "theta")
+MANIFEST = "sweep.json"
+VALUES = "values.npy"
+STATES = "states.npy"
+DONE = "done.npy"
+
+
+class Axis(NamedTuple):
+    start: float
+    stop: float
+    num: int
+
+    def values(self) -> np.ndarray:
+        return np.linspace(self.start, self.stop, self.num)
+
+
+def parse_axis(spec: str) -> Axis:
+    """
+    "start:stop:num" → num puncte egal distanțate, capetele incluse;
+    "x" → o singură valoare.
+    """
+    parts = spec.split(":")
+    try:
+        if len(parts) == 1:
+            x = float(parts[0])
+            return Axis(x, x, 1)
+        if len(parts) == 3:
+            axis = Axis(float(parts[0]), float(parts[1]), int(parts[2]))
+            if axis.num < 1:
+                raise ValueError
+            return axis
+    except ValueError:
+        pass
+    raise ValueError(f"invalid axis {spec!r}: expected 'start:stop:num' (num >= 1) or a single value")
+
+
+class SweepSpec(NamedTuple):
+    k: Axis
+    P: Axis
+    U: Axis
+    theta: Axis
+    chunk_size: int = 1 << 20
+    low_threshold: float = 0.3
+    high_threshold: float = 0.7
+    T1: float = 1.0
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        return (self.k.num, self.P.num, self.U.num, self.theta.num)
+
+    @property
+    def points(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def chunks(self) -> int:
+        return -(-self.points // self.chunk_size)
+
+    def to_json(self) -> Dict[str, object]:
+        out: Dict[str, object] = {name: list(getattr(self, name)) for name in AXES}
+        out.update(chunk_size=self.chunk_size, low_threshold=self.low_threshold,
+                   high_threshold=self.high_threshold, T1=self.T1, shape=list(self.shape))
+        return out
+
+    @classmethod
+    def from_json(cls, data: Dict[str, object]) -> "SweepSpec":
+        return cls(
+            *(Axis(float(a[0]), float(a[1]), int(a[2])) for a in (data[name] for name in AXES)),
+            chunk_size=int(data["chunk_size"]), low_threshold=float(data["low_threshold"]),
+            high_threshold=float(data["high_threshold"]), T1=float(data["T1"]),
+        )
+
+
+def evaluate_chunk(spec: SweepSpec, axes: Sequence[np.ndarray], start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Λ și stările pentru punctele [start, stop) ale grilei aplatizate (ordine C)."""
+    idx = np.unravel_index(np.arange(start, stop, dtype=np.int64), spec.shape)
+    k, P, U, theta = (axis[i] for axis, i in zip(axes, idx))
+    return motor_step_batch(k, P, U, theta, spec.low_threshold, spec.high_threshold, spec.T1)
+
+
+# ==========
+# Worker: memmap-urile sunt deschise o singură dată per proces
+# ==========
+_WORKER: Dict[str, object] = {}
+
+
+def _open_worker(out_dir: str, spec: SweepSpec) -> None:
+    _WORKER.update(
+        spec=spec,
+        axes=[getattr(spec, name).values() for name in AXES],
+        values=np.load(os.path.join(out_dir, VALUES), mmap_mode="r+").reshape(-1),
+        states=np.load(os.path.join(out_dir, STATES), mmap_mode="r+").reshape(-1),
+    )
+
+
+def _run_chunk(chunk: int) -> int:
+    spec: SweepSpec = _WORKER["spec"]
+    start = chunk * spec.chunk_size
+    stop = min(start + spec.chunk_size, spec.points)
+    vals, sts = evaluate_chunk(spec, _WORKER["axes"], start, stop)
+    values, states = _WORKER["values"], _WORKER["states"]
+    values[start:stop] = vals
+    states[start:stop] = sts
+    # pe disc înainte ca chunk-ul să fie marcat în done.npy
+    values.flush()
+    states.flush()
+    return chunk
+
+
+def _prepare(out_dir: str, spec: SweepSpec, overwrite: bool) -> np.memmap:
+    """Creează fișierele sau verifică o rulare existentă (reluare); întoarce done.npy."""
+    manifest = os.path.join(out_dir, MANIFEST)
+    if os.path.exists(manifest) and not overwrite:
+        with open(manifest, encoding="utf-8") as f:
+            previous = SweepSpec.from_json(json.load(f))
+        if previous != spec:
+            diff = [name for name in SweepSpec._fields if getattr(previous, name) != getattr(spec, name)]
+            raise ValueError(f"{out_dir} holds a different sweep (differs in: {', '.join(diff)}); "
+                             "use a new directory or overwrite it")
+        return np.load(os.path.join(out_dir, DONE), mmap_mode="r+")
+
+    os.makedirs(out_dir, exist_ok=True)
+    if os.path.exists(manifest):
+        os.remove(manifest)
+    open_memmap = np.lib.format.open_memmap
+    # doar antetul .npy e scris; restul fișierului rămâne rar (sparse) până la scriere
+    for name, dtype in ((VALUES, np.float64), (STATES, np.int8)):
+        open_memmap(os.path.join(out_dir, name), mode="w+", dtype=dtype, shape=spec.shape).flush()
+    done = open_memmap(os.path.join(out_dir, DONE), mode="w+", dtype=np.uint8, shape=(spec.chunks,))
+    done.flush()
+    # manifestul ultimul: existența lui înseamnă că fișierele sunt complete
+    tmp = manifest + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(spec.to_json(), f, indent=2)
+    os.replace(tmp, manifest)
+    return done
+
+
+def run_sweep(
+    out_dir: str,
+    spec: SweepSpec,
+    workers: int = 1,
+    overwrite: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, object]:
+    """
+    Evaluează grila `spec` în `out_dir` (vezi docstring-ul modulului).
+    workers > 1 → chunk-uri pe un ProcessPoolExecutor, cu cel mult 2·workers
+    chunk-uri în zbor. progress(done, total) e apelat după fiecare chunk.
+    Returnează un sumar: shape, points, chunks, computed, skipped, seconds.
+    """
+    if spec.chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    t0 = time.perf_counter()
+    done = _prepare(out_dir, spec, overwrite)
+    todo: List[int] = np.flatnonzero(done == 0).tolist()
+    skipped = spec.chunks - len(todo)
+    finished = skipped
+
+    def mark(chunk: int) -> None:
+        nonlocal finished
+        done[chunk] = 1
+        done.flush()
+        finished += 1
+        if progress is not None:
+            progress(finished, spec.chunks)
+
+    if workers == 1 or len(todo) <= 1:
+        _open_worker(out_dir, spec)
+        try:
+            for chunk in todo:
+                mark(_run_chunk(chunk))
+        finally:
+            _WORKER.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker, initargs=(out_dir, spec)) as ex:
+            pending: deque = deque()
+            for chunk in todo:
+                pending.append(ex.submit(_run_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    mark(pending.popleft().result())
+            while pending:
+                mark(pending.popleft().result())
+
+    return {
+        "out_dir": out_dir,
+        "shape": list(spec.shape),
+        "points": spec.points,
+        "chunks": spec.chunks,
+        "computed": len(todo),
+        "skipped": skipped,
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+def load_sweep(out_dir: str) -> Dict[str, object]:
+    """Rezultatele unei rulări, mapate în memorie (read-only): spec, axes, values, states, complete."""
+    with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+        spec = SweepSpec.from_json(json.load(f))
+    done = np.load(os.path.join(out_dir, DONE), mmap_mode="r")
+    return {
+        "spec": spec,
+        "axes": {name: getattr(spec, name).values() for name in AXES},
+        "values": np.load(os.path.join(out_dir, VALUES), mmap_mode="r"),
+        "states": np.load(os.path.join(out_dir, STATES), mmap_mode="r"),
+        "complete": bool(done.all()),
+    }
@@ -1,31 +1,160 @@
+import math
 import numpy as np
 
 # Constante de siguranță pentru a preveni diviziunea cu zero sau instabilitatea.
 # Safety constants to prevent division by zero or instability.
-KP_STABILITY_FACTOR = 0.9999 
+KP_STABILITY_FACTOR = 0.9999
 LOG_U_STABILITY_FACTOR = 1e-9
+# Sub log(DBL_MAX) ≈ 709.78: x^n nu depășește float.
+# Below log(DBL_MAX) ≈ 709.78: x^n cannot overflow a float.
+_LOG_OVERFLOW_GUARD = 709.0
 
-def time_wrap(T1, k, P, U):
+# Fiecare formulă are două implementări:
+#   - un kernel scalar, pe float-uri Python (calea rapidă pentru un singur apel);
+#   - un kernel vectorizat NumPy pentru array-uri.
+# Ambele folosesc aceleași ufunc-uri NumPy (log, log1p, expm1, power): un
+# ufunc aplicat unui float rulează aceeași buclă ca pe un array, deci
+# rezultatele sunt identice bit cu bit (math.log poate diferi la ultimul bit).
+# Each formula has two implementations:
+#   - a scalar kernel on Python floats (the fast path for a single call);
+#   - a vectorized NumPy kernel for arrays.
+# Both use the same NumPy ufuncs (log, log1p, expm1, power): a ufunc applied
+# to a float runs the same loop as on an array, so the results are
+# bit-identical (math.log can differ in the last bit).
+# time_wrap / time_steady / time_unwrap aleg automat kernelul potrivit.
+# time_wrap / time_steady / time_unwrap pick the right kernel automatically.
+
+
+def _is_scalar(*args):
+    # np.float64 este subclasă de float, deci rămâne pe calea scalară.
+    # np.float64 subclasses float, so it stays on the scalar path.
+    return all(isinstance(a, (int, float)) for a in args)
+
+def _as_result(out):
+    # Un 0-d array (ex. din np.float32) devine scalar NumPy.
+    # A 0-d array (e.g. from np.float32 inputs) becomes a NumPy scalar.
+    return out[()] if out.ndim == 0 else out
+
+
+# ==========
+# Kernel scalar (float)
+# Scalar kernel (float)
+# ==========
+def _safe_log_U(U):
+    # U <= 1 (sau NaN) -> 1 + LOG_U_STABILITY_FACTOR; np.log, nu math.log (vezi mai sus).
+    # U <= 1 (or NaN) -> 1 + LOG_U_STABILITY_FACTOR; np.log, not math.log (see above).
+    return float(np.log(U if U > 1 else 1 + LOG_U_STABILITY_FACTOR))
+
+def _partial_geometric_sum(x, n):
     """
-    Calculates Λ-Time for the Wrap state (compression).
-    Formula: T1 * log(U) / (1 - 1/(k*P))
-    Used when the system is highly resilient and can handle higher processing density.
+    Closed form of Sum_{i<n} x^i, i.e. (x^n - 1) / (x - 1), and n for x == 1.
+    For x > 0 it uses expm1/log1p to stay accurate when x is close to 1.
     """
-    # Asigură k*P este suficient de mare pentru a evita instabilitatea aproape de 1.
-    # Ensure k*P is large enough to avoid instability near 1.
+    if x == 1:
+        return float(n)
+    # x^n poate depăși float: ±inf, cu semnul dat de x^n / (x - 1), ca la array-uri.
+    # np.errstate costă cât tot kernelul, deci doar când log|x^n| e aproape de limită.
+    # x^n may overflow a float: ±inf, signed by x^n / (x - 1), as for arrays.
+    # np.errstate costs as much as the whole kernel, so only near the limit.
+    if x > 0:
+        exponent = n * float(np.log1p(x - 1))
+        if exponent < _LOG_OVERFLOW_GUARD:
+            return float(np.expm1(exponent)) / (x - 1)
+        with np.errstate(over="ignore"):
+            return float(np.expm1(exponent)) / (x - 1)
+    if x < 0 and n * math.log(-x) < _LOG_OVERFLOW_GUARD:
+        return (float(np.power(x, float(n))) - 1) / (x - 1)
+    with np.errstate(over="ignore"):
+        return (float(np.power(x, float(n))) - 1) / (x - 1)
+
+def time_wrap_scalar(T1, k, P, U):
+    """Scalar kernel of time_wrap (bit-identical to time_wrap_array)."""
     kp_product = k * P
     if kp_product <= 1:
-        # În starea Wrap, k*P trebuie să fie > 1. Dacă nu, este o condiție de eroare.
-        # In Wrap state, k*P must be > 1. If not, it's an error condition.
-        return np.inf  # Returnează infinit pentru a semnala o stare invalidă.
+        return np.inf
+    return (T1 * _safe_log_U(U)) / (1 - (1 / kp_product))
+
+def time_steady_scalar(T1, U):
+    """Scalar kernel of time_steady (bit-identical to time_steady_array)."""
+    return T1 * _safe_log_U(U)
+
+def time_unwrap_scalar(T1, k, P, U, max_iter=100):
+    """Scalar kernel of time_unwrap (bit-identical to time_unwrap_array)."""
+    kp_product = k * P
+    log_U_term = _safe_log_U(U)
+    if abs(kp_product) >= 1:
+        return T1 * log_U_term * _partial_geometric_sum(kp_product, max_iter)
+    return (T1 * log_U_term) / (1 - kp_product)
+
 
-    # Previne log(0) sau log(1)
-    # Prevents log(0) or log(1)
-    safe_U = U if U > 1 else 1 + LOG_U_STABILITY_FACTOR
+# ==========
+# Kernel vectorizat (NumPy arrays)
+# Vectorized kernel (NumPy arrays)
+# ==========
+def _safe_log_U_array(U):
+    # Aceeași regulă ca la scalari: U <= 1 (sau NaN) -> 1 + LOG_U_STABILITY_FACTOR.
+    # Same rule as the scalar path: U <= 1 (or NaN) -> 1 + LOG_U_STABILITY_FACTOR.
+    return np.log(np.where(U > 1, U, 1 + LOG_U_STABILITY_FACTOR))
 
-    denominator = 1 - (1 / kp_product)
-    
-    return (T1 * np.log(safe_U)) / denominator
+def _partial_geometric_sum_array(x, n):
+    """Array version of _partial_geometric_sum."""
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        positive = np.expm1(n * np.log1p(np.where(x > 0, x, 1) - 1))
+        negative = np.power(np.where(x > 0, 0, x), float(n)) - 1
+        out = np.where(x > 0, positive, negative) / (x - 1)
+    return np.where(x == 1, float(n), out)
+
+def time_wrap_array(T1, k, P, U):
+    """
+    Array version of time_wrap. Elements with k*P <= 1 are np.inf,
+    exactly as in the scalar formula.
+    """
+    k, P, U = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(P, dtype=float), np.asarray(U, dtype=float))
+    kp_product = k * P
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.asarray((T1 * _safe_log_U_array(U)) / (1 - (1 / kp_product)))
+    out[kp_product <= 1] = np.inf
+    return out
+
+def time_steady_array(T1, U):
+    """
+    Array version of time_steady.
+    """
+    return T1 * _safe_log_U_array(np.asarray(U, dtype=float))
+
+def time_unwrap_array(T1, k, P, U, max_iter=100):
+    """
+    Array version of time_unwrap. The divergent elements (|k*P| >= 1)
+    use the closed-form partial sum, so no element needs a Python loop.
+    """
+    k, P, U = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(P, dtype=float), np.asarray(U, dtype=float))
+    kp_product = k * P
+    log_U_term = _safe_log_U_array(U)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        out = np.asarray((T1 * log_U_term) / (1 - kp_product))
+        divergent = np.abs(kp_product) >= 1
+        if divergent.any():
+            out[divergent] = (
+                T1 * log_U_term[divergent] * _partial_geometric_sum_array(kp_product[divergent], max_iter)
+            )
+    return out
+
+
+# ==========
+# Formulele publice (aleg kernelul după tipul intrărilor)
+# Public formulas (kernel chosen from the input types)
+# ==========
+def time_wrap(T1, k, P, U):
+    """
+    Calculates Λ-Time for the Wrap state (compression).
+    Formula: T1 * log(U) / (1 - 1/(k*P))
+    Used when the system is highly resilient and can handle higher processing density.
+    """
+    # În starea Wrap, k*P trebuie să fie > 1. Dacă nu, rezultatul este np.inf (stare invalidă).
+    # In Wrap state, k*P must be > 1. If not, the result is np.inf (invalid state).
+    if _is_scalar(T1, k, P, U):
+        return time_wrap_scalar(T1, k, P, U)
+    return _as_result(time_wrap_array(T1, k, P, U))
 
 def time_steady(T1, U):
     """
@@ -33,35 +162,19 @@ def time_steady(T1, U):
     Formula: T1 * log(U)
     Used for stable, homeostatic operation.
     """
-    # Previne log(0) sau log(1)
-    # Prevents log(0) or log(1)
-    safe_U = U if U > 1 else 1 + LOG_U_STABILITY_FACTOR
-    return T1 * np.log(safe_U)
+    if _is_scalar(T1, U):
+        return time_steady_scalar(T1, U)
+    return _as_result(np.asarray(time_steady_array(T1, U)))
 
 def time_unwrap(T1, k, P, U, max_iter=100):
     """
     Calculates Λ-Time for the Unwrap state (expansion) using a geometric series.
     Formula: Sum(T1 * (k*P)^i * log(U))
     Converges to T1*log(U) / (1 - k*P) if |k*P| < 1.
+    If |k*P| >= 1 the series diverges and is capped at max_iter terms,
+    evaluated with the closed-form partial sum ((k*P)^n - 1) / (k*P - 1).
     Used for controlled stress testing or deep analysis.
     """
-    kp_product = k * P
-    
-    # Previne log(0) sau log(1)
-    # Prevents log(0) or log(1)
-    safe_U = U if U > 1 else 1 + LOG_U_STABILITY_FACTOR
-    log_U_term = np.log(safe_U)
-
-    # Dacă |k*P| >= 1, seria diverge. O oprim la un prag pentru a preveni infinitul.
-    # If |k*P| >= 1, the series diverges. We cap it to prevent infinite loops.
-    if abs(kp_product) >= 1:
-        # Calculăm o sumă parțială mare ca penalizare pentru divergență.
-        # We calculate a large partial sum as a penalty for divergence.
-        total = 0
-        for i in range(max_iter):
-            total += T1 * (kp_product ** i) * log_U_term
-        return total
-
-    # Dacă |k*P| < 1, seria converge și putem folosi formula directă.
-    # If |k*P| < 1, the series converges, and we can use the direct formula.
-    return (T1 * log_U_term) / (1 - kp_product)
+    if _is_scalar(T1, k, P, U):
+        return time_unwrap_scalar(T1, k, P, U, max_iter)
+    return _as_result(time_unwrap_array(T1, k, P, U, max_iter))
@@ -0,0 +1,182 @@
+# mobius_motor/tracing.py
+"""
+Λ-Tracing – span-uri opt-in pentru etapele motorului (run_engine, regen_cycle).
+
+  - hook-uri: obiecte cu on_span_start(path, attrs) și on_span_end(path,
+    attrs, wall, cpu), activate cu `with hooks(h1, h2): ...`. Sunt legate de
+    contextul curent (contextvars), deci rulări concurente nu se amestecă;
+    run_engine copiază contextul în thread-urile executorului.
+  - span-urile sunt imbricate: path = "run_engine/regen/optimize".
+  - TimingCollector: hook-ul inclus – apeluri, timp wall și CPU (al
+    thread-ului) și iterațiile optimizerului, per path.
+  - profiled("cprofile" | "tracemalloc"): rulează un bloc sub profiler.
+
+Fără hook-uri active, span() întoarce un context manager no-op partajat, iar
+funcțiile decorate cu @traced fac doar o citire de ContextVar în plus.
+"""
+
+from __future__ import annotations
+import contextvars
+import cProfile
+import functools
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Protocol, Tuple
+
+
+class TraceHook(Protocol):
+    def on_span_start(self, path: str, attrs: Dict[str, Any]) -> None: ...
+
+    def on_span_end(self, path: str, attrs: Dict[str, Any], wall: float, cpu: float) -> None: ...
+
+
+_HOOKS: contextvars.ContextVar[Tuple[TraceHook, ...]] = contextvars.ContextVar("mobius_trace_hooks", default=())
+_PATH: contextvars.ContextVar[str] = contextvars.ContextVar("mobius_trace_path", default="")
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> Dict[str, Any]:
+        return {}
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def enabled() -> bool:
+    return bool(_HOOKS.get())
+
+
+@contextmanager
+def _active_span(hooks_: Tuple[TraceHook, ...], name: str, attrs: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    parent = _PATH.get()
+    path = f"{parent}/{name}" if parent else name
+    token = _PATH.set(path)
+    for h in hooks_:
+        h.on_span_start(path, attrs)
+    t0, c0 = time.perf_counter(), time.thread_time()
+    try:
+        yield attrs
+    finally:
+        wall, cpu = time.perf_counter() - t0, time.thread_time() - c0
+        _PATH.reset(token)
+        for h in hooks_:
+            h.on_span_end(path, attrs, wall, cpu)
+
+
+def span(name: str, **attrs: Any):
+    """Span pentru un bloc `with`; valoarea returnată e dict-ul de atribute (modificabil)."""
+    hooks_ = _HOOKS.get()
+    if not hooks_:
+        return _NOOP
+    return _active_span(hooks_, name, attrs)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator: apelul devine un span `name`. Dacă rezultatul e un dict cu
+    "iters", valoarea e adăugată la atributele span-ului.
+    """
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            hooks_ = _HOOKS.get()
+            if not hooks_:
+                return fn(*args, **kwargs)
+            with _active_span(hooks_, name, {}) as attrs:
+                out = fn(*args, **kwargs)
+                if isinstance(out, dict) and "iters" in out:
+                    attrs["iters"] = out["iters"]
+                return out
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def hooks(*hooks_: TraceHook) -> Iterator[None]:
+    """Activează hook-urile pentru blocul curent (în plus față de cele deja active)."""
+    token = _HOOKS.set(_HOOKS.get() + hooks_)
+    try:
+        yield
+    finally:
+        _HOOKS.reset(token)
+
+
+class TimingCollector:
+    """Hook inclus: agregă apelurile, timpul wall/CPU și iterațiile per path."""
+
+    def __init__(self):
+        self.spans: Dict[str, Dict[str, float]] = {}
+
+    def on_span_start(self, path: str, attrs: Dict[str, Any]) -> None:
+        pass
+
+    def on_span_end(self, path: str, attrs: Dict[str, Any], wall: float, cpu: float) -> None:
+        entry = self.spans.get(path)
+        if entry is None:
+            entry = self.spans[path] = {"calls": 0, "wall": 0.0, "cpu": 0.0}
+        # dict-urile sunt actualizate sub GIL, câte o cheie odată (thread-uri concurente OK)
+        entry["calls"] += 1
+        entry["wall"] += wall
+        entry["cpu"] += cpu
+        if "iters" in attrs:
+            entry["iters"] = entry.get("iters", 0) + attrs["iters"]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {path: dict(v) for path, v in sorted(self.spans.items())}
+
+
+@contextmanager
+def collect() -> Iterator[TimingCollector]:
+    """`with collect() as c: ...` → c.summary() la final."""
+    collector = TimingCollector()
+    with hooks(collector):
+        yield collector
+
+
+PROFILERS = ("cprofile", "tracemalloc")
+
+
+@contextmanager
+def profiled(kind: str, top: int = 25) -> Iterator[Dict[str, Any]]:
+    """
+    Rulează blocul sub un profiler; dict-ul întors e completat la ieșire:
+      - "cprofile":    {"kind", "stats"} – primele `top` funcții după timpul cumulat
+                       (doar thread-ul curent);
+      - "tracemalloc": {"kind", "current_bytes", "peak_bytes", "top"} – cele mai
+                       mari `top` alocări, grupate pe linie.
+    """
+    if kind not in PROFILERS:
+        raise ValueError(f"profile must be one of {PROFILERS}")
+    report: Dict[str, Any] = {"kind": kind}
+    if kind == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield report
+        finally:
+            prof.disable()
+            out = io.StringIO()
+            pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(top)
+            report["stats"] = out.getvalue()
+        return
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield report
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        report["current_bytes"], report["peak_bytes"] = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+        report["top"] = [str(s) for s in snapshot.statistics("lineno")[:top]]
@@ -2,22 +2,30 @@
 from __future__ import annotations
 from typing import Dict
 
-def unwrap_step(k: float, P: float, U: float, theta: float, iters: int = 100) -> Dict[str, float]:
+from mobius_motor.affine import affine_value, affine_history
+
+def unwrap_step(
+    k: float, P: float, U: float, theta: float, iters: int = 100, history: str | None = None
+) -> Dict[str, float]:
     """
     Expansiune controlată:
       - Sistemul crește valoarea Λ gradual.
       - Simulează dilatarea parametrilor în timp.
+
+    Recurența value ← value·(1 + 0.01·P) + 0.001·U - 0.0005·k
+    se evaluează în formă închisă. Istoricul e opțional:
+    history = "list" | "lazy" | "array" | "numpy" (vezi mobius_motor.affine).
     """
-    value = theta
-    history = []
-    for _ in range(iters):
-        value = value * (1 + 0.01 * P) + 0.001 * U - 0.0005 * k
-        history.append(value)
+    a = 1 + 0.01 * P
+    b = 0.001 * U - 0.0005 * k
+    value = affine_value(theta, a, b, iters)
 
-    return {
+    out = {
         "final_value": float(value),
         "params_final": {"k": k, "P": P, "U": U},
         "iters": iters,
-        "history": history,
         "mode": "unwrap",
     }
+    if history is not None:
+        out["history"] = affine_history(theta, a, b, iters, history)
+    return out
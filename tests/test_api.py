@@ -1,8 +1,14 @@
 # tests/test_api.py
+import io
+import json
 import math
+
+import numpy as np
 from fastapi.testclient import TestClient
 
+from aios import api
 from aios.api import app  # asigură-te că există aios/__init__.py
+from aios.offload import Offloader
 client = TestClient(app)
 
 def test_step_wrap():
@@ -60,3 +66,166 @@ def test_optimize_force_wrap_state():
     assert r.status_code == 200
     data = r.json()
     assert data["final_state"] == 1
+
+
+def _ndjson(r):
+    return [json.loads(line) for line in r.text.splitlines()]
+
+
+def test_step_batch_streams_ndjson_matching_step():
+    payload = {"k": [2.0, 2.0, 0.5, 0.5], "P": [0.8], "U": [10.0], "theta": [0.9, 0.5, 0.1, 0.9], "chunk_size": 3}
+    r = client.post("/step/batch", json=payload)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = _ndjson(r)
+    assert [row["index"] for row in rows] == [0, 1, 2, 3]
+    for row in rows[:3]:
+        single = client.post("/step", json=row["params"]).json()
+        assert row["state"] == single["state"] and row["state_desc"] == single["state_desc"]
+        assert abs(row["value"] - single["value"]) < 1e-12 * max(1.0, abs(single["value"]))
+    # Wrap invalid (k*P <= 1) → Λ = inf → null în NDJSON
+    assert rows[3]["value"] is None and rows[3]["state"] == 1
+
+
+def test_step_batch_rejects_mismatched_lengths():
+    r = client.post("/step/batch", json={"k": [1.0, 2.0], "P": [1.0, 1.0, 1.0], "U": [5.0], "theta": [0.5]})
+    assert r.status_code == 422
+
+
+def test_optimize_batch_streams_each_result():
+    items = [
+        {"theta": 0.45, "mode": "value", "target": 3.0, "desired_state": 0},
+        {"k": 0.8, "P": 0.6, "U": 10.0, "theta": 0.85, "mode": "state", "desired_state": 1},
+    ]
+    rows = _ndjson(client.post("/optimize/batch", json={"items": items}))
+    assert [row["index"] for row in rows] == [0, 1]
+    for row, item in zip(rows, items):
+        single = client.post("/optimize", json=item).json()
+        assert {k: v for k, v in row.items() if k != "index"} == single
+
+
+def test_optimize_batch_rejects_invalid_items_before_streaming():
+    items = [{"theta": 0.5, "mode": "value", "target": 3.0}, {"theta": 0.5, "mode": "value"}]
+    r = client.post("/optimize/batch", json={"items": items})
+    assert r.status_code == 422
+    assert [e["loc"] for e in r.json()["detail"]] == [["body", "items", 1]]
+
+
+def test_optimize_batch_reports_item_errors_inline(monkeypatch):
+    real = api.lambda_optimize
+
+    def failing(**kw):
+        if kw["theta"] == 0.2:
+            raise ValueError("boom")
+        return real(**kw)
+
+    monkeypatch.setattr(api, "OFFLOADER", Offloader(max_workers=1, executor="thread"))
+    monkeypatch.setattr(api, "lambda_optimize", failing)
+    items = [{"theta": t, "mode": "value", "target": 3.0} for t in (0.5, 0.2, 0.6)]
+    rows = _ndjson(client.post("/optimize/batch", json={"items": items}))
+    assert [row["index"] for row in rows] == [0, 1, 2]
+    assert rows[1] == {"index": 1, "error": "boom"}
+    assert "error" not in rows[0] and "error" not in rows[2]
+
+
+def test_optimize_returns_429_when_saturated(monkeypatch):
+    monkeypatch.setattr(api, "OFFLOADER", Offloader(max_workers=1, max_pending=0, executor="thread"))
+    api.OPTIMIZE_CACHE.clear()
+    r = client.post("/optimize", json={"theta": 0.5, "mode": "value", "target": 3.0})
+    assert r.status_code == 429
+    assert r.headers["retry-after"] == "1"
+
+
+def test_optimize_batch_returns_429_when_saturated(monkeypatch):
+    monkeypatch.setattr(api, "OFFLOADER", Offloader(max_workers=1, max_pending=0, executor="thread"))
+    r = client.post("/optimize/batch", json={"items": [{"theta": 0.5, "mode": "value", "target": 3.0}]})
+    assert r.status_code == 429
+    assert r.headers["retry-after"] == "1"
+
+
+def test_optimize_batch_runs_items_through_offloader(monkeypatch):
+    # max_pending=1: fiecare element așteaptă locul eliberat de cel dinainte
+    off = Offloader(max_workers=2, max_pending=1, executor="thread")
+    monkeypatch.setattr(api, "OFFLOADER", off)
+    items = [{"theta": 0.5, "mode": "value", "target": t} for t in (2.0, 3.0, 4.0)] + \
+            [{"theta": 0.5, "mode": "value", "target": 2.0}]
+    rows = _ndjson(client.post("/optimize/batch", json={"items": items}))
+    assert [row["index"] for row in rows] == [0, 1, 2, 3]
+    for row, item in zip(rows, items):
+        assert {k: v for k, v in row.items() if k != "index"} == api._optimize(api.OptimizeInput(**item))
+    assert off.stats()["submitted"] + off.stats()["coalesced"] == len(items)
+    assert client.post("/optimize/batch", json={"items": []}).text == ""
+    off.shutdown()
+
+
+def test_step_cache_etag_and_stats():
+    api.STEP_CACHE.clear()
+    payload = {"k": 1.5, "P": 0.9, "U": 7.0, "theta": 0.8}
+    first = client.post("/step", json=payload)
+    # aceeași cerere, altă ordine a câmpurilor și alte forme numerice → aceeași cheie
+    second = client.post("/step", json={"theta": 0.8, "U": 7, "P": 0.9, "k": 1.5})
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+
+    # doar ETag: If-None-Match e ignorat pe POST → răspunsul complet, cu același ETag
+    conditional = client.post("/step", json=payload, headers={"If-None-Match": first.headers["etag"]})
+    assert conditional.status_code == 200 and conditional.content == first.content
+    assert conditional.headers["etag"] == first.headers["etag"]
+    assert client.post("/step", json=payload, headers={"If-None-Match": '"other"'}).status_code == 200
+
+    stats = client.get("/cache/stats").json()["step"]
+    assert stats["misses"] == 1 and stats["hits"] == 3
+    assert stats["hit_ratio"] == 0.75
+
+
+def test_optimize_cache_serves_identical_content():
+    api.OPTIMIZE_CACHE.clear()
+    payload = {"k": 0.8, "P": 0.6, "U": 10.0, "theta": 0.85, "mode": "state", "desired_state": 1}
+    first = client.post("/optimize", json=payload)
+    second = client.post("/optimize", json=payload)
+    assert first.json() == second.json() == api._optimize(api.OptimizeInput(**payload))
+    assert api.OPTIMIZE_CACHE.stats()["hits"] == 1
+
+
+
+def _rows():
+    return np.array([[2.0, 0.8, 10.0, 0.9], [2.0, 0.8, 10.0, 0.5], [0.5, 0.5, 10.0, 0.1]])
+
+
+def test_step_batch_accepts_raw_float64_buffer():
+    rows = _rows()
+    r = client.post("/step/batch?chunk_size=2", content=rows.astype("<f8").tobytes(),
+                    headers={"Content-Type": "application/octet-stream"})
+    assert r.status_code == 200
+    binary = _ndjson(r)
+    as_json = _ndjson(client.post("/step/batch", json={c: rows[:, i].tolist() for i, c in enumerate("kPU")} | {"theta": rows[:, 3].tolist()}))
+    assert binary == as_json
+    assert [row["state"] for row in binary] == [1, 0, -1]
+
+
+def test_step_batch_non_finite_binary_input_is_valid_ndjson():
+    rows = np.array([[np.inf, 0.8, 10.0, 0.9], [2.0, 0.8, 10.0, np.nan]])
+    r = client.post("/step/batch", content=rows.astype("<f8").tobytes(),
+                    headers={"Content-Type": "application/octet-stream"})
+    assert r.status_code == 200
+    out = [json.loads(line) for line in r.text.splitlines()]   # strict: fără NaN / Infinity
+    assert out[0]["params"]["k"] is None and out[1]["params"]["theta"] is None
+    assert "NaN" not in r.text and "Infinity" not in r.text and "inf" not in r.text
+
+
+def test_step_batch_accepts_npy():
+    buf = io.BytesIO()
+    np.save(buf, _rows().astype(np.float32))
+    r = client.post("/step/batch", content=buf.getvalue(), headers={"Content-Type": "application/x-npy"})
+    assert r.status_code == 200
+    assert [row["state"] for row in _ndjson(r)] == [1, 0, -1]
+
+
+def test_step_batch_rejects_bad_binary():
+    r = client.post("/step/batch", content=b"\x00" * 12, headers={"Content-Type": "application/octet-stream"})
+    assert r.status_code == 422
+    buf = io.BytesIO()
+    np.save(buf, np.zeros((3, 2)))
+    r = client.post("/step/batch", content=buf.getvalue(), headers={"Content-Type": "application/x-npy"})
+    assert r.status_code == 422
@@ -1,6 +1,7 @@
 # tests/test_balance.py
+import numpy as np
 import pytest
-from mobius_motor.balance import balance_step
+from mobius_motor.balance import balance_batch, balance_step
 
 def test_balance_converges():
     res = balance_step(
@@ -24,3 +25,42 @@ def test_balance_converges():
 
     # history nu e gol
     assert len(res["history"]) > 0
+
+
+def _check_matches_scalar(k, P, U, theta, target, **kw):
+    batch = balance_batch(k, P, U, theta, target, **kw)
+    for i in range(len(k)):
+        ref = balance_step(k[i], P[i], U[i], theta[i], target_value=target[i], **kw)
+        assert batch["final_value"][i] == pytest.approx(ref["final_value"], rel=1e-9)
+        assert batch["loss"][i] == pytest.approx(ref["loss"], rel=1e-9, abs=1e-12)
+        assert batch["final_state"][i] == ref["final_state"]
+        assert batch["iters"][i] == len(ref["history"])
+        for name in ("k", "P", "U"):
+            assert batch["params_final"][name][i] == pytest.approx(ref["params_final"][name], rel=1e-9)
+    return batch
+
+
+def test_balance_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    n = 40
+    k = rng.uniform(0.5, 3.0, n)
+    P = rng.uniform(0.3, 1.5, n)
+    U = rng.uniform(2.0, 50.0, n)
+    theta = rng.uniform(0.0, 1.0, n)
+    target = rng.uniform(1.0, 15.0, n)
+    res = _check_matches_scalar(k, P, U, theta, target, iters=60)
+    assert res["history"] is None
+    _check_matches_scalar(k, P, U, theta, target, iters=60, tol=0.05)
+
+
+def test_balance_batch_history_buffer():
+    buf = np.empty((30, 2, 4))
+    res = balance_batch([1.0, 1.0], [1.0, 1.0], [5.0, 5.0], [0.6, 0.6], [10.0, np.log(5.0)],
+                        iters=30, tol=1e-9, history=buf)
+    assert res["history"] is buf
+    # al doilea serviciu e deja în toleranță la primul pas
+    assert res["iters"].tolist() == [30, 1]
+    assert np.isnan(buf[1:, 1]).all()
+    assert buf[0, 1].tolist() == pytest.approx([1.0, 1.0, 5.0, np.log(5.0)])
+    with pytest.raises(ValueError):
+        balance_batch([1.0], [1.0], [5.0], [0.6], [10.0], iters=5, history=np.empty((4, 1, 4)))
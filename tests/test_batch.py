@@ -0,0 +1,68 @@
+# tests/test_batch.py
+import numpy as np
+import pytest
+
+from mobius_motor.core import motor_step, motor_step_batch
+
+
+def _scalar_loop(k, P, U, theta):
+    out = [motor_step(float(a), float(b), float(c), float(d)) for a, b, c, d in zip(k, P, U, theta)]
+    return np.array([v for v, _ in out], dtype=float), np.array([s for _, s in out])
+
+
+def test_batch_matches_scalar_bitwise():
+    rng = np.random.default_rng(0)
+    n = 2000
+    k = rng.uniform(0.1, 3.0, n)
+    P = rng.uniform(0.1, 2.0, n)
+    U = rng.uniform(0.5, 100.0, n)   # include U <= 1
+    theta = rng.uniform(0.0, 1.0, n)
+
+    values, states = motor_step_batch(k, P, U, theta)
+    exp_values, exp_states = _scalar_loop(k, P, U, theta)
+
+    assert values.shape == states.shape == (n,)
+    np.testing.assert_array_equal(states, exp_states)
+    np.testing.assert_array_equal(values, exp_values)
+
+
+def test_batch_edge_cases():
+    # Wrap invalid (k*P <= 1), Unwrap divergent (k*P >= 1), k*P == 1 exact
+    k = np.array([1.0, 0.5, 2.0, 1.0, 2.0])
+    P = np.array([1.0, 1.0, 0.8, 1.0, 0.9])
+    U = np.array([10.0, 10.0, 10.0, 10.0, 1.0])
+    theta = np.array([0.9, 0.9, 0.1, 0.1, 0.5])
+
+    values, states = motor_step_batch(k, P, U, theta)
+    exp_values, exp_states = _scalar_loop(k, P, U, theta)
+
+    assert states.tolist() == [1, 1, -1, -1, 0]
+    assert np.isinf(values[0]) and np.isinf(values[1])
+    np.testing.assert_array_equal(values, exp_values)
+    np.testing.assert_array_equal(states, exp_states)
+
+
+def test_batch_matches_scalar_bitwise_extremes():
+    # x^n depășește float (±inf), intrări inf / NaN, |k*P| mare în ambele semne
+    k = np.array([2000.0, -2000.0, -2001.0, np.inf, -np.inf, np.nan, 2.0, 1.5, -1.0])
+    P = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, np.nan, 1.0, 1.0])
+    U = np.array([10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, np.inf, np.nan])
+    theta = np.full(k.shape, 0.1)
+
+    values, states = motor_step_batch(k, P, U, theta)
+    exp_values, exp_states = _scalar_loop(k, P, U, theta)
+
+    assert np.isinf(values[:3]).all()
+    np.testing.assert_array_equal(values, exp_values)
+    np.testing.assert_array_equal(states, exp_states)
+
+
+def test_batch_broadcasts_scalars():
+    values, states = motor_step_batch([2.0, 0.5], 0.8, 10.0, 0.9)
+    assert states.tolist() == [1, 1]
+    assert values[0] == motor_step(2.0, 0.8, 10.0, 0.9)[0]
+
+
+def test_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        motor_step_batch([1.0, 2.0], [1.0, 2.0, 3.0], 10.0, 0.5)
@@ -0,0 +1,60 @@
+import json
+
+from benchmarks import run as bench
+from benchmarks.cases import GROUPS
+
+
+def _result(**scores):
+    return {"results": {k: {"score": v, "seconds": v} for k, v in scores.items()}}
+
+
+def test_compare_flags_only_cases_above_threshold():
+    baseline = _result(a=1.0, b=1.0, gone=1.0)
+    current = _result(a=1.2, b=1.3, new=5.0)
+    rows = {r["case"]: r for r in bench.compare(current, baseline, threshold=0.25)}
+    assert set(rows) == {"a", "b"}
+    assert not rows["a"]["regression"]
+    assert rows["b"]["regression"]
+    assert abs(rows["b"]["ratio"] - 1.3) < 1e-12
+
+
+def test_compare_does_not_flag_slowdowns_within_the_case_spread():
+    baseline = {"results": {"a": {"score": 1.0, "spread": 1.1}, "b": {"score": 1.0, "spread": 1.1}}}
+    current = {"results": {"a": {"score": 1.8, "spread": 2.0}, "b": {"score": 1.8, "spread": 1.2}}}
+    rows = {r["case"]: r for r in bench.compare(current, baseline, threshold=0.25)}
+    assert rows["a"]["spread"] == 2.0 and not rows["a"]["regression"]
+    assert rows["b"]["regression"]
+
+
+def test_spread_is_median_over_min():
+    assert bench.spread([1.0, 3.0, 2.0]) == 2.0
+    assert bench.spread([0.5]) == 1.0
+
+
+def test_case_keys_are_unique():
+    for group, make in GROUPS.items():
+        keys = [bench.case_key(c) for c in make([10, 20])]
+        assert len(keys) == len(set(keys)), group
+
+
+def test_main_writes_output_and_fails_on_regression(tmp_path, monkeypatch):
+    fake = {"machine": {}, "calibration_seconds": 1.0, "rounds": 1, "results": _result(x=3.0)["results"]}
+    monkeypatch.setattr(bench, "run", lambda *a, **kw: fake)
+    base, out = tmp_path / "baseline.json", tmp_path / "out.json"
+
+    assert bench.main(["--baseline", str(base), "--update-baseline"]) == 0
+    assert json.loads(base.read_text())["results"]["x"]["score"] == 3.0
+
+    base.write_text(json.dumps(_result(x=1.0)))
+    assert bench.main(["--baseline", str(base), "--output", str(out)]) == 1
+    assert json.loads(out.read_text()) == fake
+    assert bench.main(["--baseline", str(base), "--threshold", "2.5"]) == 0
+
+
+def test_default_threshold_flags_a_quiet_30_percent_slowdown(tmp_path, monkeypatch):
+    fake = {"results": {"x": {"score": 1.3, "spread": 1.05}}}
+    monkeypatch.setattr(bench, "run", lambda *a, **kw: fake)
+    base = tmp_path / "baseline.json"
+    base.write_text(json.dumps({"results": {"x": {"score": 1.0, "spread": 1.05}}}))
+    assert bench.DEFAULT_THRESHOLD == 0.25
+    assert bench.main(["--baseline", str(base)]) == 1
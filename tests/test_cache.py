@@ -0,0 +1,66 @@
+# tests/test_cache.py
+import pytest
+
+from mobius_motor.cache import EvalCache
+from mobius_motor.core import motor_step
+from mobius_motor.optimize import lambda_optimize
+
+
+def test_cache_hits_and_misses():
+    c = EvalCache(maxsize=8)
+    assert c.step(2.0, 0.8, 10.0, 0.9) == motor_step(2.0, 0.8, 10.0, 0.9)
+    assert c.step(2.0, 0.8, 10.0, 0.9) == motor_step(2.0, 0.8, 10.0, 0.9)
+    st = c.stats()
+    assert st["hits"] == 1 and st["misses"] == 1 and st["size"] == 1
+    assert st["hit_ratio"] == pytest.approx(0.5)
+
+
+def test_cache_lru_eviction():
+    c = EvalCache(maxsize=2)
+    c.step(1.0, 1.0, 2.0, 0.5)
+    c.step(1.0, 1.0, 3.0, 0.5)
+    c.step(1.0, 1.0, 2.0, 0.5)          # reîmprospătează prima intrare
+    c.step(1.0, 1.0, 4.0, 0.5)          # evacuează U=3.0
+    assert len(c) == 2 and c.evictions == 1
+    c.step(1.0, 1.0, 2.0, 0.5)
+    assert c.hits == 2
+    c.step(1.0, 1.0, 3.0, 0.5)
+    assert c.misses == 4
+
+
+def test_cache_quantize_shares_cell():
+    c = EvalCache(quantize=1e-3)
+    a = c.step(2.0, 0.8, 10.0, 0.9)
+    b = c.step(2.0 + 1e-7, 0.8, 10.0 - 1e-7, 0.9)
+    assert a == b and c.hits == 1
+
+
+def test_cache_quantize_keeps_theta_exact():
+    # theta rotunjit la 0.3 ar trece pragul Arbiterului (Unwrap → Steady)
+    c = EvalCache(quantize=1e-3)
+    theta = 0.3 - 1e-5
+    assert c.step(1.0, 1.0, 5.0, theta)[1] == motor_step(1.0, 1.0, 5.0, theta)[1] == -1
+    assert c.step(1.0, 1.0, 5.0, 0.3)[1] == 0 and c.hits == 0
+
+
+def test_optimize_accepts_cache_none():
+    kw = dict(initial_guess=(1.0, 1.0, 5.0), theta=0.45, mode="value", target=3.0, desired_state=0)
+    assert lambda_optimize(**kw, cache=None) == lambda_optimize(**kw, cache=False)
+
+
+def test_cache_invalid_args():
+    with pytest.raises(ValueError):
+        EvalCache(maxsize=0)
+    with pytest.raises(ValueError):
+        EvalCache(quantize=0.0)
+
+
+def test_optimize_same_result_with_and_without_cache():
+    kw = dict(initial_guess=(1.0, 1.0, 5.0), theta=0.45, mode="value", target=3.0, desired_state=0)
+    shared = EvalCache()
+    plain = lambda_optimize(**kw, cache=False)
+    assert lambda_optimize(**kw, cache=True) == plain
+    assert lambda_optimize(**kw, cache=shared) == plain
+    misses = shared.misses
+    assert lambda_optimize(**kw, cache=shared) == plain
+    assert shared.misses == misses          # a doua rulare: doar hit-uri
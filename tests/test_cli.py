@@ -0,0 +1,149 @@
+# tests/test_cli.py
+import csv
+import json
+import math
+import subprocess
+import sys
+
+import pytest
+
+from mobius_motor import cli
+from mobius_motor.core import motor_step
+from mobius_motor.optimize import lambda_optimize
+from mobius_motor.records import RecordWriter, chunked, guess_format
+
+
+ROWS = [
+    {"k": 2.0, "P": 0.8, "U": 10.0, "theta": 0.9},   # Wrap
+    {"k": 0.5, "P": 0.5, "U": 10.0, "theta": 0.9},   # Wrap invalid (kP <= 1) → inf
+    {"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.5},    # Steady
+    {"k": 1.5, "P": 0.5, "U": 20.0, "theta": 0.1},   # Unwrap
+]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0]))
+        w.writeheader()
+        w.writerows(rows)
+
+
+def _read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_step_csv_to_ndjson_matches_motor_step(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.ndjson"
+    _write_csv(src, ROWS)
+    cli.main(["step", "--input", str(src), "--output", str(dst), "--chunk-size", "3"])
+    out = _read_ndjson(dst)
+    assert [r["index"] for r in out] == [0, 1, 2, 3]
+    for row, res in zip(ROWS, out):
+        val, st = motor_step(**row)
+        assert res["state"] == st
+        assert res["value"] is None if math.isinf(val) else res["value"] == pytest.approx(val, rel=1e-12)
+
+
+def test_step_ndjson_to_csv_uses_cli_defaults(tmp_path):
+    src, dst = tmp_path / "in.ndjson", tmp_path / "out.csv"
+    src.write_text('{"k": 2.0, "P": 0.8}\n\n{"k": 1.0, "P": 1.0, "theta": 0.5}\n')
+    cli.main(["step", "--input", str(src), "--output", str(dst), "--U", "10", "--theta", "0.9"])
+    rows = list(csv.DictReader(dst.open()))
+    assert [r["state"] for r in rows] == ["1", "0"]
+    assert rows[0]["U"] == "10.0" and rows[1]["theta"] == "0.5"
+
+
+def test_step_reports_bad_record_with_line(tmp_path, capsys):
+    src = tmp_path / "in.ndjson"
+    src.write_text('{"k": 2.0, "P": 0.8, "U": 10, "theta": 0.9}\n{"k": "x", "P": 1, "U": 1, "theta": 0.5}\n')
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["step", "--input", str(src), "--output", str(tmp_path / "out.ndjson")])
+    assert exc.value.code == 1
+    assert "line 2" in capsys.readouterr().err
+
+
+def test_step_writes_valid_prefix_before_bad_record(tmp_path, capsys):
+    src, dst = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    good = json.dumps(ROWS[0]) + "\n"
+    src.write_text(good + good + '{"k": "x", "P": 1, "U": 1, "theta": 0.5}\n' + good)
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["step", "--input", str(src), "--output", str(dst)])
+    assert exc.value.code == 1 and "line 3" in capsys.readouterr().err
+    assert [r["index"] for r in _read_ndjson(dst)] == [0, 1]
+
+
+def test_single_step_still_requires_params():
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["step", "--k", "1.0"])
+    assert exc.value.code == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_optimize_stream_matches_lambda_optimize(tmp_path, workers):
+    src, dst = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    records = [{"theta": 0.5, "target": t} for t in (2.0, 3.0, 4.0)] + [
+        {"theta": 0.9, "mode": "state", "desired_state": 1}
+    ]
+    src.write_text("".join(json.dumps(r) + "\n" for r in records))
+    cli.main(["optimize", "--mode", "value", "--input", str(src), "--output", str(dst),
+              "--workers", str(workers), "--chunk-size", "1"])
+    out = _read_ndjson(dst)
+    assert [r["index"] for r in out] == [0, 1, 2, 3]
+    expected = lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0)
+    assert out[1]["params_opt"] == pytest.approx(expected["params_opt"])
+    assert out[3]["mode"] == "state" and out[3]["final_state"] == 1
+
+
+def test_optimize_stream_csv_flattens_params(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(src, [{"theta": 0.5, "target": 3.0, "mode": "value"}])
+    cli.main(["optimize", "--input", str(src), "--output", str(dst)])
+    (row,) = csv.DictReader(dst.open())
+    assert float(row["final_value"]) == pytest.approx(3.0)
+    assert set(cli.OPTIMIZE_FIELDS) == set(row)
+
+
+def test_optimize_stream_needs_mode(tmp_path, capsys):
+    src = tmp_path / "in.ndjson"
+    src.write_text('{"theta": 0.5}\n')
+    with pytest.raises(SystemExit):
+        cli.main(["optimize", "--input", str(src), "--output", str(tmp_path / "o.ndjson")])
+    assert "missing field 'mode'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("bad", [
+    '{"theta": 0.5, "mode": "nope"}',         # respinsă la citire
+    '{"theta": 0.5, "mode": "value"}',        # respinsă de lambda_optimize (fără target)
+    '{"theta": 0.5, "target": 2.0',           # JSON invalid
+])
+def test_optimize_writes_valid_prefix_before_bad_record(tmp_path, capsys, workers, bad):
+    src, dst = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    good = '{"theta": 0.5, "mode": "value", "target": 2.0}\n'
+    src.write_text(good + good + bad + "\n" + good)
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["optimize", "--input", str(src), "--output", str(dst), "--workers", str(workers)])
+    assert exc.value.code == 1 and "line 3" in capsys.readouterr().err
+    assert [r["index"] for r in _read_ndjson(dst)] == [0, 1]
+
+
+def test_step_from_stdin_subprocess():
+    data = "".join(json.dumps(r) + "\n" for r in ROWS)
+    result = subprocess.run(
+        [sys.executable, "-m", "mobius_motor.cli", "step", "--input", "-"],
+        input=data, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["state"] for r in lines] == [1, 1, 0, -1]
+    assert lines[1]["value"] is None
+
+
+def test_records_helpers():
+    assert guess_format("a.CSV") == "csv"
+    assert guess_format("a.jsonl") == "ndjson"
+    assert guess_format("-", default="csv") == "csv"
+    assert guess_format("a.csv", "ndjson") == "ndjson"
+    assert [len(c) for c in chunked(range(10), 4)] == [4, 4, 2]
+    with pytest.raises(ValueError):
+        RecordWriter(None, "xml", ())
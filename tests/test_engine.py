@@ -1,6 +1,11 @@
 # tests/test_engine.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import pytest
-from mobius_motor.engine import run_engine, Metrics
+from mobius_motor import engine
+from mobius_motor.engine import run_engine, run_engine_async, run_engine_batch, Metrics
 
 def test_engine_wrap_path():
     # theta mare → Arbiter = Wrap (+1)
@@ -34,3 +39,88 @@ def test_engine_regen_integration():
     assert res["regen"] is not None
     assert res["regen"]["detect"]["anomalies"] is True
     assert res["regen"]["final"]["state"] in (-1, 0, 1)
+
+
+def _strip_random(res):
+    # entropy e aleator, iar timpii diferă de la o rulare la alta
+    return {k: v for k, v in res.items() if k not in ("entropy", "stage_times")}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_engine_concurrent_matches_sequential(executor):
+    m = Metrics(error_rate=0.2, latency_p95_ms=2000.0, utilization=0.95, drift=0.4, theta=0.25)
+    seq = run_engine(k=1.0, P=1.0, U=5.0, theta=0.25, metrics=m, iters=30)
+    par = run_engine(k=1.0, P=1.0, U=5.0, theta=0.25, metrics=m, iters=30, executor=executor, max_workers=2)
+    assert _strip_random(par) == _strip_random(seq)
+    assert set(par["stage_times"]) == {"base", "regen", "balance", "optimize", "entropy", "total"}
+
+
+def test_engine_async_with_shared_executor():
+    m = Metrics(error_rate=0.0, latency_p95_ms=500.0, utilization=0.5, drift=0.0, theta=0.9)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        res = asyncio.run(run_engine_async(k=2.0, P=0.8, U=10.0, theta=0.9, metrics=m, iters=50, executor=pool))
+    assert _strip_random(res) == _strip_random(run_engine(k=2.0, P=0.8, U=10.0, theta=0.9, metrics=m, iters=50))
+    assert res["stage_times"]["total"] >= res["stage_times"]["optimize"]
+
+
+def test_engine_rejects_unknown_executor():
+    with pytest.raises(ValueError):
+        run_engine(k=1.0, P=1.0, U=5.0, theta=0.5, executor="gpu")
+
+
+def _fleet():
+    m = Metrics(error_rate=0.2, latency_p95_ms=2000.0, utilization=0.95, drift=0.4, theta=0.25)
+    return [
+        {"k": 2.0, "P": 0.8, "U": 10.0, "theta": 0.9},
+        {"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.5, "metrics": m},
+        {"k": 0.5, "P": 0.8, "U": 10.0, "theta": 0.1, "iters": 50},
+        {"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.6, "metrics": m},   # aceeași stare ca #2
+        {"k": 2.0, "P": 0.8, "U": 10.0, "theta": 0.9},                 # duplicat exact al #1
+    ]
+
+
+def test_engine_batch_matches_run_engine():
+    fleet = _fleet()
+    out = run_engine_batch(fleet, history=True)
+    assert len(out) == len(fleet)
+    for item, res in zip(fleet, out):
+        ref = run_engine(item["k"], item["P"], item["U"], item["theta"],
+                         metrics=item.get("metrics"), iters=item.get("iters", 100))
+        for key in ("arbiter_state", "base", "regen", "optimize"):
+            assert res[key] == ref[key], key
+        # balance_batch folosește numpy (log/pow pot diferi în ultimul bit)
+        assert res["balance"]["final_value"] == pytest.approx(ref["balance"]["final_value"], rel=1e-12)
+        assert len(res["balance"]["history"]) == len(ref["balance"]["history"])
+        assert res["entropy"]["trials"] == 20
+        assert set(res["entropy"]) == set(ref["entropy"])
+        assert "stage_times" not in res
+
+
+def test_engine_batch_dedupes_shared_work():
+    with mock.patch.object(engine, "lambda_optimize", wraps=engine.lambda_optimize) as opt, \
+         mock.patch.object(engine, "regen_cycle", wraps=engine.regen_cycle) as regen:
+        out = run_engine_batch(_fleet())
+    # (k, P, U, stare) unice: 3; metrics unice per (k, P, U): 1
+    assert opt.call_count == 3
+    assert regen.call_count == 1
+    assert out[0] is not out[4] and out[0]["base"] is out[4]["base"]
+    assert out[1]["optimize"]["theta"] == 0.5 and out[3]["optimize"]["theta"] == 0.6
+
+
+def test_engine_batch_rounds_to_canonical_keys():
+    fleet = [{"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.5},
+             {"k": 1.0 + 1e-12, "P": 1.0, "U": 5.0, "theta": 0.5 + 1e-12}]
+    out = run_engine_batch(fleet, decimals=9)
+    assert out[0]["base"] is out[1]["base"]
+    assert out[0]["entropy"] is out[1]["entropy"]
+    assert run_engine_batch([]) == []
+
+
+def test_engine_batch_keeps_only_final_balance_state_by_default():
+    fleet = _fleet()
+    full = run_engine_batch(fleet, history=True)
+    lean = run_engine_batch(fleet)
+    for a, b in zip(full, lean):
+        assert b["balance"]["history"] is None and a["balance"]["history"]
+        assert {k: v for k, v in a["balance"].items() if k != "history"} == \
+               {k: v for k, v in b["balance"].items() if k != "history"}
@@ -1,5 +1,9 @@
 # tests/test_entropy.py
-from mobius_motor.entropy import entropy_step
+import numpy as np
+import pytest
+
+from mobius_motor.core import motor_step_batch
+from mobius_motor.entropy import entropy_batch, entropy_step
 
 def test_entropy_runs():
     res = entropy_step(k=1.0, P=1.0, U=5.0, theta=0.5, trials=20, perturb=0.2)
@@ -14,3 +18,66 @@ def test_entropy_runs():
     # Consistență numerică
     assert res["min_value"] <= res["avg_value"] <= res["max_value"]
     assert isinstance(res["distinct_states"], list)
+
+
+def test_entropy_seed_is_reproducible_across_chunk_sizes():
+    a = entropy_step(k=2.0, P=0.8, U=10.0, theta=0.9, trials=5000, perturb=0.2, seed=42, chunk_size=5000)
+    b = entropy_step(k=2.0, P=0.8, U=10.0, theta=0.9, trials=5000, perturb=0.2, seed=42, chunk_size=333)
+    assert a == entropy_step(k=2.0, P=0.8, U=10.0, theta=0.9, trials=5000, perturb=0.2, seed=42, chunk_size=5000)
+    assert a["min_value"] == b["min_value"] and a["max_value"] == b["max_value"]
+    assert a["avg_value"] == pytest.approx(b["avg_value"], rel=1e-12)
+    assert a["std_value"] == pytest.approx(b["std_value"], rel=1e-9)
+    assert a["quantiles"] == b["quantiles"]
+
+
+def test_entropy_streaming_stats_match_full_sample():
+    res = entropy_step(k=1.0, P=1.0, U=5.0, theta=0.5, trials=3000, perturb=0.2, seed=7, chunk_size=256)
+    # reconstruim aceleași perturbații
+    noise_seq, _ = np.random.SeedSequence(7).spawn(2)
+    noise = 1.0 + np.random.default_rng(noise_seq).uniform(-0.2, 0.2, size=(3000, 3))
+    values, _ = motor_step_batch(noise[:, 0], noise[:, 1], 5.0 * noise[:, 2], 0.5)
+
+    assert res["avg_value"] == pytest.approx(values.mean(), rel=1e-12)
+    assert res["std_value"] == pytest.approx(values.std(ddof=1), rel=1e-9)
+    assert res["min_value"] == values.min() and res["max_value"] == values.max()
+    # 3000 <= sample_size → cuantile exacte
+    assert res["quantiles"]["0.5"] == pytest.approx(np.quantile(values, 0.5))
+    assert res["state_counts"] == {0: 3000}
+
+
+def test_entropy_single_batch_matches_streaming_path():
+    # trials <= chunk_size și <= sample_size → ramura rapidă; chunk_size=7 forțează calea în flux
+    fast = entropy_step(k=2.0, P=0.8, U=10.0, theta=0.9, trials=300, perturb=0.2, seed=4)
+    slow = entropy_step(k=2.0, P=0.8, U=10.0, theta=0.9, trials=300, perturb=0.2, seed=4, chunk_size=7)
+    assert fast["min_value"] == slow["min_value"] and fast["max_value"] == slow["max_value"]
+    assert fast["avg_value"] == pytest.approx(slow["avg_value"], rel=1e-12)
+    assert fast["std_value"] == pytest.approx(slow["std_value"], rel=1e-9)
+    assert fast["quantiles"] == slow["quantiles"]
+    assert fast["state_counts"] == slow["state_counts"] == {1: 300}
+    assert fast["distinct_states"] == slow["distinct_states"]
+
+    one = entropy_step(k=1.0, P=1.0, U=5.0, theta=0.5, trials=1, seed=0)
+    assert one["std_value"] == 0.0 and one["min_value"] == one["max_value"] == one["quantiles"]["0.5"]
+
+
+def test_entropy_many_trials_bounded_memory():
+    res = entropy_step(k=2.0, P=0.8, U=10.0, theta=0.1, trials=1_000_000, perturb=0.1, seed=1)
+    assert res["trials"] == 1_000_000
+    assert sum(res["state_counts"].values()) == 1_000_000
+    assert res["quantiles"]["0.05"] <= res["quantiles"]["0.5"] <= res["quantiles"]["0.95"]
+
+
+def test_entropy_rejects_zero_trials():
+    with pytest.raises(ValueError):
+        entropy_step(k=1.0, P=1.0, U=5.0, theta=0.5, trials=0)
+
+
+def test_entropy_batch_per_row_stats():
+    out = entropy_batch([1.0, 2.0], [1.0, 0.8], [5.0, 10.0], [0.5, 0.9], trials=30, seed=3)
+    assert len(out) == 2
+    assert out == entropy_batch([1.0, 2.0], [1.0, 0.8], [5.0, 10.0], [0.5, 0.9], trials=30, seed=3)
+    for res, state in zip(out, (0, 1)):
+        assert res["trials"] == 30 and res["distinct_states"] == [state]
+        assert res["state_counts"] == {state: 30}
+        assert res["min_value"] <= res["quantiles"]["0.5"] <= res["max_value"]
+        assert np.isfinite(res["std_value"])
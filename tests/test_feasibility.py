@@ -0,0 +1,60 @@
+# tests/test_feasibility.py
+import math
+
+import pytest
+
+from mobius_motor.feasibility import analyze_state_request
+from mobius_motor.optimize import lambda_optimize
+from mobius_motor.regen import improve_params
+
+BOUNDS = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0))
+
+
+def test_infeasible_reports_reason():
+    fa = analyze_state_request((1.0, 1.0, 5.0), theta=0.9, desired_state=0, bounds=BOUNDS)
+    assert fa["status"] == "infeasible"
+    assert "theta" in fa["reason"]
+    assert fa["state"] == 1 and fa["params"] == (5.0, 2.0, 1.0)
+
+
+def test_searchable_for_non_positive_bounds():
+    fa = analyze_state_request((1.0, 1.0, 5.0), 0.1, -1, bounds=((-1.0, 1.0), (0.1, 2.0), (1.0, 100.0)))
+    assert fa["status"] == "searchable"
+
+
+@pytest.mark.parametrize("start,theta,state", [
+    ((1.0, 1.0, 5.0), 0.5, 0),
+    ((0.8, 0.6, 10.0), 0.85, 1),
+    ((1.2, 0.8, 8.0), 0.15, -1),
+    ((3.0, 1.5, 50.0), 0.05, -1),
+])
+def test_satisfied_is_at_least_as_good_as_search(start, theta, state):
+    fast = lambda_optimize(initial_guess=start, theta=theta, mode="state", desired_state=state)
+    slow = lambda_optimize(initial_guess=start, theta=theta, mode="state", desired_state=state, analytic=False)
+    assert fast["feasibility"]["status"] == "satisfied"
+    assert fast["iters"] == 0
+    assert fast["final_state"] == state
+    assert fast["loss"] <= slow["loss"] + 1e-12
+
+
+def test_infeasible_returns_immediately():
+    res = lambda_optimize(initial_guess=(1.0, 1.0, 5.0), theta=0.9, mode="state", desired_state=-1)
+    assert res["feasibility"]["status"] == "infeasible"
+    assert res["iters"] == 0
+    assert res["final_state"] == 1
+    assert res["termination"] == "infeasible"
+
+
+def test_infeasible_still_minimises_lambda():
+    # Λ minim pentru starea aleasă de Arbiter (Wrap), nu punctul de start (Λ = inf)
+    res = lambda_optimize(initial_guess=(1.0, 1.0, 5.0), theta=0.9, mode="state", desired_state=-1)
+    assert math.isfinite(res["final_value"]) and math.isfinite(res["loss"])
+    assert res["loss"] == pytest.approx(1000.0 + 0.001 * abs(res["final_value"]))
+    slow = lambda_optimize(initial_guess=(1.0, 1.0, 5.0), theta=0.9, mode="state", desired_state=-1, analytic=False)
+    assert res["loss"] <= slow["loss"] + 1e-12
+
+
+def test_improve_params_outside_steady_band():
+    # regen cere starea 0, dar theta=0.1 → Unwrap: imposibil
+    res = improve_params(1.0, 1.0, 5.0, theta=0.1)
+    assert res["feasibility"]["status"] == "infeasible"
@@ -0,0 +1,55 @@
+# tests/test_gradient.py
+import math
+
+import numpy as np
+import pytest
+
+from mobius_motor.core import motor_step, motor_step_batch
+from mobius_motor.gradient import lambda_gradient, lambda_gradient_scalar
+
+
+def _grid(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.1, 3.0, n), rng.uniform(0.1, 2.0, n),
+            rng.uniform(1.01, 50.0, n), rng.uniform(0.0, 1.0, n))
+
+
+def test_gradient_matches_finite_differences():
+    k, P, U, theta = _grid()
+    values, grad, states = lambda_gradient(k, P, U, theta)
+    ref_values, ref_states = motor_step_batch(k, P, U, theta)
+    np.testing.assert_array_equal(states, ref_states)
+    np.testing.assert_allclose(values, ref_values, rtol=1e-12)
+
+    checked = 0
+    for i in range(len(k)):
+        x = np.array([k[i], P[i], U[i]])
+        if not np.isfinite(values[i]) or abs(x[0] * x[1] - 1) < 1e-2:
+            continue
+        for j in range(3):
+            h = 1e-6 * max(1.0, abs(x[j]))
+            xp, xm = x.copy(), x.copy()
+            xp[j] += h
+            xm[j] -= h
+            fd = (motor_step(*xp, theta[i])[0] - motor_step(*xm, theta[i])[0]) / (2 * h)
+            assert grad[i, j] == pytest.approx(fd, rel=1e-5, abs=1e-6)
+        checked += 1
+    assert checked > 100
+
+
+def test_scalar_kernel_matches_vectorized():
+    k, P, U, theta = _grid(100, seed=1)
+    values, grad, states = lambda_gradient(k, P, U, theta)
+    for i in range(len(k)):
+        val, g, st = lambda_gradient_scalar(float(k[i]), float(P[i]), float(U[i]), float(theta[i]))
+        assert st == states[i]
+        if math.isfinite(val):
+            assert val == pytest.approx(values[i], rel=1e-12)
+            np.testing.assert_allclose(g, grad[i], rtol=1e-10)
+
+
+def test_invalid_wrap_has_nan_gradient_and_steady_ignores_k_P():
+    values, grad, states = lambda_gradient([0.5, 1.0], [1.0, 1.0], [10.0, 10.0], [0.9, 0.5])
+    assert states.tolist() == [1, 0]
+    assert np.isinf(values[0]) and np.isnan(grad[0]).all()
+    assert grad[1].tolist() == [0.0, 0.0, pytest.approx(0.1)]
@@ -0,0 +1,76 @@
+# tests/test_instrumentation.py
+from fastapi.testclient import TestClient
+
+from aios.api import app
+from mobius_motor import instrumentation as ins
+from mobius_motor.instrumentation import Registry
+from mobius_motor.optimize import lambda_optimize
+from mobius_motor.engine import run_engine
+
+
+def test_counter_and_histogram_render_prometheus_text():
+    reg = Registry()
+    c = reg.counter("x_total", "things", ("kind",))
+    h = reg.histogram("y_seconds", "latency", buckets=(0.1, 1.0))
+    c.inc(kind="a")
+    c.inc(2, kind="a")
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v)
+    text = reg.render()
+    assert '# TYPE x_total counter' in text
+    assert 'x_total{kind="a"} 3' in text
+    assert 'y_seconds_bucket{le="0.1"} 2' in text      # le este inclusiv
+    assert 'y_seconds_bucket{le="1"} 3' in text
+    assert 'y_seconds_bucket{le="+Inf"} 4' in text
+    assert 'y_seconds_count 4' in text and 'y_seconds_sum 3.65' in text
+
+
+def test_disabled_is_noop(monkeypatch):
+    reg = Registry()
+    c = reg.counter("z_total", "z")
+    monkeypatch.setattr(ins, "ENABLED", False)
+    c.inc()
+    assert c.value() == 0
+
+
+def test_optimizer_and_engine_are_instrumented():
+    runs = ins.OPTIMIZE_RUNS.value(method="coordinate", mode="value", termination="max_iters")
+    res = lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0, analytic=False, max_iters=3)
+    assert res["termination"] == "max_iters" and res["method"] == "coordinate"
+    assert ins.OPTIMIZE_RUNS.value(method="coordinate", mode="value", termination="max_iters") == runs + 1
+
+    trials = ins.ENTROPY_TRIALS.value()
+    stages = ins.ENGINE_STAGE_SECONDS.count(stage="entropy")
+    run_engine(k=1.0, P=1.0, U=5.0, theta=0.5)
+    assert ins.ENTROPY_TRIALS.value() == trials + 20
+    assert ins.ENGINE_STAGE_SECONDS.count(stage="entropy") == stages + 1
+
+
+def test_termination_reports_convergence_on_the_last_iteration():
+    kwargs = dict(initial_guess=(1.0, 1.0, 5.0), theta=0.5, mode="value", target=3.0, analytic=False)
+    free = lambda_optimize(**kwargs)
+    assert free["termination"] == "converged"
+    exact = lambda_optimize(**kwargs, max_iters=free["iters"])
+    assert exact["iters"] == free["iters"] and exact["termination"] == "converged"
+    assert lambda_optimize(**kwargs, max_iters=free["iters"] - 1)["termination"] == "max_iters"
+
+
+def test_arbiter_states_count_cached_step_responses():
+    client = TestClient(app)
+    payload = {"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.95}
+    client.post("/step", json=payload)   # populează cache-ul
+    before = ins.ARBITER_STATES.value(state=1)
+    for _ in range(3):
+        assert client.post("/step", json=payload).status_code == 200
+    assert ins.ARBITER_STATES.value(state=1) == before + 3
+
+
+def test_metrics_endpoint_reports_request_latency():
+    client = TestClient(app)
+    client.post("/step", json={"k": 1.0, "P": 1.0, "U": 5.0, "theta": 0.5})
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'aios_http_request_duration_seconds_count{method="POST",path="/step",status="200"}' in r.text
+    assert 'mobius_arbiter_states_total{state="0"}' in r.text
+    assert 'aios_response_cache_hits{cache="step"}' in r.text
@@ -0,0 +1,32 @@
+# tests/test_inverse.py
+import pytest
+
+from mobius_motor.core import motor_step
+from mobius_motor.inverse import solve_value
+
+BOUNDS = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0))
+
+
+@pytest.mark.parametrize("start,theta,target", [
+    ((1.0, 1.0, 5.0), 0.5, 3.0),      # Steady: U = exp(3)
+    ((2.0, 0.8, 5.0), 0.9, 4.0),      # Wrap: U din k·P = 1.6
+    ((1.0, 1.0, 10.0), 0.9, 4.0),     # Wrap: k·P = 1 → se rezolvă k·P cu U fix
+    ((0.5, 0.8, 5.0), 0.1, 3.0),      # Unwrap convergent: U din k·P = 0.4
+    ((2.0, 1.0, 10.0), 0.1, 5.0),     # Unwrap divergent la start → se rezolvă k·P
+])
+def test_solve_value_hits_target(start, theta, target):
+    params = solve_value(start, theta, target, bounds=BOUNDS)
+    assert params is not None
+    for x, (lo, hi) in zip(params, BOUNDS):
+        assert lo <= x <= hi
+    val, _ = motor_step(*params, theta)
+    assert val == pytest.approx(target, rel=1e-9)
+
+
+def test_solve_value_unreachable():
+    # Steady: log U <= log 100 ≈ 4.6
+    assert solve_value((1.0, 1.0, 5.0), 0.5, 10.0, bounds=BOUNDS) is None
+    # starea cerută nu corespunde lui theta
+    assert solve_value((1.0, 1.0, 5.0), 0.5, 3.0, desired_state=1, bounds=BOUNDS) is None
+    # ținta negativă nu e atinsă cu U >= 1
+    assert solve_value((1.0, 1.0, 5.0), 0.5, -1.0, bounds=BOUNDS) is None
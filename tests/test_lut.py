@@ -0,0 +1,105 @@
+# tests/test_lut.py
+import math
+
+import numpy as np
+import pytest
+
+from mobius_motor.core import motor_step, motor_step_batch
+from mobius_motor.lut import LambdaLUT
+
+BOUNDS = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0))
+
+
+@pytest.fixture(scope="module")
+def lut():
+    return LambdaLUT.build(BOUNDS, n_x=512, n_u=512)
+
+
+def _points(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.1, 5.0, n), rng.uniform(0.1, 2.0, n),
+            rng.uniform(1.0, 100.0, n), rng.uniform(0.0, 1.0, n))
+
+
+def test_step_within_error_bound(lut):
+    worst = {}
+    for k, P, U, theta in zip(*(a.tolist() for a in _points())):
+        exact, state = motor_step(k, P, U, theta)
+        value, lut_state = lut.step(k, P, U, theta)
+        assert lut_state == state
+        if math.isinf(exact):
+            assert math.isinf(value)
+            continue
+        bound = lut.error_bound(k, P, U, theta)
+        err = abs(value - exact)
+        assert err <= bound + 1e-12 * abs(exact)
+        x = k * P
+        name = "steady" if state == 0 else "wrap" if state == 1 else "unwrap_lo" if x < 1 else "unwrap_hi"
+        if bound > 0:
+            worst[name] = max(worst.get(name, 0.0), err)
+    for name, err in worst.items():
+        assert err <= lut.max_error[name] * (1 + 1e-9)
+
+
+def test_step_batch_matches_step(lut):
+    k, P, U, theta = _points(500, seed=1)
+    values, states = lut.step_batch(k, P, U, theta)
+    _, exact_states = motor_step_batch(k, P, U, theta)
+    np.testing.assert_array_equal(states, exact_states)
+    scalar = np.array([lut.step(*args)[0] for args in zip(k.tolist(), P.tolist(), U.tolist(), theta.tolist())])
+    np.testing.assert_allclose(values, scalar, rtol=1e-12)
+
+
+@pytest.mark.parametrize("args", [
+    (2.0, 0.8, 150.0, 0.9),    # U peste tabel
+    (2.0, 0.8, 0.5, 0.1),      # U < 1
+    (1.0, 1.02, 10.0, 0.1),    # k·P lângă 1 (Unwrap)
+    (1.0, 1.02, 10.0, 0.9),    # k·P lângă 1 (Wrap)
+    (0.5, 0.5, 10.0, 0.9),     # Wrap invalid → inf
+    (9.0, 3.0, 10.0, 0.1),     # k·P peste tabel
+])
+def test_fallback_is_exact(lut, args):
+    value, state = lut.step(*args)
+    exact, exact_state = motor_step(*args)
+    assert state == exact_state
+    assert value == exact or (math.isnan(value) and math.isnan(exact))
+    assert lut.error_bound(*args) == 0.0
+    batch_value = lut.step_batch(*args)[0][0]
+    assert batch_value == pytest.approx(exact, rel=1e-12) or batch_value == exact
+
+
+def test_finer_grid_tightens_bound():
+    coarse = LambdaLUT.build(BOUNDS, n_x=256, n_u=256)
+    fine = LambdaLUT.build(BOUNDS, n_x=1024, n_u=1024)
+    for name in ("wrap", "unwrap_lo", "steady"):
+        assert fine.max_error[name] < coarse.max_error[name] / 10
+
+
+def test_save_load_mmap(lut, tmp_path):
+    lut.save(str(tmp_path / "lut"))
+    loaded = LambdaLUT.load(str(tmp_path / "lut"))
+    assert isinstance(loaded.tables["g"], np.memmap)
+    assert loaded.max_error == lut.max_error
+    k, P, U, theta = _points(200, seed=2)
+    np.testing.assert_array_equal(loaded.step_batch(k, P, U, theta)[0], lut.step_batch(k, P, U, theta)[0])
+    assert loaded.step(2.0, 0.8, 10.0, 0.9) == lut.step(2.0, 0.8, 10.0, 0.9)
+
+
+def test_thresholds_and_T1_follow_build():
+    lut = LambdaLUT.build(BOUNDS, n_x=256, n_u=256, low_threshold=0.2, high_threshold=0.5, T1=2.0)
+    value, state = lut.step(2.0, 0.8, 10.0, 0.6)
+    exact, exact_state = motor_step(2.0, 0.8, 10.0, 0.6, 0.2, 0.5, 2.0)
+    assert state == exact_state == 1
+    assert abs(value - exact) <= lut.error_bound(2.0, 0.8, 10.0, 0.6) + 1e-12
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"bounds": ((0.0, 5.0), (0.1, 2.0), (1.0, 100.0))},
+    {"bounds": ((0.1, 5.0), (0.1, 2.0), (0.5, 1.0))},
+    {"n_x": 1},
+    {"margin": 0.0},
+    {"low_threshold": 0.7, "high_threshold": 0.3},
+])
+def test_build_validation(kwargs):
+    with pytest.raises(ValueError):
+        LambdaLUT.build(**kwargs)
@@ -0,0 +1,65 @@
+# tests/test_offload.py
+import asyncio
+import time
+
+import pytest
+
+from aios.api import OptimizeInput
+from aios.offload import Offloader, Saturated, canonical_key
+from mobius_motor.optimize import lambda_optimize
+
+CALLS = []
+
+
+def _slow_square(x, delay=0.05):
+    CALLS.append(x)
+    time.sleep(delay)
+    return {"square": x * x}
+
+
+def test_canonical_key_ignores_field_order_and_number_form():
+    a = OptimizeInput.model_validate({"theta": 0.5, "mode": "value", "target": 3, "k": 1})
+    b = OptimizeInput.model_validate({"k": 1.0, "target": 3.0, "mode": "value", "theta": 0.5})
+    c = OptimizeInput.model_validate({"k": 1.0, "target": 3.5, "mode": "value", "theta": 0.5})
+    assert canonical_key(a) == canonical_key(b) != canonical_key(c)
+
+
+def test_identical_requests_share_one_computation():
+    CALLS.clear()
+    off = Offloader(max_workers=2, executor="thread")
+
+    async def main():
+        return await asyncio.gather(*(off.run("same", _slow_square, 3) for _ in range(10)))
+
+    results = asyncio.run(main())
+    assert results == [{"square": 9}] * 10
+    assert CALLS == [3]
+    assert off.stats()["submitted"] == 1 and off.stats()["coalesced"] == 9
+    assert off.stats()["in_flight"] == 0
+    off.shutdown()
+
+
+def test_admission_control_rejects_when_saturated():
+    off = Offloader(max_workers=1, max_pending=2, executor="thread")
+
+    async def main():
+        first = [asyncio.ensure_future(off.run(f"k{i}", _slow_square, i)) for i in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(Saturated):
+            await off.run("k3", _slow_square, 3)
+        # o cerere identică cu una în curs nu ocupă un loc nou
+        shared = await off.run("k0", _slow_square, 0)
+        return shared, await asyncio.gather(*first)
+
+    shared, results = asyncio.run(main())
+    assert shared == results[0]
+    assert off.stats()["rejected"] == 1
+    off.shutdown()
+
+
+def test_process_pool_runs_optimizer():
+    off = Offloader(max_workers=1, executor="process")
+    kw = dict(initial_guess=(1.0, 1.0, 5.0), theta=0.5, mode="value", target=3.0)
+    res = asyncio.run(off.run("opt", lambda_optimize, **kw))
+    assert res == lambda_optimize(**kw)
+    off.shutdown()
@@ -0,0 +1,89 @@
+# tests/test_optimize.py
+import math
+
+import pytest
+
+from mobius_motor.optimize import lambda_optimize, lambda_optimize_multistart, latin_hypercube
+
+BOUNDS = ((0.1, 5.0), (0.1, 2.0), (1.0, 100.0))
+
+
+def test_latin_hypercube_stratified_and_deterministic():
+    pts = latin_hypercube(10, BOUNDS, seed=3)
+    assert pts == latin_hypercube(10, BOUNDS, seed=3)
+    assert len(pts) == 10
+    for axis, (lo, hi) in enumerate(BOUNDS):
+        strata = sorted(int((p[axis] - lo) / (hi - lo) * 10) for p in pts)
+        assert strata == list(range(10))
+
+
+def test_multistart_not_worse_than_single_start():
+    kw = dict(theta=0.9, mode="value", target=4.0, desired_state=1)
+    single = lambda_optimize(initial_guess=(1.0, 1.0, 5.0), **kw)
+    multi = lambda_optimize_multistart(initial_guess=(1.0, 1.0, 5.0), n_starts=6, seed=1, max_workers=1, **kw)
+    assert multi["loss"] <= single["loss"]
+    assert multi["multistart"]["n_starts"] == 6
+    assert len(multi["multistart"]["starts"]) == 6
+
+
+def test_multistart_process_pool_matches_serial():
+    kw = dict(theta=0.45, mode="value", target=3.0, desired_state=0, n_starts=4, seed=7)
+    serial = lambda_optimize_multistart(max_workers=1, **kw)
+    parallel = lambda_optimize_multistart(max_workers=2, **kw)
+    assert serial == parallel
+    assert parallel["final_state"] == 0
+
+
+def test_de_method_keeps_schema_and_reaches_target():
+    kw = dict(initial_guess=(1.0, 1.0, 5.0), theta=0.45, mode="value", target=3.0, desired_state=0)
+    coord = lambda_optimize(analytic=False, **kw)
+    de = lambda_optimize(method="de", seed=3, analytic=False, **kw)
+    assert set(de) == set(coord)
+    assert de["final_state"] == 0
+    assert abs(de["final_value"] - 3.0) < 1e-3
+    assert de["iters"] > 0
+    assert de == lambda_optimize(method="de", seed=3, analytic=False, **kw)   # determinist
+
+
+def test_de_method_state_mode_respects_bounds():
+    res = lambda_optimize(initial_guess=(0.8, 0.6, 10.0), theta=0.85, mode="state", desired_state=1,
+                          method="de", bounds=BOUNDS)
+    assert res["final_state"] == 1
+    for name, (lo, hi) in zip(("k", "P", "U"), BOUNDS):
+        assert lo <= res["params_opt"][name] <= hi
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        lambda_optimize(initial_guess=(1.0, 1.0, 5.0), theta=0.5, mode="value", target=1.0, method="sgd")
+
+
+def test_value_mode_uses_analytic_solution():
+    res = lambda_optimize(initial_guess=(1.0, 1.0, 5.0), theta=0.45, mode="value", target=3.0, desired_state=0)
+    assert res["iters"] == 0
+    assert res["final_value"] == pytest.approx(3.0, rel=1e-9)
+    assert res["params_opt"]["U"] == pytest.approx(math.exp(3.0))
+
+
+@pytest.mark.parametrize("theta, start, target", [
+    (0.5, (1.0, 1.0, 5.0), 3.0),
+    (0.9, (2.0, 0.8, 10.0), 4.0),
+    (0.1, (0.5, 0.8, 10.0), 2.0),
+    (0.9, (0.5, 0.5, 5.0), 3.0),    # start în Wrap invalid (Λ = inf)
+    (0.1, (1.5, 1.5, 10.0), 500.0), # start pe ramura divergentă Unwrap
+])
+def test_gradient_method_converges_in_few_iterations(theta, start, target):
+    res = lambda_optimize(start, theta, mode="value", target=target, method="gradient", analytic=False)
+    assert res["loss"] <= 1e-6
+    assert res["iters"] < 100
+    for name, (lo, hi) in res["bounds"].items():
+        assert lo <= res["params_opt"][name] <= hi
+
+
+def test_gradient_method_state_mode_matches_coordinate():
+    for theta, state in ((0.9, 1), (0.1, -1), (0.5, 0)):
+        grad = lambda_optimize((2.0, 0.8, 10.0), theta, mode="state", desired_state=state,
+                               method="gradient", analytic=False)
+        coord = lambda_optimize((2.0, 0.8, 10.0), theta, mode="state", desired_state=state, analytic=False)
+        assert grad["final_state"] == state
+        assert grad["loss"] <= coord["loss"] + 1e-9
@@ -1,5 +1,11 @@
 # tests/test_regen.py
-from mobius_motor.regen import Metrics, detect_anomalies, regen_cycle
+import numpy as np
+import pytest
+
+from mobius_motor.regen import (
+    Metrics, MetricsBatch, decode_actions, decode_reasons, detect_anomalies, detect_anomalies_batch,
+    quarantine_plan, quarantine_plan_batch, regen_cycle, REASON_ERROR, REASON_THETA,
+)
 
 def test_detect_flags_high_error_and_latency():
     m = Metrics(error_rate=0.2, latency_p95_ms=2000.0, utilization=0.95, drift=0.4, theta=0.25)
@@ -14,3 +20,46 @@ def test_regen_cycle_returns_final_state_and_params():
     out = regen_cycle(k=1.0, P=1.0, U=5.0, metrics=m)
     assert "final" in out and "k" in out["final"]
     assert out["final"]["state"] in (-1, 0, 1)
+
+
+def _fleet(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Metrics(error_rate=e, latency_p95_ms=l, utilization=u, drift=d, theta=t)
+        for e, l, u, d, t in zip(rng.uniform(0, 0.1, n), rng.uniform(0, 3000, n),
+                                 rng.uniform(0, 1, n), rng.uniform(0, 0.6, n), rng.uniform(0, 1, n))
+    ]
+
+
+def test_metrics_has_slots():
+    m = Metrics(error_rate=0.0, latency_p95_ms=0.0, utilization=0.0, drift=0.0, theta=0.5)
+    assert not hasattr(m, "__dict__")
+
+
+def test_detect_batch_matches_scalar():
+    fleet = _fleet()
+    batch = MetricsBatch.from_metrics(fleet)
+    det = detect_anomalies_batch(batch)
+    assert len(batch) == len(fleet) and batch[3] == fleet[3]
+    assert det["reasons"].dtype == np.uint8 and det["severity"].dtype == np.int8
+    for i, m in enumerate(fleet):
+        ref = detect_anomalies(m)
+        assert list(decode_reasons(det["reasons"][i])) == ref["reasons"]
+        assert det["severity"][i] == ref["severity"]
+        assert det["anomalies"][i] == ref["anomalies"]
+
+
+def test_quarantine_batch_matches_scalar():
+    plan = quarantine_plan_batch(np.array([0, 1, 2], dtype=np.int8))
+    for sev in range(3):
+        ref = quarantine_plan(sev)
+        assert plan["active"][sev] == ref["active"]
+        assert list(decode_actions(plan["actions"][sev])) == ref["actions"]
+
+
+def test_metrics_batch_broadcasts_scalars():
+    batch = MetricsBatch(error_rate=[0.1, 0.0], latency_p95_ms=0.0, utilization=0.0, drift=0.0, theta=0.2)
+    det = detect_anomalies_batch(batch)
+    assert det["reasons"].tolist() == [REASON_ERROR | REASON_THETA, REASON_THETA]
+    assert det["severity"].tolist() == [2, 1]
+    assert len(MetricsBatch.from_metrics([])) == 0
@@ -0,0 +1,87 @@
+# tests/test_regen_stream.py
+import asyncio
+import math
+import random
+from unittest import mock
+
+import pytest
+
+from mobius_motor import regen_stream as rs
+from mobius_motor.regen import Metrics
+from mobius_motor.regen_stream import RegenStream, regen_stream
+
+OK = Metrics(error_rate=0.0, latency_p95_ms=500.0, utilization=0.5, drift=0.0, theta=0.5)
+BAD = Metrics(error_rate=0.5, latency_p95_ms=3000.0, utilization=0.99, drift=0.6, theta=0.5)
+
+
+def test_healthy_stream_emits_nothing_and_skips_regen():
+    with mock.patch.object(rs, "regen_cycle") as regen:
+        out = list(regen_stream((("svc", OK) for _ in range(1000)), window=10))
+    assert out == []
+    regen.assert_not_called()
+
+
+def test_transition_emits_once_with_hysteresis():
+    stream = RegenStream(window=1, enter=3, exit=4)
+    samples = [OK] * 5 + [BAD] * 10 + [OK] * 10
+    decisions = list(stream.process(("svc", m) for m in samples))
+    assert [d["state"] for d in decisions] == [(2, 0), (0, 0)]
+    assert decisions[0]["previous"] == (0, 0)
+    assert decisions[0]["sample"] == 5 + 3       # intrare după 3 eșantioane
+    assert decisions[1]["sample"] == 15 + 4      # ieșire după 4 eșantioane
+    assert decisions[0]["final"]["state"] in (-1, 0, 1)
+
+
+def test_flapping_below_threshold_is_suppressed():
+    stream = RegenStream(window=1, enter=3, exit=3)
+    samples = [OK, BAD, BAD, OK, BAD, BAD, OK] * 20
+    assert list(stream.process(("svc", m) for m in samples)) == []
+    assert stream.state("svc") == (0, 0)
+
+
+def test_window_mean_is_sliding():
+    stream = RegenStream(window=4, enter=1, exit=1)
+    for m in [BAD, OK, OK, OK, OK]:
+        stream.update("svc", m)
+    win = stream._services["svc"]
+    assert len(win.samples) == 4
+    assert win.sums[0] == pytest.approx(0.0)
+
+
+def test_window_sums_do_not_drift():
+    # valori mari care ies din fereastră lasă erori de rotunjire în sumele
+    # curente; resincronizarea periodică (math.fsum) le anulează
+    rng = random.Random(0)
+    win = rs._ServiceWindow(8, (1.0, 1.0, 5.0))
+    for _ in range(8):
+        win.push(Metrics(0.1, 1e12 * rng.random(), 0.5, 0.1, 0.5))
+    for i in range(200):
+        mean = win.push(Metrics(rng.random(), rng.random(), 0.5, 0.1, 0.5))
+        if i >= 8:
+            exact = math.fsum(s[1] for s in win.samples) / len(win.samples)
+            assert mean.latency_p95_ms == pytest.approx(exact, rel=1e-12)
+
+
+def test_services_are_independent_and_params_carry_over():
+    stream = RegenStream(window=1, enter=1, exit=1, params={"a": (2.0, 0.8, 10.0)})
+    d = stream.update("a", BAD)
+    assert d["service"] == "a"
+    assert stream.update("b", OK) is None
+    assert stream._services["a"].params == (d["final"]["k"], d["final"]["P"], d["final"]["U"])
+
+
+def test_async_iterator():
+    async def source():
+        for m in [BAD] * 3 + [OK] * 3:
+            yield "svc", m
+
+    async def collect():
+        return [d async for d in RegenStream(window=1, enter=2, exit=2).aprocess(source())]
+
+    decisions = asyncio.run(collect())
+    assert [d["state"] for d in decisions] == [(2, 0), (0, 0)]
+
+
+def test_rejects_bad_window():
+    with pytest.raises(ValueError):
+        RegenStream(window=0)
@@ -0,0 +1,41 @@
+# tests/test_response_cache.py
+import pytest
+
+from aios.cache import ResponseCache, make_etag
+
+
+def test_lru_eviction_and_stats():
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a").body == b"1"      # "a" devine cel mai recent
+    cache.put("c", b"3")                    # evacuează "b"
+    assert cache.get("b") is None
+    assert cache.get("c").body == b"3"
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["hits"] == 2 and stats["misses"] == 1
+    assert len(cache) == 2
+
+
+def test_ttl_expiration():
+    now = [0.0]
+    cache = ResponseCache(maxsize=4, ttl=10.0, clock=lambda: now[0])
+    cache.put("a", b"1")
+    now[0] = 10.0
+    assert cache.get("a") is not None
+    now[0] = 10.5
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1 and len(cache) == 0
+
+
+def test_etag_is_content_derived():
+    tag = make_etag(b'{"x":1}')
+    assert tag == make_etag(b'{"x":1}') != make_etag(b'{"x":2}')
+    assert tag.startswith('"') and tag.endswith('"')
+
+
+def test_rejects_bad_config():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
+    with pytest.raises(ValueError):
+        ResponseCache(ttl=0)
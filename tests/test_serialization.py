@@ -0,0 +1,82 @@
+# tests/test_serialization.py
+import io
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from aios.api import app
+from aios.serialization import FastJSONResponse, dumps, read_float64_columns
+from mobius_motor import jsonio
+from mobius_motor.entropy import entropy_step
+from mobius_motor.records import RecordWriter
+
+
+def test_octet_stream_is_zero_copy():
+    data = np.arange(8, dtype="<f8").reshape(2, 4)
+    body = data.tobytes()
+    k, P, U, theta = read_float64_columns(body, "application/octet-stream")
+    assert k.tolist() == [0.0, 4.0] and theta.tolist() == [3.0, 7.0]
+    assert np.shares_memory(k, np.frombuffer(body, dtype="<f8"))
+
+
+def test_npy_float64_is_zero_copy_and_fortran_order_is_respected():
+    data = np.asfortranarray(np.arange(12, dtype="<f8").reshape(3, 4))
+    buf = io.BytesIO()
+    np.save(buf, data)
+    body = buf.getvalue()
+    k, P, U, theta = read_float64_columns(body, "application/x-npy")
+    np.testing.assert_array_equal(np.column_stack((k, P, U, theta)), data)
+    assert np.shares_memory(k, np.frombuffer(body, dtype=np.uint8))
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_dumps_matches_standard_json(monkeypatch, fast):
+    if not fast:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    content = {"a": [1, 2.5, None], "b": (0.1, -3), "s": "Λ-Wrap"}
+    assert json.loads(dumps(content)) == json.loads(json.dumps(content))
+    assert json.loads(FastJSONResponse(content).body) == json.loads(json.dumps(content))
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_non_finite_floats_become_null(monkeypatch, fast):
+    if not fast:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    content = {"value": float("inf"), "nested": [float("nan"), -float("inf"), 1.5], "state": 1}
+    expected = {"value": None, "nested": [None, None, 1.5], "state": 1}
+    assert json.loads(dumps(content)) == expected
+    assert json.loads(FastJSONResponse(content).body) == expected
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_invalid_wrap_is_null_over_http(monkeypatch, fast):
+    if not fast:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    client = TestClient(app)
+    # k·P = 0.5 <= 1 cu theta = 0.9 → Wrap invalid, Λ = inf
+    r = client.post("/step", json={"k": 0.5, "P": 1.0, "U": 5.0, "theta": 0.9})
+    assert r.status_code == 200 and r.json()["value"] is None
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_int_keys_become_strings(monkeypatch, fast):
+    # entropy_step: state_counts are chei int ({0: 20}) → "0" pe ambele căi
+    if not fast:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    res = entropy_step(1.0, 1.0, 5.0, 0.5, trials=20, seed=0)
+    assert json.loads(dumps(res))["state_counts"] == {"0": 20}
+    assert dumps({-1: 1.5, 1: float("inf")}) == b'{"-1":1.5,"1":null}'
+
+    out = io.StringIO()
+    RecordWriter(out, "ndjson", ()).write({"index": 0, "state_counts": {1: 3}})
+    assert json.loads(out.getvalue()) == {"index": 0, "state_counts": {"1": 3}}
@@ -11,3 +11,11 @@ def test_steady_converges():
     res = steady_step(k=1.0, P=1.0, U=5.0, theta=2.0, iters=200)
     # verificăm că valoarea finală nu explodează
     assert abs(res["final_value"]) < 100.0
+
+def test_steady_closed_form_matches_loop():
+    k, P, U, theta, iters = 1.5, 0.7, 20.0, 2.0, 1000
+    value = theta
+    for _ in range(iters):
+        value += 0.01 * (P - k) - 0.001 * (value - U)
+    res = steady_step(k=k, P=P, U=U, theta=theta, iters=iters)
+    assert res["final_value"] == pytest.approx(value, rel=1e-9)
@@ -0,0 +1,92 @@
+# tests/test_sweep.py
+import json
+
+import numpy as np
+import pytest
+
+from mobius_motor import cli
+from mobius_motor.core import motor_step
+from mobius_motor.sweep import DONE, Axis, SweepSpec, load_sweep, parse_axis, run_sweep
+
+
+def _spec(chunk_size=37):
+    return SweepSpec(
+        parse_axis("0.2:3:7"), parse_axis("0.1:2:5"), parse_axis("1:50:4"), parse_axis("0:1:6"),
+        chunk_size=chunk_size,
+    )
+
+
+def test_parse_axis():
+    assert parse_axis("0:1:11") == Axis(0.0, 1.0, 11)
+    assert parse_axis("0.5") == Axis(0.5, 0.5, 1)
+    assert parse_axis("0:1:11").values()[-1] == 1.0
+    for bad in ("0:1", "a:b:3", "0:1:0"):
+        with pytest.raises(ValueError):
+            parse_axis(bad)
+
+
+def test_sweep_matches_motor_step(tmp_path):
+    spec = _spec()
+    summary = run_sweep(str(tmp_path / "grid"), spec)
+    assert summary["points"] == 7 * 5 * 4 * 6
+    assert summary["computed"] == summary["chunks"] == -(-summary["points"] // 37)
+
+    out = load_sweep(str(tmp_path / "grid"))
+    assert out["complete"] and out["values"].shape == spec.shape and out["states"].dtype == np.int8
+    ax = out["axes"]
+    for i, j, l, m in np.ndindex(spec.shape):
+        val, st = motor_step(ax["k"][i], ax["P"][j], ax["U"][l], ax["theta"][m])
+        assert out["states"][i, j, l, m] == st
+        assert out["values"][i, j, l, m] == pytest.approx(val, rel=1e-12)
+
+
+def test_sweep_resumes_only_missing_chunks(tmp_path):
+    out_dir = str(tmp_path / "grid")
+    spec = _spec()
+    run_sweep(out_dir, spec)
+    reference = np.array(load_sweep(out_dir)["values"])
+
+    # simulează o întrerupere: două chunk-uri nemarcate, cu date pierdute
+    done = np.load(f"{out_dir}/{DONE}", mmap_mode="r+")
+    done[[1, 3]] = 0
+    done.flush()
+    values = np.load(f"{out_dir}/values.npy", mmap_mode="r+").reshape(-1)
+    values[37:74] = 0.0
+    values.flush()
+    del done, values
+
+    seen = []
+    summary = run_sweep(out_dir, spec, progress=lambda d, t: seen.append((d, t)))
+    assert summary["computed"] == 2 and summary["skipped"] == spec.chunks - 2
+    assert seen[-1] == (spec.chunks, spec.chunks)
+    np.testing.assert_array_equal(load_sweep(out_dir)["values"], reference)
+
+
+def test_sweep_refuses_a_different_spec(tmp_path):
+    out_dir = str(tmp_path / "grid")
+    run_sweep(out_dir, _spec())
+    with pytest.raises(ValueError, match="chunk_size"):
+        run_sweep(out_dir, _spec(chunk_size=50))
+    assert run_sweep(out_dir, _spec(chunk_size=50), overwrite=True)["computed"] == 17
+
+
+def test_sweep_workers_match_in_process(tmp_path):
+    a, b = str(tmp_path / "a"), str(tmp_path / "b")
+    run_sweep(a, _spec())
+    run_sweep(b, _spec(), workers=2)
+    np.testing.assert_array_equal(load_sweep(a)["values"], load_sweep(b)["values"])
+    np.testing.assert_array_equal(load_sweep(a)["states"], load_sweep(b)["states"])
+
+
+def test_cli_sweep(tmp_path, capsys):
+    out_dir = tmp_path / "grid"
+    argv = ["sweep", "--k", "0.2:3:7", "--P", "1.0", "--U", "1:50:4", "--theta", "0:1:6",
+            "--out", str(out_dir), "--chunk-size", "10"]
+    cli.main(argv)
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["shape"] == [7, 1, 4, 6] and summary["computed"] == 17
+    cli.main(argv)
+    assert json.loads(capsys.readouterr().out)["skipped"] == 17
+    with pytest.raises(SystemExit) as exc:
+        cli.main(argv[:-2] + ["--chunk-size", "11"])
+    assert exc.value.code == 1
@@ -0,0 +1,77 @@
+# tests/test_time_formulas.py
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from mobius_motor.time_formulas import (
+    time_wrap, time_steady, time_unwrap,
+    time_wrap_array, time_steady_array, time_unwrap_array,
+)
+
+
+# Implementarea de referință (bucla originală, cu np.log pe scalari)
+def _ref_safe_log(U):
+    return np.log(U if U > 1 else 1 + 1e-9)
+
+def _ref_wrap(T1, k, P, U):
+    kp = k * P
+    if kp <= 1:
+        return np.inf
+    return (T1 * _ref_safe_log(U)) / (1 - (1 / kp))
+
+def _ref_unwrap(T1, k, P, U, max_iter=100):
+    kp = k * P
+    log_U = _ref_safe_log(U)
+    if abs(kp) >= 1:
+        total = 0
+        for i in range(max_iter):
+            total += T1 * (kp ** i) * log_U
+        return total
+    return (T1 * log_U) / (1 - kp)
+
+
+KS = [-2.5, -1.0, -0.5, 0.0, 0.1, 0.5, 0.999, 1.0, 1.0 + 1e-9, 1.25, 2.0, 3.0]
+PS = [-1.0, 0.5, 1.0, 2.0]
+US = [0.0, 0.5, 1.0, 1.5, 10.0, 100.0]
+GRID = list(itertools.product([0.5, 1.0], KS, PS, US))
+
+
+def _close(a, b):
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return a == pytest.approx(b, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("T1,k,P,U", GRID)
+def test_scalar_kernels_match_reference(T1, k, P, U):
+    assert _close(time_wrap(T1, k, P, U), _ref_wrap(T1, k, P, U))
+    assert _close(time_steady(T1, U), _ref_safe_log(U) * T1)
+    assert _close(time_unwrap(T1, k, P, U), _ref_unwrap(T1, k, P, U))
+
+
+def test_array_kernels_match_scalar():
+    T1 = 1.0
+    k, P, U = (np.array(c, dtype=float) for c in zip(*[g[1:] for g in GRID]))
+    wrap = time_wrap_array(T1, k, P, U)
+    steady = time_steady_array(T1, U)
+    unwrap = time_unwrap_array(T1, k, P, U)
+    for i in range(len(k)):
+        args = (T1, float(k[i]), float(P[i]), float(U[i]))
+        assert _close(wrap[i], time_wrap(*args))
+        assert _close(steady[i], time_steady(T1, args[3]))
+        assert _close(unwrap[i], time_unwrap(*args))
+
+
+def test_unwrap_kp_equal_one():
+    # k*P = 1: suma parțială are exact max_iter termeni egali
+    assert time_unwrap(1.0, 1.0, 1.0, 10.0) == pytest.approx(100 * math.log(10.0), rel=1e-12)
+    assert time_unwrap_array(1.0, np.array([1.0]), 1.0, 10.0)[0] == pytest.approx(100 * math.log(10.0), rel=1e-12)
+
+
+def test_public_formulas_dispatch_on_arrays():
+    out = time_wrap(1.0, np.array([2.0, 0.5]), 0.8, 10.0)
+    assert isinstance(out, np.ndarray)
+    assert out[0] == pytest.approx(time_wrap(1.0, 2.0, 0.8, 10.0)) and np.isinf(out[1])
+    assert isinstance(time_steady(1.0, 10.0), float)
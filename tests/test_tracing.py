@@ -0,0 +1,83 @@
+# tests/test_tracing.py
+import asyncio
+
+import pytest
+
+from mobius_motor import tracing
+from mobius_motor.engine import Metrics, run_engine, run_engine_async
+from mobius_motor.optimize import lambda_optimize
+from mobius_motor.regen import regen_cycle
+
+M = Metrics(error_rate=0.2, latency_p95_ms=2000.0, utilization=0.95, drift=0.4, theta=0.25)
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def on_span_start(self, path, attrs):
+        self.events.append(("start", path))
+
+    def on_span_end(self, path, attrs, wall, cpu):
+        assert wall >= 0 and cpu >= 0
+        self.events.append(("end", path))
+
+
+def test_hooks_see_nested_spans_in_order():
+    rec = Recorder()
+    with tracing.hooks(rec):
+        regen_cycle(1.0, 1.0, 5.0, M)
+    assert rec.events == [
+        ("start", "regen"), ("start", "regen/optimize"), ("end", "regen/optimize"), ("end", "regen"),
+    ]
+
+
+def test_disabled_tracing_is_a_plain_call():
+    assert not tracing.enabled()
+    assert tracing.span("x") is tracing.span("y")   # același no-op partajat
+    res = lambda_optimize((1.0, 1.0, 5.0), 0.5, mode="value", target=3.0)
+    assert "timings" not in res
+
+
+@pytest.mark.parametrize("executor", [None, "thread"])
+def test_run_engine_timings(executor):
+    res = run_engine(1.0, 1.0, 5.0, 0.25, metrics=M, iters=30, trace=True, executor=executor)
+    timings = res["timings"]
+    assert set(timings) == {
+        "run_engine", "run_engine/base", "run_engine/regen", "run_engine/regen/optimize",
+        "run_engine/balance", "run_engine/optimize", "run_engine/entropy",
+    }
+    assert all(t["calls"] == 1 and t["wall"] >= 0 and t["cpu"] >= 0 for t in timings.values())
+    assert timings["run_engine/optimize"]["iters"] == res["optimize"]["iters"]
+    untraced = run_engine(1.0, 1.0, 5.0, 0.25, metrics=M, iters=30)
+    assert "timings" not in untraced
+    assert res["optimize"] == untraced["optimize"]
+
+
+def test_run_engine_async_timings():
+    res = asyncio.run(run_engine_async(1.0, 1.0, 5.0, 0.5, iters=30, trace=True, executor="thread"))
+    assert {"run_engine", "run_engine/balance", "run_engine/entropy"} <= set(res["timings"])
+
+
+def test_tracing_rejects_process_pool():
+    with pytest.raises(ValueError):
+        run_engine(1.0, 1.0, 5.0, 0.5, trace=True, executor="process")
+
+
+@pytest.mark.parametrize("kind", tracing.PROFILERS)
+def test_profiled_run(kind):
+    res = run_engine(1.0, 1.0, 5.0, 0.5, iters=30, profile=kind)
+    report = res["profile"]
+    assert report["kind"] == kind
+    if kind == "cprofile":
+        assert "run_engine" in report["stats"]
+    else:
+        assert report["peak_bytes"] >= report["current_bytes"] >= 0
+        assert isinstance(report["top"], list)
+    with pytest.raises(ValueError):
+        run_engine(1.0, 1.0, 5.0, 0.5, profile="perf")
+
+
+def test_regen_cycle_trace_flag():
+    out = regen_cycle(1.0, 1.0, 5.0, M, trace=True)
+    assert set(out["timings"]) == {"regen", "regen/optimize"}
@@ -11,3 +11,15 @@ def test_unwrap_growth():
     res = unwrap_step(k=1.0, P=1.0, U=5.0, theta=1.0, iters=200)
     # expansiunea trebuie să ducă la valori mai mari decât theta inițial
     assert res["final_value"] > 1.0
+
+def test_unwrap_closed_form_matches_loop():
+    k, P, U, theta, iters = 1.0, 1.0, 5.0, 1.0, 500
+    value = theta
+    hist = []
+    for _ in range(iters):
+        value = value * (1 + 0.01 * P) + 0.001 * U - 0.0005 * k
+        hist.append(value)
+    res = unwrap_step(k=k, P=P, U=U, theta=theta, iters=iters, history="numpy")
+    assert res["final_value"] == pytest.approx(value, rel=1e-9)
+    assert res["history"].shape == (iters,)
+    assert list(res["history"]) == pytest.approx(hist, rel=1e-9)
@@ -11,3 +11,35 @@ def test_wrap_decay():
     res = wrap_step(k=1.0, P=1.0, U=5.0, theta=10.0, iters=200)
     # compresia trebuie să ducă la valori mai mici decât theta inițial
     assert res["final_value"] < 10.0
+
+def _wrap_loop(k, P, U, theta, iters):
+    value = theta
+    for _ in range(iters):
+        value = value * (1 - 0.01 * P) - 0.001 * U + 0.0005 * k
+        if value < 0:
+            value = 0.0
+    return value
+
+@pytest.mark.parametrize("k,P,U,theta,iters", [
+    (1.0, 1.0, 5.0, 10.0, 200),
+    (2.0, 0.8, 10.0, 0.9, 100),     # trece sub 0 și rămâne blocată
+    (1.0, 1.0, 0.1, -3.0, 300),     # start negativ, apoi crește din 0
+    (1.0, 0.0, 5.0, 1.0, 1000),     # a = 1
+    (1.0, 1.0, 5.0, -3.0, 50),      # start negativ, blocată la 0
+])
+def test_wrap_closed_form_matches_loop(k, P, U, theta, iters):
+    res = wrap_step(k=k, P=P, U=U, theta=theta, iters=iters)
+    assert res["final_value"] == pytest.approx(_wrap_loop(k, P, U, theta, iters), rel=1e-9, abs=1e-12)
+
+def test_wrap_history_opt_in():
+    assert "history" not in wrap_step(k=1.0, P=1.0, U=5.0, theta=10.0, iters=50)
+
+    lazy = wrap_step(k=2.0, P=0.8, U=10.0, theta=0.9, iters=50, history="lazy")["history"]
+    ref = list(lazy)
+    assert len(ref) == 50 and min(ref) >= 0.0
+    for kind in ("list", "array", "numpy"):
+        hist = wrap_step(k=2.0, P=0.8, U=10.0, theta=0.9, iters=50, history=kind)["history"]
+        assert list(hist) == pytest.approx(ref, rel=1e-9, abs=1e-12)
+
+    with pytest.raises(ValueError):
+        wrap_step(k=1.0, P=1.0, U=5.0, theta=10.0, iters=5, history="bogus")